@@ -0,0 +1,144 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+
+
+# business time covered per table (re)build; the table grows when a due date falls past its end
+_HORIZON_DAYS = 366
+
+_SLA_UNIT_MINUTES: dict[str, int] = {
+    "minute": 1,
+    "minutes": 1,
+    "hour": 60,
+    "hours": 60,
+}
+_SLA_UNIT_DAYS: dict[str, int] = {
+    "day": 1,
+    "days": 1,
+    "week": 0,   # one business week (number of workdays)
+    "weeks": 0,
+}
+
+class BusinessCalendar:
+    """Working hours, workdays and holidays of one timezone, with O(log n) due-date lookups.
+
+        The calendar keeps a table of working intervals (as UTC timestamps) and
+        the cumulative business seconds before each of them. Adding business
+        time to an instant is two binary searches: one to find the business
+        seconds already elapsed at the instant, one to find the interval in
+        which the target total is reached. DST transitions are handled when the
+        table is built, because every interval is derived from local wall time.
+
+        ``start_minute``/``end_minute`` are minutes after local midnight
+        (``end_minute`` may be 1440). Workdays use ``date.weekday()`` numbers
+        (0 = Monday). An SLA of N days means N business days of
+        ``end_minute - start_minute`` minutes each; weeks count whole
+        business weeks.
+        """
+
+    def __init__(
+            self,
+            tz: tzinfo = timezone.utc,
+            workdays: Iterable[int] = range(7),
+            start_minute: int = 0,
+            end_minute: int = 24 * 60,
+            holidays: Iterable[date] = (),
+    ) -> None:
+        self.tz = tz
+        self.workdays = frozenset(workdays)
+        self.start_minute = start_minute
+        self.end_minute = end_minute
+        self.holidays = frozenset(holidays)
+        if not self.workdays or not self.workdays <= set(range(7)):
+            raise ValueError("workdays must be a non-empty set of weekday numbers 0..6")
+        if not 0 <= start_minute < end_minute <= 24 * 60:
+            raise ValueError("working hours must satisfy 0 <= start < end <= 24:00")
+
+        self._first_day: date | None = None
+        self._last_day: date | None = None
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        self._cum_before: list[float] = []   # business seconds before interval i
+        self._cum_after: list[float] = []    # business seconds up to the end of interval i
+
+    @property
+    def business_day_seconds(self) -> int:
+        return (self.end_minute - self.start_minute) * 60
+
+    def sla_seconds(self, unit: str | None, value: int | None) -> int | None:
+        """Business seconds of an SLA as stored on a request (None for unknown units)."""
+
+        if not unit or value is None or value < 0:
+            return None
+        key = unit.strip().lower()
+        if key in _SLA_UNIT_MINUTES:
+            return value * _SLA_UNIT_MINUTES[key] * 60
+        if key in _SLA_UNIT_DAYS:
+            days = _SLA_UNIT_DAYS[key] or len(self.workdays)
+            return value * days * self.business_day_seconds
+        return None
+
+    def add(self, start: datetime, business_seconds: float) -> datetime:
+        """Instant (in the calendar timezone) at which ``business_seconds`` of working time have passed since ``start``."""
+
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        ts = start.timestamp()
+        self._ensure_covers(start.astimezone(self.tz).date())
+
+        if business_seconds <= 0:
+            return start.astimezone(self.tz)
+
+        target = self._elapsed(ts) + business_seconds
+        while not self._cum_after or target > self._cum_after[-1]:
+            assert self._first_day is not None and self._last_day is not None
+            self._build(self._first_day, self._last_day + timedelta(days=_HORIZON_DAYS))
+
+        # bisect_left: a target equal to an interval's end is due at that end, not at the next opening
+        i = bisect_left(self._cum_after, target)
+        return datetime.fromtimestamp(self._starts[i] + (target - self._cum_before[i]), self.tz)
+
+    def _elapsed(self, ts: float) -> float:
+        i = bisect_right(self._starts, ts) - 1
+        if i < 0:
+            return 0.0
+        return self._cum_before[i] + min(ts - self._starts[i], self._ends[i] - self._starts[i])
+
+    def _ensure_covers(self, day: date) -> None:
+        if self._first_day is not None and self._last_day is not None and self._first_day <= day <= self._last_day:
+            return
+        first = day if self._first_day is None else min(day - timedelta(days=_HORIZON_DAYS), self._first_day)
+        last = day + timedelta(days=_HORIZON_DAYS)
+        if self._last_day is not None:
+            last = max(last, self._last_day)
+        self._build(first, last)
+
+    def _build(self, first: date, last: date) -> None:
+        starts: list[float] = []
+        ends: list[float] = []
+        cum_before: list[float] = []
+        cum_after: list[float] = []
+        total = 0.0
+        day = first
+        while day <= last:
+            if day.weekday() in self.workdays and day not in self.holidays:
+                midnight = datetime.combine(day, time(), tzinfo=self.tz)
+                opens = (midnight + timedelta(minutes=self.start_minute)).timestamp()
+                closes = (midnight + timedelta(minutes=self.end_minute)).timestamp()
+                if starts and opens <= ends[-1]:
+                    # back-to-back days (24h calendars) merge into one interval
+                    total += closes - ends[-1]
+                    ends[-1] = closes
+                    cum_after[-1] = total
+                else:
+                    starts.append(opens)
+                    ends.append(closes)
+                    cum_before.append(total)
+                    total += closes - opens
+                    cum_after.append(total)
+            day += timedelta(days=1)
+
+        self._first_day, self._last_day = first, last
+        self._starts, self._ends = starts, ends
+        self._cum_before, self._cum_after = cum_before, cum_after
@@ -0,0 +1,60 @@
+from __future__ import annotations
+import logging
+from app.application.catalog_index import CatalogIndex, Pair
+from app.application.ports.catalog_alias_store_port import CatalogAliasStorePort
+
+
+logger = logging.getLogger(__name__)
+
+class CatalogAliases:
+    """Confirmed non-canonical LLM spellings of catalog pairs, scoped to one catalog version.
+
+        Keys are ``normalize_name``-normalized raw (category, type) pairs. Known aliases
+        come from a CatalogAliasStorePort; every use or new confirmation is
+        counted in memory and written back with ``save``.
+        """
+
+    def __init__(self, index: CatalogIndex, known: dict[Pair, Pair] | None = None) -> None:
+        self.fingerprint = index.fingerprint
+        self._aliases: dict[Pair, int] = {}
+        # never alias to an entry the index treats as a collision
+        unambiguous = {pair_id for pair_id in index.normalized.values() if pair_id is not None}
+        for raw, pair in (known or {}).items():
+            pair_id = index.pair_ids.get(pair)
+            if pair_id in unambiguous:
+                self._aliases[raw] = pair_id
+        self._pairs = index.pairs
+        self._hits: dict[Pair, int] = {}
+
+    @classmethod
+    def load(cls, store: CatalogAliasStorePort, index: CatalogIndex) -> CatalogAliases:
+        aliases = cls(index, dict(store.load(index.fingerprint)))
+        if aliases._aliases:
+            logger.info("Loaded %d catalog alias(es) for the current Service Catalog", len(aliases._aliases))
+        return aliases
+
+    def get(self, raw: Pair) -> int | None:
+        """Pair id of a known alias; the use is counted."""
+
+        pair_id = self._aliases.get(raw)
+        if pair_id is not None:
+            self._hits[raw] = self._hits.get(raw, 0) + 1
+        return pair_id
+
+    def confirm(self, raw: Pair, pair_id: int) -> None:
+        """Remember ``raw`` as a spelling of ``pair_id`` (counted as one use)."""
+
+        self._aliases[raw] = pair_id
+        self._hits[raw] = self._hits.get(raw, 0) + 1
+
+    def save(self, store: CatalogAliasStorePort) -> None:
+        if not self._hits:
+            return
+        store.record(
+            self.fingerprint,
+            {raw: (self._pairs[self._aliases[raw]], count) for raw, count in self._hits.items()},
+        )
+        self._hits.clear()
+
+    def __len__(self) -> int:
+        return len(self._aliases)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from app.application.catalog_index import CatalogIndex, Pair, normalize_name
+
+
+# normalized "category / type" similarity at which a removed + added pair counts as a rename
+RENAME_SIMILARITY = 0.8
+
+@dataclass(frozen=True)
+class CatalogDiff:
+    """Structural and SLA differences between two catalog versions.
+
+        ``renamed`` maps an old pair to its new pair; renamed pairs are listed in
+        neither ``added`` nor ``removed``. ``sla_changed`` holds pairs present in
+        both versions whose SLA differs.
+        """
+
+    added: frozenset[Pair] = frozenset()
+    removed: frozenset[Pair] = frozenset()
+    renamed: dict[Pair, Pair] = field(default_factory=dict)
+    sla_changed: frozenset[Pair] = frozenset()
+
+    @property
+    def structural(self) -> bool:
+        return bool(self.added or self.removed or self.renamed)
+
+    @property
+    def empty(self) -> bool:
+        return not self.structural and not self.sla_changed
+
+    def categories_with_new_types(self) -> frozenset[str]:
+        """Categories that gained request types (their existing classifications may now fit better)."""
+
+        return frozenset(category for category, _ in self.added)
+
+def diff_catalogs(old: CatalogIndex, new: CatalogIndex) -> CatalogDiff:
+    """Compare two catalog versions pair by pair.
+
+        A removed pair and an added pair are treated as a rename when their SLA is
+        equal and their normalized names are at least ``RENAME_SIMILARITY``
+        alike (best match first, one-to-one), e.g. a typo fix or a category that
+        was renamed with all of its types.
+        """
+
+    if old.fingerprint == new.fingerprint:
+        return CatalogDiff()
+
+    old_pairs = set(old.pair_ids)
+    new_pairs = set(new.pair_ids)
+    removed = old_pairs - new_pairs
+    added = new_pairs - old_pairs
+
+    candidates: list[tuple[float, Pair, Pair]] = []
+    for old_pair in removed:
+        for new_pair in added:
+            if old.sla[old_pair] != new.sla[new_pair]:
+                continue
+            ratio = SequenceMatcher(None, _pair_text(old_pair), _pair_text(new_pair)).ratio()
+            if ratio >= RENAME_SIMILARITY:
+                candidates.append((ratio, old_pair, new_pair))
+
+    renamed: dict[Pair, Pair] = {}
+    taken: set[Pair] = set()
+    for _, old_pair, new_pair in sorted(candidates, reverse=True):
+        if old_pair in renamed or new_pair in taken:
+            continue
+        renamed[old_pair] = new_pair
+        taken.add(new_pair)
+
+    return CatalogDiff(
+        added=frozenset(added - taken),
+        removed=frozenset(removed - renamed.keys()),
+        renamed=renamed,
+        sla_changed=frozenset(pair for pair in old_pairs & new_pairs if old.sla[pair] != new.sla[pair]),
+    )
+
+def _pair_text(pair: Pair) -> str:
+    return f"{normalize_name(pair[0])} / {normalize_name(pair[1])}"
@@ -0,0 +1,95 @@
+from __future__ import annotations
+import hashlib
+import json
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from app.domain.service_catalog import ServiceCatalog
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# normalize strings for case-insensitive matching
+def normalize_name(value: str) -> str:
+    value = value.strip()
+    value = _WHITESPACE_RE.sub(" ", value)
+    return value.casefold()
+
+Pair = tuple[str, str]
+
+@dataclass(frozen=True, eq=False)
+class CatalogIndex:
+    """Immutable lookups derived once from a ServiceCatalog and shared by its consumers.
+
+        Every (category, request type) pair gets an integer id (its position in
+        ``pairs``). ``normalized`` maps case/whitespace-normalized pairs to that
+        id, or to None when two catalog entries normalize to the same key.
+        ``prompt_fragment`` is the catalog as rendered into LLM prompts, and
+        ``fingerprint`` identifies the catalog content.
+        """
+
+    catalog: ServiceCatalog
+    fingerprint: str
+    pairs: tuple[Pair, ...]
+    pair_ids: Mapping[Pair, int]
+    normalized: Mapping[Pair, int | None]
+    sla: Mapping[Pair, tuple[str, int]]
+    prompt_fragment: str
+
+    @classmethod
+    def build(cls, catalog: ServiceCatalog) -> CatalogIndex:
+        pairs: list[Pair] = []
+        pair_ids: dict[Pair, int] = {}
+        normalized: dict[Pair, int | None] = {}
+        sla: dict[Pair, tuple[str, int]] = {}
+        lines: list[str] = []
+
+        for category in catalog.categories:
+            cat_norm = normalize_name(category.name)
+            for req_type in category.requests:
+                pair = (category.name, req_type.name)
+                if pair not in pair_ids:
+                    pair_ids[pair] = len(pairs)
+                    pairs.append(pair)
+                pair_id = pair_ids[pair]
+                sla[pair] = (req_type.sla.unit, req_type.sla.value)
+
+                # protect against collisions (two entries normalize to same key)
+                key = (cat_norm, normalize_name(req_type.name))
+                if key in normalized and normalized[key] != pair_id:
+                    normalized[key] = None
+                else:
+                    normalized[key] = pair_id
+
+                lines.append(
+                    f"- Category: {category.name} | "
+                    f"Request Type: {req_type.name} | "
+                    f"SLA: {req_type.sla.value} {req_type.sla.unit}"
+                )
+
+        canonical = json.dumps(
+            [[cat, typ, unit, value] for (cat, typ), (unit, value) in sla.items()],
+            ensure_ascii=False,
+        )
+        return cls(
+            catalog=catalog,
+            fingerprint=hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+            pairs=tuple(pairs),
+            pair_ids=MappingProxyType(pair_ids),
+            normalized=MappingProxyType(normalized),
+            sla=MappingProxyType(sla),
+            prompt_fragment="\n".join(lines),
+        )
+
+    @classmethod
+    def of(cls, catalog: ServiceCatalog | CatalogIndex) -> CatalogIndex:
+        """Return ``catalog`` if it already is an index, else build one."""
+
+        return catalog if isinstance(catalog, CatalogIndex) else cls.build(catalog)
+
+    def resolve(self, request_category: str, request_type: str) -> Pair | None:
+        """Canonical pair for a case/whitespace-insensitive match (None if unknown or ambiguous)."""
+
+        pair_id = self.normalized.get((normalize_name(request_category), normalize_name(request_type)))
+        return None if pair_id is None else self.pairs[pair_id]
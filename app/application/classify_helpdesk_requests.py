@@ -1,12 +1,18 @@
 from __future__ import annotations
 import logging
-from typing import Protocol, Mapping
+from dataclasses import dataclass
+from typing import Protocol, Mapping, runtime_checkable
 from app.domain.helpdesk import HelpdeskRequest
 from app.domain.service_catalog import ServiceCatalog
-from app.application.llm_classifier import LLMClassificationResult, LLMClassificationError
+from app.application.llm_classifier import LLMClassificationResult, LLMClassificationError, LLMUsage
+from app.application.llm_budget import LLMBudget
+from app.application.schedule_helpdesk_requests import schedule_requests
 from app.application.classify_helpdesk_requests_progress import _batches_progress
 from collections.abc import Sequence
 from app.application.service_catalog_matcher import ServiceCatalogMatcher
+from app.application.catalog_index import CatalogIndex, normalize_name
+from app.application.catalog_aliases import CatalogAliases
+from app.shared.deadline import Deadline
 
 
 logger = logging.getLogger(__name__)
@@ -15,31 +21,125 @@ class RequestClassifier(Protocol):
     def classify_batch(
         self,
         requests: Sequence[HelpdeskRequest],
-        service_catalog: ServiceCatalog,
+        service_catalog: ServiceCatalog | CatalogIndex,
+        timeout_seconds: float | None = None,
     ) -> Mapping[str, LLMClassificationResult]:
+        """``timeout_seconds`` caps this call below the classifier's own timeout (None = no cap)."""
         ...
 
+@runtime_checkable
+class UsageReportingClassifier(Protocol):
+    """Classifier that exposes provider token usage of its latest batch call."""
+
+    @property
+    def last_usage(self) -> LLMUsage | None:
+        ...
+
+@dataclass
+class ClassificationStats:
+    """Counters of the classification stage, filled in-place by classify_requests."""
+
+    batches_total: int = 0
+    batches_sent: int = 0
+    batches_failed: int = 0
+    batches_skipped: int = 0
+    requests_skipped: int = 0
+    skip_reason: str | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
 
 def classify_requests(
         classifier: RequestClassifier,
-        service_catalog: ServiceCatalog,
+        service_catalog: ServiceCatalog | CatalogIndex,
         requests_: Sequence[HelpdeskRequest],
         batch_size: int,
         examples_to_log: int = 3,
+        deadline: Deadline | None = None,
+        deadline_reserve_seconds: float = 0.0,
+        stats: ClassificationStats | None = None,
+        budget: LLMBudget | None = None,
+        aliases: CatalogAliases | None = None,
 ) -> list[HelpdeskRequest]:
+    """Classify requests batch by batch; failed or skipped batches pass through as-is.
+
+        When ``deadline`` is given, no new batch is dispatched once less than
+        ``deadline_reserve_seconds`` of the run budget remains; the remaining
+        requests are returned unclassified so export and send still happen on time.
+
+        Requests are dispatched in schedule_requests order (priority, SLA urgency,
+        age, missing fields), so urgent tickets land in the earliest batches.
+        When a ``budget`` is given, batches are admitted only while the token/spend
+        budget remains. The returned list keeps the input order.
+
+        ``stats`` accumulates across calls, so one object can span several
+        classify_requests calls of the same run.
+
+        ``aliases`` (built for the same catalog) resolves spellings confirmed on
+        earlier runs and collects recovered ones once they were accepted for a
+        request; the caller persists them.
+        """
+
     if not requests_:
         logger.info("[part 3 and 4] No helpdesk requests provided; skipping LLM step")
         return []
 
-    matcher = ServiceCatalogMatcher(service_catalog)
+    if stats is None:
+        stats = ClassificationStats()
+
+    # index the catalog once; every batch and the matcher share it
+    catalog_index = CatalogIndex.of(service_catalog)
+    matcher = ServiceCatalogMatcher(catalog_index, aliases=aliases)
 
     classified_requests: list[HelpdeskRequest] = []
     logged_examples = 0
 
-    for _, _, batch_start, _, batch in _batches_progress(requests_, batch_size):
+    # urgent and high-value requests go into the earliest batches
+    dispatch_indices = schedule_requests(requests_)
+    dispatch_order = [requests_[index] for index in dispatch_indices]
+
+    for _, _, batch_start, _, batch in _batches_progress(dispatch_order, batch_size):
+        stats.batches_total += 1
+
+        # stop dispatching new batches when the run or token budget is running short
+        if stats.skip_reason is None:
+            if deadline is not None and not deadline.has_at_least(deadline_reserve_seconds):
+                stats.skip_reason = "deadline"
+                logger.warning(
+                    "[part 3 and 4] Run deadline is close (%.1fs left, reserve %.1fs); "
+                    "passing remaining requests through unclassified",
+                    deadline.remaining() or 0.0,
+                    deadline_reserve_seconds,
+                )
+            elif budget is not None and not budget.admit(len(batch)):
+                stats.skip_reason = "budget"
+                logger.warning(
+                    "[part 3 and 4] LLM budget exhausted (input_tokens=%d output_tokens=%d cost=%.4f); "
+                    "passing remaining requests through unclassified",
+                    budget.input_tokens,
+                    budget.output_tokens,
+                    budget.cost,
+                )
+
+        if stats.skip_reason is not None:
+            stats.batches_skipped += 1
+            stats.requests_skipped += len(batch)
+            classified_requests.extend(batch)
+            continue
+
+        stats.batches_sent += 1
         try:
-            batch_results = classifier.classify_batch(batch, service_catalog)
+            if deadline is not None and deadline.bounded:
+                # a single slow call must not run past the reserve kept for export and send
+                batch_results = classifier.classify_batch(
+                    batch,
+                    catalog_index,
+                    timeout_seconds=max(0.0, (deadline.remaining() or 0.0) - deadline_reserve_seconds),
+                )
+            else:
+                batch_results = classifier.classify_batch(batch, catalog_index)
         except LLMClassificationError as exc:
+            _record_usage(classifier, budget, stats, len(batch))
             logger.error(
                 "LLM batch classification failed for requests %d..%d: %s",
                 batch_start,
@@ -47,9 +147,12 @@ def classify_requests(
                 exc,
             )
             # if the batch call fails, still include the raw requests in Excel
+            stats.batches_failed += 1
             classified_requests.extend(batch)
             continue
 
+        _record_usage(classifier, budget, stats, len(batch))
+
         # compute end index once
         batch_end_index = batch_start + len(batch) - 1
         logger.info(
@@ -64,19 +167,26 @@ def classify_requests(
         missing_result_count = 0
         rejected_pair_count = 0
 
-        for req in batch:
-            id = req.id or ""
-            result = batch_results.get(id)
+        results = [batch_results.get(req.id or "") for req in batch]
+        candidates = [
+            (req.request_category or result.request_category, req.request_type or result.request_type)
+            for req, result in zip(batch, results)
+            if result is not None
+        ]
+        # resolve to canonical catalog strings using both current + LLM suggestion, whole batch at once
+        resolved_pairs, resolve_stats = matcher.resolve_many(candidates)
+        resolved_iter = iter(zip(candidates, resolved_pairs))
 
+        for req, result in zip(batch, results):
             if result is None:
                 missing_result_count += 1
                 classified_requests.append(req)
                 continue
 
-            # resolve to canonical catalog strings using both current + LLM suggestion
-            candidate_category = req.request_category or result.request_category
-            candidate_type = req.request_type or result.request_type
-            resolved = matcher.resolve(candidate_category, candidate_type)
+            (raw_category, raw_type), resolved = next(resolved_iter)
+            if resolved is not None and _contradicts(req, resolved.request_category, resolved.request_type):
+                # a near-miss match must not override a field the helpdesk already set
+                resolved = None
 
             if resolved is None:
                 # do not write non-catalog values (avoid breaking SLA lookup later)
@@ -91,6 +201,10 @@ def classify_requests(
                     req.request_type = resolved.request_type
                     set_type_count += 1
 
+                if raw_category and raw_type:
+                    # only an accepted near-miss becomes an alias for later runs
+                    matcher.confirm(raw_category, raw_type)
+
             if logged_examples < examples_to_log:
                 logger.info(
                     # log both raw and resolved for check canonicalization
@@ -106,13 +220,44 @@ def classify_requests(
 
         # log summary if SLA was set from service catalog
         logger.info(
-            "[part 3] Applied LLM classification: categories_set=%d types_set=%d missing_results=%d rejected_pairs=%d (batch %d..%d)",
+            "[part 3] Applied LLM classification: categories_set=%d types_set=%d missing_results=%d rejected_pairs=%d "
+            "recovered_pairs=%d colliding_pairs=%d (batch %d..%d)",
             set_category_count,
             set_type_count,
             missing_result_count,
             rejected_pair_count,
+            resolve_stats.recovered,
+            resolve_stats.collisions,
             batch_start,
             batch_end_index,
         )
 
-    return classified_requests
\ No newline at end of file
+    # every batch appends its requests in dispatch order; map them back to input order
+    in_input_order: list[HelpdeskRequest] = list(classified_requests)
+    for dispatch_pos, input_index in enumerate(dispatch_indices):
+        in_input_order[input_index] = classified_requests[dispatch_pos]
+    return in_input_order
+
+def _record_usage(
+        classifier: RequestClassifier,
+        budget: LLMBudget | None,
+        stats: ClassificationStats,
+        requests_count: int,
+) -> None:
+    if not isinstance(classifier, UsageReportingClassifier):
+        return
+    usage = classifier.last_usage
+    if usage is None:
+        return
+
+    stats.input_tokens += usage.input_tokens
+    stats.output_tokens += usage.output_tokens
+    if budget is not None:
+        budget.record(usage, requests_count)
+        stats.cost = budget.cost
+
+def _contradicts(req: HelpdeskRequest, request_category: str, request_type: str) -> bool:
+    return bool(
+        (req.request_category and normalize_name(req.request_category) != normalize_name(request_category))
+        or (req.request_type and normalize_name(req.request_type) != normalize_name(request_type))
+    )
@@ -0,0 +1,11 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class StoredClassification:
+    request_id: str
+    # hash of the request text the classification was made for
+    content_hash: str
+    request_category: str
+    request_type: str
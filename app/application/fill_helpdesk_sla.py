@@ -1,12 +1,18 @@
 from __future__ import annotations
 from app.domain.helpdesk import HelpdeskRequest
 from app.domain.service_catalog import ServiceCatalog
+from app.application.catalog_index import CatalogIndex
+from app.application.business_calendar import BusinessCalendar
 import logging
 
 
 logger = logging.getLogger(__name__)
 
-def fill_helpdesk_sla(requests: list[HelpdeskRequest], catalog: ServiceCatalog) -> None:
+def fill_helpdesk_sla(
+        requests: list[HelpdeskRequest],
+        catalog: ServiceCatalog | CatalogIndex,
+        calendar: BusinessCalendar | None = None,
+) -> None:
     """Fill missing SLA fields in-place using the Service Catalog.
 
         For each request that has both ``request_category`` and ``request_type`` set,
@@ -18,6 +24,10 @@ def fill_helpdesk_sla(requests: list[HelpdeskRequest], catalog: ServiceCatalog)
         - ``sla_value`` is None or 0
 
         Existing non-missing SLA values are not overwritten.
+
+        With a ``calendar``, every request that has ``created_at`` and an SLA
+        (derived or already set) also gets ``sla_due_at``: the SLA counted in
+        business time of that calendar from ``created_at``.
         """
 
     logger.info(
@@ -33,11 +43,8 @@ def fill_helpdesk_sla(requests: list[HelpdeskRequest], catalog: ServiceCatalog)
     sample_logged = 0
     sample_limit = 5
 
-    # Build (category, request_type) -> (unit, value) index from catalog
-    sla_index: dict[tuple[str, str], tuple[str, int]] = {}
-    for cat in catalog.categories:
-        for req_type in cat.requests:
-            sla_index[(cat.name, req_type.name)] = (req_type.sla.unit, req_type.sla.value)
+    # (category, request_type) -> (unit, value), shared with the rest of the run
+    sla_index = CatalogIndex.of(catalog).sla
 
     for req in requests:
         if not req.request_category or not req.request_type:
@@ -105,9 +112,25 @@ def fill_helpdesk_sla(requests: list[HelpdeskRequest], catalog: ServiceCatalog)
         skipped_already_has_sla_count,
     )
 
+    if calendar is not None:
+        _fill_due_dates(requests, calendar)
+
     # show a warning if there were unknown pairs
     if unknown_pair_count > 0:
         logger.warning(
             "[part 4] SLA could not be derived for %d request(s) due to unknown (category, type) pairs",
             unknown_pair_count,
-        )
\ No newline at end of file
+        )
+
+def _fill_due_dates(requests: list[HelpdeskRequest], calendar: BusinessCalendar) -> None:
+    filled = 0
+    for req in requests:
+        if req.sla_due_at is not None or req.created_at is None:
+            continue
+        seconds = calendar.sla_seconds(req.sla_unit, req.sla_value)
+        if seconds is None:
+            continue
+        req.sla_due_at = calendar.add(req.created_at, seconds)
+        filled += 1
+
+    logger.info("[part 4] SLA due dates computed over business hours: %d request(s)", filled)
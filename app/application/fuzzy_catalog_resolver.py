@@ -0,0 +1,145 @@
+from __future__ import annotations
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from app.application.catalog_index import CatalogIndex, Pair, normalize_name
+
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+# trigram overlap (Dice) a catalog entry needs to be considered at all
+MIN_CANDIDATE_SIMILARITY = 0.5
+# combined score a candidate needs to be accepted
+MIN_SCORE = 0.8
+# the winner must beat the runner-up by this much, otherwise the pair is ambiguous
+MIN_MARGIN = 0.05
+# edits allowed per character of each catalog field (at least one edit is always allowed)
+MAX_EDIT_RATIO = 0.2
+
+_TOO_FAR = float("inf")
+
+def _words(value: str) -> list[str]:
+    return _WORD_RE.findall(value.casefold())
+
+def _trigrams(compact: str) -> set[str]:
+    padded = f"^{compact}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def bounded_edit_distance(a: str, b: str, bound: int) -> int:
+    """Levenshtein distance of ``a`` and ``b``, or ``bound + 1`` as soon as it is known to exceed ``bound``."""
+
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return min(previous[-1], bound + 1)
+
+@dataclass(frozen=True)
+class _Entry:
+    category: str       # compact (alphanumerics only, casefolded)
+    request_type: str
+    tokens: frozenset[str]
+    grams: frozenset[str]
+
+@dataclass(frozen=True)
+class FuzzyMatch:
+    pair_id: int
+    score: float
+
+class FuzzyCatalogResolver:
+    """Scored recovery of near-miss (category, type) pairs against a CatalogIndex.
+
+        Each catalog entry is indexed once by its word set and character
+        trigrams. A query is compared only to entries sharing enough trigrams,
+        then verified with a bounded edit distance over the alphanumeric
+        characters (in both field orders, so a category/type swap still
+        matches). A match is returned only when it is clearly better than the
+        runner-up and its pair is not one of the entries the index marks as
+        colliding.
+        """
+
+    def __init__(self, index: CatalogIndex) -> None:
+        self._entries: list[_Entry] = []
+        self._postings: dict[str, list[int]] = {}
+        for pair_id, (category, request_type) in enumerate(index.pairs):
+            cat_words, type_words = _words(category), _words(request_type)
+            cat_compact, type_compact = "".join(cat_words), "".join(type_words)
+            grams = frozenset(_trigrams(cat_compact) | _trigrams(type_compact))
+            self._entries.append(_Entry(cat_compact, type_compact, frozenset(cat_words + type_words), grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(pair_id)
+
+        self._ambiguous = _ambiguous_pair_ids(index.normalized, index.pairs)
+
+    def resolve(self, request_category: str, request_type: str) -> FuzzyMatch | None:
+        cat_words, type_words = _words(request_category), _words(request_type)
+        cat_compact, type_compact = "".join(cat_words), "".join(type_words)
+        if not cat_compact or not type_compact:
+            return None
+        tokens = frozenset(cat_words + type_words)
+        grams = _trigrams(cat_compact) | _trigrams(type_compact)
+
+        overlap: dict[int, int] = {}
+        for gram in grams:
+            for pair_id in self._postings.get(gram, ()):
+                overlap[pair_id] = overlap.get(pair_id, 0) + 1
+
+        scored: list[FuzzyMatch] = []
+        for pair_id, shared in overlap.items():
+            entry = self._entries[pair_id]
+            similarity = 2 * shared / (len(grams) + len(entry.grams))
+            if similarity < MIN_CANDIDATE_SIMILARITY:
+                continue
+            score = _score(entry, cat_compact, type_compact, tokens, similarity)
+            if score >= MIN_SCORE:
+                scored.append(FuzzyMatch(pair_id=pair_id, score=score))
+
+        if not scored:
+            return None
+        scored.sort(key=lambda match: match.score, reverse=True)
+        best = scored[0]
+        if len(scored) > 1 and best.score - scored[1].score < MIN_MARGIN:
+            return None
+        if best.pair_id in self._ambiguous:
+            return None
+        return best
+
+def _score(entry: _Entry, category: str, request_type: str, tokens: frozenset[str], similarity: float) -> float:
+    if tokens == entry.tokens:
+        # same words, only punctuation/spacing/order differ
+        return 1.0
+
+    straight = _field_distance(category, entry.category) + _field_distance(request_type, entry.request_type)
+    swapped = _field_distance(category, entry.request_type) + _field_distance(request_type, entry.category)
+    distance = min(straight, swapped)
+    if distance == _TOO_FAR:
+        return 0.0
+    return (similarity + 1 - distance / (len(entry.category) + len(entry.request_type))) / 2
+
+def _field_distance(value: str, canonical: str) -> float:
+    bound = max(1, int(len(canonical) * MAX_EDIT_RATIO))
+    distance = bounded_edit_distance(value, canonical, bound)
+    return distance if distance <= bound else _TOO_FAR
+
+def _ambiguous_pair_ids(normalized: Mapping[Pair, int | None], pairs: tuple[Pair, ...]) -> frozenset[int]:
+    """Ids of pairs whose normalized key collides with another entry (mapped to None by the index)."""
+
+    collided = {key for key, pair_id in normalized.items() if pair_id is None}
+    return frozenset(
+        pair_id
+        for pair_id, (category, request_type) in enumerate(pairs)
+        if (normalize_name(category), normalize_name(request_type)) in collided
+    )
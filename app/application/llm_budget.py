@@ -0,0 +1,83 @@
+from __future__ import annotations
+import logging
+from app.application.llm_classifier import LLMUsage
+
+
+logger = logging.getLogger(__name__)
+
+class LLMBudget:
+    """Run-level ceiling on LLM tokens and spend.
+
+        Usage is recorded from the provider's usage metadata after every batch.
+        A new batch is admitted only if its estimated usage (observed average per
+        request times batch size) still fits every configured limit; before the
+        first sample, any remaining budget admits one batch.
+        """
+
+    def __init__(
+        self,
+        max_input_tokens: int | None = None,
+        max_output_tokens: int | None = None,
+        max_cost: float | None = None,
+        input_price_per_million: float = 0.0,
+        output_price_per_million: float = 0.0,
+    ) -> None:
+        self._max_input_tokens = max_input_tokens
+        self._max_output_tokens = max_output_tokens
+        self._max_cost = max_cost
+        self._input_price = input_price_per_million / 1_000_000
+        self._output_price = output_price_per_million / 1_000_000
+
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self._sampled_requests = 0
+
+    @property
+    def limited(self) -> bool:
+        return (
+            self._max_input_tokens is not None
+            or self._max_output_tokens is not None
+            or self._max_cost is not None
+        )
+
+    @property
+    def cost(self) -> float:
+        return self._cost_of(self.input_tokens, self.output_tokens)
+
+    def record(self, usage: LLMUsage, requests_count: int) -> None:
+        self.input_tokens += usage.input_tokens
+        self.output_tokens += usage.output_tokens
+        self._sampled_requests += requests_count
+
+    def admit(self, requests_count: int) -> bool:
+        """Return True if a batch of ``requests_count`` requests fits the remaining budget."""
+
+        if not self.limited:
+            return True
+
+        if self._sampled_requests == 0:
+            est_input = est_output = 0
+        else:
+            est_input = self.input_tokens * requests_count // self._sampled_requests
+            est_output = self.output_tokens * requests_count // self._sampled_requests
+
+        next_input = self.input_tokens + est_input
+        next_output = self.output_tokens + est_output
+
+        # strict comparison so an exhausted limit rejects even without samples
+        if self._max_input_tokens is not None and not (
+            next_input <= self._max_input_tokens and self.input_tokens < self._max_input_tokens
+        ):
+            return False
+        if self._max_output_tokens is not None and not (
+            next_output <= self._max_output_tokens and self.output_tokens < self._max_output_tokens
+        ):
+            return False
+        if self._max_cost is not None and not (
+            self._cost_of(next_input, next_output) <= self._max_cost and self.cost < self._max_cost
+        ):
+            return False
+        return True
+
+    def _cost_of(self, input_tokens: int, output_tokens: int) -> float:
+        return input_tokens * self._input_price + output_tokens * self._output_price
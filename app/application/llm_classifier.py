@@ -5,11 +5,18 @@ from app.domain.helpdesk import HelpdeskRequest
 from app.domain.service_catalog import ServiceCatalog
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMClassificationResult:
     request_category: Optional[str]
     request_type: Optional[str]
 
+@dataclass(frozen=True)
+class LLMUsage:
+    """Token usage reported by the provider for one LLM call."""
+
+    input_tokens: int
+    output_tokens: int
+
 class LLMClassificationError(RuntimeError):
     """Raised when LLM classification fails in a non-recoverable way."""
 
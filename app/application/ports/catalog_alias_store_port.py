@@ -0,0 +1,14 @@
+from __future__ import annotations
+from collections.abc import Mapping
+from typing import Protocol
+from app.application.catalog_index import Pair
+
+
+class CatalogAliasStorePort(Protocol):
+    def load(self, catalog_fingerprint: str) -> Mapping[Pair, Pair]:
+        """Normalized raw (category, type) -> canonical pair, for one catalog version."""
+        ...
+
+    def record(self, catalog_fingerprint: str, hits: Mapping[Pair, tuple[Pair, int]]) -> None:
+        """Add ``count`` uses of each raw -> canonical mapping."""
+        ...
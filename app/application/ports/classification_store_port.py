@@ -0,0 +1,28 @@
+from __future__ import annotations
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Protocol
+from app.application.dto.stored_classification import StoredClassification
+from app.domain.service_catalog import ServiceCatalog
+
+
+class ClassificationStorePort(Protocol):
+    def get_many(self, request_ids: Sequence[str]) -> Mapping[str, StoredClassification]:
+        ...
+
+    def save_many(self, records: Sequence[StoredClassification]) -> None:
+        ...
+
+    def rename_pairs(self, renamed: Mapping[tuple[str, str], tuple[str, str]]) -> int:
+        ...
+
+    def invalidate_pairs(self, pairs: Iterable[tuple[str, str]]) -> int:
+        ...
+
+    def invalidate_categories(self, categories: Iterable[str]) -> int:
+        ...
+
+    def load_catalog(self) -> ServiceCatalog | None:
+        ...
+
+    def save_catalog(self, catalog: ServiceCatalog) -> None:
+        ...
@@ -5,6 +5,6 @@ from app.domain.helpdesk import HelpdeskRequest
 
 
 class ReportExporterPort(Protocol):
-    def export(self, requests: Sequence[HelpdeskRequest]) -> Path:
+    def export(self, requests: Sequence[HelpdeskRequest], filename_prefix: str = "") -> Path:
         """Persist a report and return its path."""
         ...
\ No newline at end of file
@@ -0,0 +1,73 @@
+from __future__ import annotations
+import math
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from app.domain.helpdesk import HelpdeskRequest
+
+
+# requests without a priority signal are scheduled as "normal"
+DEFAULT_PRIORITY = 3
+
+_SLA_UNIT_HOURS: dict[str, float] = {
+    "minute": 1 / 60,
+    "minutes": 1 / 60,
+    "hour": 1.0,
+    "hours": 1.0,
+    "day": 24.0,
+    "days": 24.0,
+    "week": 168.0,
+    "weeks": 168.0,
+}
+
+def schedule_requests(
+        requests_: Sequence[HelpdeskRequest],
+        now: datetime | None = None,
+) -> list[int]:
+    """Return request indices in LLM dispatch order (stable).
+
+        Order: priority (1 first), then time left until the ticket's own SLA
+        runs out, then age (oldest first), then requests missing the most
+        classification fields.
+        """
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    def key(index: int) -> tuple[int, float, float, int]:
+        req = requests_[index]
+        age_hours = _age_hours(req, now)
+        sla_hours = _sla_hours(req)
+
+        due_in = math.inf
+        if sla_hours is not None:
+            due_in = sla_hours - (age_hours or 0.0)
+
+        return (
+            req.priority if req.priority is not None else DEFAULT_PRIORITY,
+            due_in,
+            -(age_hours or 0.0),
+            int(bool(req.request_category)) + int(bool(req.request_type)),
+        )
+
+    return sorted(range(len(requests_)), key=key)
+
+def is_urgent(request: HelpdeskRequest, max_priority: int) -> bool:
+    """True when the request has an explicit priority at or above ``max_priority`` (1 = highest)."""
+
+    return request.priority is not None and request.priority <= max_priority
+
+def _age_hours(request: HelpdeskRequest, now: datetime) -> float | None:
+    if request.created_at is None:
+        return None
+    created_at = request.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return (now - created_at).total_seconds() / 3600
+
+def _sla_hours(request: HelpdeskRequest) -> float | None:
+    if not request.sla_unit or not request.sla_value:
+        return None
+    factor = _SLA_UNIT_HOURS.get(request.sla_unit.strip().lower())
+    if factor is None:
+        return None
+    return request.sla_value * factor
@@ -1,51 +1,161 @@
 from __future__ import annotations
+import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
-import re
 from app.domain.service_catalog import ServiceCatalog
+from app.application.catalog_aliases import CatalogAliases
+from app.application.catalog_index import CatalogIndex, Pair, normalize_name
+from app.application.fuzzy_catalog_resolver import FuzzyCatalogResolver
 
 
-# normalize strings for case-insensitive matching
-def _norm(value: str) -> str:
-    value = value.strip()
-    value = re.sub(r"\s+", " ", value)
-    return value.casefold()
+logger = logging.getLogger(__name__)
+
+# distinct raw strings kept normalized; the cache is dropped when it grows past this
+_NORM_CACHE_SIZE = 4096
 
 @dataclass(frozen=True)
 class CatalogMatch:
     request_category: str
     request_type: str
 
+@dataclass
+class ResolveStats:
+    """Outcome counts of one resolve_many call."""
+
+    exact: int = 0
+    recovered: int = 0   # alias or fuzzy match
+    collisions: int = 0  # normalized key shared by several catalog entries
+    misses: int = 0      # empty, unknown or not recoverable
+
+    @property
+    def hits(self) -> int:
+        return self.exact + self.recovered
+
 class ServiceCatalogMatcher:
-    """Resolves (category, type) coming from LLM into canonical catalog strings."""
-
-    def __init__(self, catalog: ServiceCatalog) -> None:
-        # NEW: map normalized pairs -> canonical pair
-        pair_map: dict[tuple[str, str], CatalogMatch] = {}
-
-        for category in catalog.categories:
-            cat_norm = _norm(category.name)
-            for req_type in category.requests:
-                type_norm = _norm(req_type.name)
-                key = (cat_norm, type_norm)
-                canonical = CatalogMatch(
-                    request_category=category.name,
-                    request_type=req_type.name,
-                )
+    """Resolves (category, type) coming from LLM into canonical catalog strings.
 
-                # protect against collisions (two entries normalize to same key)
-                if key in pair_map and pair_map[key] != canonical:
-                    pair_map[key] = CatalogMatch(request_category="", request_type="")
-                else:
-                    pair_map[key] = canonical
+        Exact (case/whitespace-insensitive) matches come from the shared index.
+        With ``fuzzy`` enabled, a pair that misses is handed to a
+        FuzzyCatalogResolver, so formatting drift such as "Laptop Repair/Replacement"
+        or swapped category and type still resolves; ``recovered_count`` counts those.
+        With ``aliases``, spellings confirmed on earlier runs resolve in O(1)
+        before any fuzzy search. A fuzzy recovery becomes an alias only once
+        the caller accepted it and calls ``confirm``.
+        """
 
-        self._pair_map = pair_map
+    def __init__(
+            self,
+            catalog: ServiceCatalog | CatalogIndex,
+            fuzzy: bool = True,
+            aliases: CatalogAliases | None = None,
+    ) -> None:
+        # normalized pair lookup (with collision protection) lives in the shared index
+        self._index = CatalogIndex.of(catalog)
+        self._matches = tuple(CatalogMatch(request_category=c, request_type=t) for c, t in self._index.pairs)
+        self._fuzzy_enabled = fuzzy
+        if aliases is not None and aliases.fingerprint != self._index.fingerprint:
+            raise ValueError("Catalog aliases belong to a different Service Catalog version")
+        self._aliases = aliases
+        # built on the first miss; most runs never need it
+        self._fuzzy: FuzzyCatalogResolver | None = None
+        self._fuzzy_results: dict[Pair, int | None] = {}
+        self._norm_cache: dict[str, str] = {}
+        self.recovered_count = 0
 
     def resolve(self, request_category: str | None, request_type: str | None) -> CatalogMatch | None:
         if not request_category or not request_type:
             return None
+        return self._resolve_key((normalize_name(request_category), normalize_name(request_type)))[0]
+
+    def resolve_many(
+            self,
+            candidates: Iterable[tuple[str | None, str | None]],
+    ) -> tuple[list[CatalogMatch | None], ResolveStats]:
+        """Resolve a batch of (category, type) candidates in one pass.
+
+            The LLM returns a handful of distinct strings across thousands of
+            tickets, so each distinct string is normalized once.
+            """
+
+        stats = ResolveStats()
+        matches: list[CatalogMatch | None] = []
+        cache = self._norm_cache
+        for request_category, request_type in candidates:
+            if not request_category or not request_type:
+                stats.misses += 1
+                matches.append(None)
+                continue
+
+            if len(cache) > _NORM_CACHE_SIZE:
+                cache.clear()
+            category_key = cache.get(request_category)
+            if category_key is None:
+                category_key = cache[request_category] = normalize_name(request_category)
+            type_key = cache.get(request_type)
+            if type_key is None:
+                type_key = cache[request_type] = normalize_name(request_type)
+
+            match, outcome = self._resolve_key((category_key, type_key))
+            if outcome == "exact":
+                stats.exact += 1
+            elif outcome == "recovered":
+                stats.recovered += 1
+            elif outcome == "collision":
+                stats.collisions += 1
+            else:
+                stats.misses += 1
+            matches.append(match)
+        return matches, stats
+
+    def _resolve_key(self, key: Pair) -> tuple[CatalogMatch | None, str]:
+        pair_id = self._index.normalized.get(key, -1)
+        if pair_id is None:
+            # a collision stays unresolved; fuzzy matching must not pick a side
+            return None, "collision"
+        if pair_id >= 0:
+            return self._matches[pair_id], "exact"
+
+        if self._aliases is not None:
+            alias_id = self._aliases.get(key)
+            if alias_id is not None:
+                self.recovered_count += 1
+                return self._matches[alias_id], "recovered"
+
+        if not self._fuzzy_enabled:
+            return None, "miss"
+        match = self._resolve_fuzzy(key)
+        return match, "miss" if match is None else "recovered"
+
+    def confirm(self, request_category: str, request_type: str) -> None:
+        """Keep an accepted fuzzy recovery of this raw pair as an alias (no-op for other pairs)."""
+
+        if self._aliases is None:
+            return
+        key = (normalize_name(request_category), normalize_name(request_type))
+        pair_id = self._fuzzy_results.get(key)
+        if pair_id is not None:
+            # later lookups (and later runs) hit the alias table first
+            self._aliases.confirm(key, pair_id)
+
+    def _resolve_fuzzy(self, key: Pair) -> CatalogMatch | None:
+        # the LLM repeats the same spellings; score each distinct one once
+        if key in self._fuzzy_results:
+            pair_id = self._fuzzy_results[key]
+        else:
+            if self._fuzzy is None:
+                self._fuzzy = FuzzyCatalogResolver(self._index)
+            fuzzy = self._fuzzy.resolve(*key)
+            pair_id = None if fuzzy is None else fuzzy.pair_id
+            if fuzzy is not None:
+                logger.info(
+                    "Recovered near-miss catalog pair %r -> %r (score %.2f)",
+                    key,
+                    self._index.pairs[fuzzy.pair_id],
+                    fuzzy.score,
+                )
+            self._fuzzy_results[key] = pair_id
 
-        key = (_norm(request_category), _norm(request_type))
-        match = self._pair_map.get(key)
-        if not match or not match.request_category:
+        if pair_id is None:
             return None
-        return match
\ No newline at end of file
+        self.recovered_count += 1
+        return self._matches[pair_id]
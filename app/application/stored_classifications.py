@@ -0,0 +1,114 @@
+from __future__ import annotations
+import hashlib
+import logging
+from collections.abc import Sequence
+from app.application.catalog_diff import CatalogDiff, diff_catalogs
+from app.application.catalog_index import CatalogIndex
+from app.application.dto.stored_classification import StoredClassification
+from app.application.ports.classification_store_port import ClassificationStorePort
+from app.domain.helpdesk import HelpdeskRequest
+
+
+logger = logging.getLogger(__name__)
+
+def request_content_hash(req: HelpdeskRequest) -> str:
+    """Hash of the text a classification depends on; an edited ticket is classified again."""
+
+    text = "\x1f".join((req.short_description or "", req.long_description or ""))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def reconcile_catalog(store: ClassificationStorePort, index: CatalogIndex) -> CatalogDiff | None:
+    """Bring stored classifications in line with a new catalog version.
+
+        Renamed pairs are rewritten in place. Classifications of removed pairs,
+        and of categories that gained request types, are dropped so those
+        tickets go back to the LLM. SLA-only changes keep every stored
+        classification: SLAs are re-derived by fill_helpdesk_sla on each run.
+        Returns None when there was no previous catalog to compare with.
+        """
+
+    previous = store.load_catalog()
+    if previous is None:
+        store.save_catalog(index.catalog)
+        return None
+
+    diff = diff_catalogs(CatalogIndex.build(previous), index)
+    if diff.empty:
+        return diff
+
+    renamed = store.rename_pairs(diff.renamed) if diff.renamed else 0
+    dropped = store.invalidate_pairs(diff.removed) if diff.removed else 0
+    if diff.added:
+        dropped += store.invalidate_categories(diff.categories_with_new_types())
+    store.save_catalog(index.catalog)
+
+    logger.info(
+        "Service Catalog changed: added=%d removed=%d renamed=%d sla_changed=%d; "
+        "stored classifications renamed=%d invalidated=%d",
+        len(diff.added),
+        len(diff.removed),
+        len(diff.renamed),
+        len(diff.sla_changed),
+        renamed,
+        dropped,
+    )
+    return diff
+
+def apply_stored_classifications(
+    store: ClassificationStorePort,
+    index: CatalogIndex,
+    requests_: Sequence[HelpdeskRequest],
+) -> list[HelpdeskRequest]:
+    """Fill category/type from stored classifications in-place; return the requests still to classify.
+
+        A stored classification is used only when the ticket text is unchanged,
+        the pair still exists in the catalog and it does not contradict a field
+        the helpdesk already set.
+        """
+
+    needing = [req for req in requests_ if req.id and not (req.request_category and req.request_type)]
+    stored = store.get_many([req.id for req in needing if req.id])
+
+    pending: list[HelpdeskRequest] = []
+    hits = 0
+    for req in requests_:
+        record = stored.get(req.id or "")
+        if (
+            record is None
+            or record.content_hash != request_content_hash(req)
+            or (record.request_category, record.request_type) not in index.pair_ids
+            or (req.request_category and req.request_category != record.request_category)
+            or (req.request_type and req.request_type != record.request_type)
+        ):
+            pending.append(req)
+            continue
+        req.request_category = record.request_category
+        req.request_type = record.request_type
+        hits += 1
+
+    if hits:
+        logger.info("Reused %d stored classification(s); %d request(s) left for the LLM", hits, len(pending))
+    return pending
+
+def remember_classifications(
+    store: ClassificationStorePort,
+    index: CatalogIndex,
+    requests_: Sequence[HelpdeskRequest],
+) -> None:
+    """Store every request that ended up with a catalog (category, type) pair."""
+
+    records = [
+        StoredClassification(
+            request_id=req.id,
+            content_hash=request_content_hash(req),
+            request_category=req.request_category,
+            request_type=req.request_type,
+        )
+        for req in requests_
+        if req.id
+        and req.request_category
+        and req.request_type
+        and (req.request_category, req.request_type) in index.pair_ids
+    ]
+    if records:
+        store.save_many(records)
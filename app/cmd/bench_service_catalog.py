@@ -0,0 +1,113 @@
+from __future__ import annotations
+import argparse
+import logging
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+import requests
+import yaml
+from requests.adapters import HTTPAdapter
+from app.application.catalog_index import CatalogIndex
+from app.config import ServiceCatalogConfig
+from app.infrastructure.service_catalog_client import ServiceCatalogClient
+from app.infrastructure.service_catalog_snapshot import ServiceCatalogSnapshots, content_hash
+
+
+logger = logging.getLogger(__name__)
+
+def _make_catalog_yaml(categories: int, types_per_category: int) -> str:
+    return yaml.safe_dump(
+        {
+            "service_catalog": {
+                "catalog": {
+                    "categories": [
+                        {
+                            "name": f"Category {c}",
+                            "requests": [
+                                {"name": f"Request type {c}.{t}", "sla": {"unit": "hours", "value": 1 + t % 48}}
+                                for t in range(types_per_category)
+                            ],
+                        }
+                        for c in range(categories)
+                    ]
+                }
+            }
+        },
+        sort_keys=False,
+    )
+
+class _StaticCatalogAdapter(HTTPAdapter):
+    """Answers every request with the same catalog body (the bench measures parsing/mapping, not the network)."""
+
+    def __init__(self, text: str) -> None:
+        super().__init__()
+        self._body = text.encode("utf-8")
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self._body
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+        return response
+
+class _PurePythonYAMLClient(ServiceCatalogClient):
+    """Baseline row: parses with PyYAML's pure-Python SafeLoader instead of LibYAML."""
+
+    def _parse_yaml(self, text: str) -> Any:
+        return yaml.load(text, Loader=yaml.SafeLoader)
+
+def _client(
+        text: str,
+        snapshots: ServiceCatalogSnapshots | None,
+        client_cls: type[ServiceCatalogClient] = ServiceCatalogClient,
+) -> ServiceCatalogClient:
+    session = requests.Session()
+    session.mount("https://", _StaticCatalogAdapter(text))
+    return client_cls(ServiceCatalogConfig(url="https://bench.invalid/catalog"), session=session, snapshots=snapshots)
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare cold (YAML) and warm (snapshot) Service Catalog loads.")
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--types", type=int, default=50, help="request types per category")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    text = _make_catalog_yaml(args.categories, args.types)
+    print(f"catalog: {args.categories} categories x {args.types} types, {len(text) / 1024:.0f} KiB YAML")
+
+    pure_python = _client(text, None, client_cls=_PurePythonYAMLClient)
+    results = {"cold, pure-Python SafeLoader": _best_of(args.repeat, pure_python.fetch_catalog)}
+    if hasattr(yaml, "CSafeLoader"):
+        results["cold, LibYAML CSafeLoader"] = _best_of(args.repeat, _client(text, None).fetch_catalog)
+    else:
+        print("LibYAML not available: CSafeLoader row skipped")
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        snapshots = ServiceCatalogSnapshots(snapshot_dir)
+        warm = _client(text, snapshots)
+        warm.fetch_catalog()  # writes the snapshot
+        results["warm, binary snapshot (fetch_catalog)"] = _best_of(args.repeat, warm.fetch_catalog)
+        key = content_hash(text)
+        results["warm, snapshot load only"] = _best_of(args.repeat, lambda: snapshots.load(key))
+        catalog = warm.fetch_catalog()
+        # rebuilt every run on top of either load path
+        results["CatalogIndex.build (per run)"] = _best_of(args.repeat, lambda: CatalogIndex.build(catalog))
+
+    for name, seconds in results.items():
+        print(f"{name:<42} {seconds * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    main()
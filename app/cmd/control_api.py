@@ -0,0 +1,200 @@
+from __future__ import annotations
+import hmac
+import json
+import logging
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+from app.cmd.run_events import RunEvent
+
+if TYPE_CHECKING:
+    from app.cmd.daemon import PipelineDaemon, RunRecord
+
+
+logger = logging.getLogger(__name__)
+
+# SSE comment sent when no event arrived for this long (keeps proxies and clients from timing out)
+HEARTBEAT_SECONDS = 15.0
+
+class ControlAPIServer(ThreadingHTTPServer):
+    """Local HTTP control surface of a PipelineDaemon (standard library only).
+
+        GET  /health              liveness
+        GET  /status              running flag, current/last run, next scheduled run
+        GET  /runs                recent runs, newest first
+        GET  /runs/<id>           one run with its summary once finished
+        POST /runs                trigger a run now: 202 with the run, 409 while one is running
+        GET  /events[?run=<id>]   Server-Sent Events of run progress; with ``run`` the
+                                  stream replays that run and ends after its run_finished
+
+        When ``token`` is set, every request needs ``Authorization: Bearer <token>``.
+        """
+
+    daemon_threads = True
+
+    def __init__(
+            self,
+            address: tuple[str, int],
+            pipeline_daemon: PipelineDaemon,
+            stop: threading.Event,
+            token: str | None = None,
+    ) -> None:
+        super().__init__(address, _ControlAPIHandler)
+        self.pipeline_daemon = pipeline_daemon
+        self.stop = stop
+        self.token = token
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, name="control-api", daemon=True)
+        thread.start()
+        host, port = self.server_address[:2]
+        logger.info("Control API listening on http://%s:%s", host, port)
+        return thread
+
+class _ControlAPIHandler(BaseHTTPRequestHandler):
+    server: ControlAPIServer
+
+    def do_GET(self) -> None:
+        if not self._authorized():
+            return
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        daemon = self.server.pipeline_daemon
+
+        if parts == ["health"]:
+            self._send_json(HTTPStatus.OK, {"ok": True})
+        elif parts == ["status"]:
+            self._send_json(HTTPStatus.OK, _status(daemon))
+        elif parts == ["runs"]:
+            self._send_json(HTTPStatus.OK, {"runs": [record.to_dict() for record in daemon.run_records()]})
+        elif len(parts) == 2 and parts[0] == "runs":
+            record = daemon.get_run(int(parts[1])) if parts[1].isdigit() else None
+            if record is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": "unknown run"})
+            else:
+                self._send_json(HTTPStatus.OK, record.to_dict())
+        elif parts == ["events"]:
+            self._stream_events(parse_qs(url.query))
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        if not self._authorized():
+            return
+        if [part for part in urlsplit(self.path).path.split("/") if part] != ["runs"]:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "not found"})
+            return
+
+        if self.server.stop.is_set():
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "daemon is stopping"})
+            return
+
+        daemon = self.server.pipeline_daemon
+        record = daemon.trigger("api")
+        if record is None:
+            current = daemon.current_run
+            self._send_json(
+                HTTPStatus.CONFLICT,
+                {"error": "a run is already in progress", "run": None if current is None else current.to_dict()},
+            )
+            return
+        self._send_json(
+            HTTPStatus.ACCEPTED,
+            {"run": record.to_dict(), "events": f"/events?run={record.id}"},
+            headers={"Location": f"/runs/{record.id}"},
+        )
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("control API %s - %s", self.address_string(), format % args)
+
+    def _authorized(self) -> bool:
+        token = self.server.token
+        if not token:
+            return True
+        supplied = self.headers.get("Authorization", "")
+        if hmac.compare_digest(supplied.encode("utf-8"), f"Bearer {token}".encode("utf-8")):
+            return True
+        self._send_json(HTTPStatus.UNAUTHORIZED, {"error": "unauthorized"})
+        return False
+
+    def _send_json(self, status: HTTPStatus, body: dict[str, Any], headers: dict[str, str] | None = None) -> None:
+        payload = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _stream_events(self, query: dict[str, list[str]]) -> None:
+        daemon = self.server.pipeline_daemon
+        events = daemon.events
+
+        run_id: int | None = None
+        record: RunRecord | None = None
+        if query.get("run"):
+            record = daemon.get_run(int(query["run"][0])) if query["run"][0].isdigit() else None
+            if record is None:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": "unknown run"})
+                return
+            run_id = record.id
+
+        # resume after Last-Event-ID; a run stream replays the run, the global stream starts now
+        resume = self.headers.get("Last-Event-ID", "")
+        last_id = int(resume) if resume.isdigit() else (0 if run_id is not None else events.last_id)
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        try:
+            if record is not None and _finished_without_events(daemon, record, last_id):
+                # the run's events already left the bounded log; report its outcome directly
+                self.wfile.write(RunEvent(
+                    id=last_id, type="run_finished", run_id=run_id,
+                    at=record.finished_at or record.started_at,
+                    data={"status": record.status, "error": record.error},
+                ).to_sse())
+                return
+
+            while not self.server.stop.is_set():
+                batch = events.wait_since(last_id, timeout=HEARTBEAT_SECONDS)
+                if not batch:
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+                    continue
+                for event in batch:
+                    last_id = event.id
+                    if run_id is not None and event.run_id != run_id:
+                        continue
+                    self.wfile.write(event.to_sse())
+                    if run_id is not None and event.type == "run_finished":
+                        self.wfile.flush()
+                        return
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("SSE client disconnected")
+
+def _finished_without_events(daemon: PipelineDaemon, record: RunRecord, last_id: int) -> bool:
+    if record.finished_at is None:
+        return False
+    return not any(event.run_id == record.id for event in daemon.events.wait_since(last_id, timeout=0))
+
+def _status(daemon: PipelineDaemon) -> dict[str, Any]:
+    last_finished = next(
+        (record for record in daemon.run_records() if record.finished_at),
+        None,
+    )
+    return {
+        "running": daemon.running,
+        "current_run": None if daemon.current_run is None else daemon.current_run.to_dict(),
+        "last_run": None if last_finished is None else last_finished.to_dict(),
+        "next_run_at": None if daemon.next_run_at is None else daemon.next_run_at.isoformat(timespec="seconds"),
+        "runs_started": daemon.runs_started,
+        "runs_skipped": daemon.runs_skipped,
+    }
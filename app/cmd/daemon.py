@@ -0,0 +1,278 @@
+from __future__ import annotations
+import argparse
+import logging
+import signal
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from app.cmd.control_api import ControlAPIServer
+from app.cmd.main import logging_conf
+from app.cmd.pipeline import _build_pipeline_deps
+from app.cmd.pipeline_service import PipelineDeps, run_pipeline
+from app.cmd.pipeline_summary import PipelineRunSummary
+from app.cmd.ports import ServiceCatalogClientPort
+from app.cmd.run_events import RunEventLog
+from app.infrastructure.config_loader import load_daemon_config
+from app.shared.schedule import Schedule, parse_schedule
+
+
+logger = logging.getLogger(__name__)
+
+class CatalogRefresher:
+    """ServiceCatalogClientPort that serves the last fetched catalog and refreshes it in the background.
+
+        The first ``fetch_catalog`` call downloads synchronously (and raises on
+        failure); later calls return the cached catalog at once. The background
+        loop refreshes it every ``refresh_seconds``, starting one interval after
+        ``start``. A failed background refresh keeps the previous catalog.
+        """
+
+    def __init__(self, client: ServiceCatalogClientPort, refresh_seconds: float) -> None:
+        self._client = client
+        self._refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._catalog: Any = None
+        self.refreshed_at: datetime | None = None
+
+    def fetch_catalog(self) -> Any:
+        with self._lock:
+            if self._catalog is None:
+                self._catalog = self._client.fetch_catalog()
+                self.refreshed_at = datetime.now().astimezone()
+            return self._catalog
+
+    def refresh(self) -> None:
+        try:
+            catalog = self._client.fetch_catalog()
+        except Exception as exc:
+            logger.warning("Background Service Catalog refresh failed; keeping the previous catalog: %s", exc)
+            return
+        with self._lock:
+            self._catalog = catalog
+            self.refreshed_at = datetime.now().astimezone()
+
+    def start(self, stop: threading.Event) -> threading.Thread:
+        def loop() -> None:
+            # the first run's fetch_catalog fills the cache; refreshing now would download twice
+            while not stop.wait(self._refresh_seconds):
+                self.refresh()
+
+        thread = threading.Thread(target=loop, name="catalog-refresh", daemon=True)
+        thread.start()
+        return thread
+
+# finished runs kept for the control API
+_RUN_HISTORY = 50
+
+@dataclass
+class RunRecord:
+    id: int
+    reason: str
+    started_at: datetime
+    status: str = "running"   # running, failed, or the summary status when finished
+    finished_at: datetime | None = None
+    summary: PipelineRunSummary | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "reason": self.reason,
+            "status": self.status,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "finished_at": None if self.finished_at is None else self.finished_at.isoformat(timespec="seconds"),
+            "summary": None if self.summary is None else self.summary.to_dict(),
+            "error": self.error,
+        }
+
+class PipelineDaemon:
+    """Keeps PipelineDeps alive and runs the pipeline on a schedule, never two runs at once.
+
+        Every run starts through ``run_once`` (blocking) or ``trigger`` (on a
+        background thread): scheduled ticks and manual triggers alike. Both
+        return None without running when another run is in progress. A run
+        that raises is recorded as failed and the daemon keeps going. Ticks
+        missed while a run was in progress are skipped, not queued.
+
+        Run start/finish and the pipeline's stage progress are published to
+        ``events``; the last ``_RUN_HISTORY`` runs are kept and read through
+        ``run_records``/``get_run`` (safe from other threads). ``wait_idle``
+        blocks until a run in progress, including a triggered one, finished.
+        """
+
+    def __init__(
+            self,
+            deps: PipelineDeps,
+            schedule: Schedule,
+            run: Callable[[PipelineDeps], PipelineRunSummary] = run_pipeline,
+            clock: Callable[[], datetime] = lambda: datetime.now().astimezone(),
+    ) -> None:
+        self.deps = deps
+        self.schedule = schedule
+        self._run = run
+        self._clock = clock
+        self._run_lock = threading.Lock()
+        self.events = RunEventLog()
+        self._runs: dict[int, RunRecord] = {}
+        self._runs_lock = threading.Lock()
+        self._run_thread: threading.Thread | None = None
+        self.current_run: RunRecord | None = None
+        self.next_run_at: datetime | None = None
+        self.runs_started = 0
+        self.runs_skipped = 0
+        self.last_summary: PipelineRunSummary | None = None
+        self.last_error: str | None = None
+        if deps is not None:
+            deps.progress = self._on_progress
+
+    @property
+    def running(self) -> bool:
+        return self._run_lock.locked()
+
+    def run_once(self, reason: str = "schedule") -> PipelineRunSummary | None:
+        record = self._begin(reason)
+        if record is None:
+            return None
+        return self._execute(record)
+
+    def trigger(self, reason: str = "manual") -> RunRecord | None:
+        """Start a run on a background thread and return its record at once."""
+
+        record = self._begin(reason)
+        if record is None:
+            return None
+        # not a daemon thread: shutdown waits for it (see wait_idle)
+        self._run_thread = threading.Thread(target=self._execute, args=(record,), name=f"pipeline-run-{record.id}")
+        self._run_thread.start()
+        return record
+
+    def wait_idle(self) -> None:
+        """Block until no run is in progress."""
+
+        with self._run_lock:
+            pass
+        thread = self._run_thread
+        if thread is not None:
+            thread.join()
+
+    def run_records(self) -> list[RunRecord]:
+        """Snapshot of the kept runs, newest first."""
+
+        with self._runs_lock:
+            return sorted(self._runs.values(), key=lambda record: record.id, reverse=True)
+
+    def get_run(self, run_id: int) -> RunRecord | None:
+        with self._runs_lock:
+            return self._runs.get(run_id)
+
+    def serve(self, stop: threading.Event, run_on_start: bool = False) -> None:
+        """Run on schedule until ``stop`` is set (the current run is allowed to finish)."""
+
+        if run_on_start and not stop.is_set():
+            self.run_once("start")
+        while not stop.is_set():
+            now = self._clock()
+            self.next_run_at = self.schedule.next_after(now)
+            logger.info("Next pipeline run at %s", self.next_run_at.isoformat(timespec="seconds"))
+            if stop.wait(max(0.0, (self.next_run_at - now).total_seconds())):
+                break
+            self.run_once("schedule")
+
+    def _begin(self, reason: str) -> RunRecord | None:
+        if not self._run_lock.acquire(blocking=False):
+            self.runs_skipped += 1
+            logger.warning("Pipeline run (%s) skipped: another run is still in progress", reason)
+            return None
+        self.runs_started += 1
+        record = RunRecord(id=self.runs_started, reason=reason, started_at=self._clock())
+        with self._runs_lock:
+            self._runs[record.id] = record
+            for old_id in [run_id for run_id in self._runs if run_id <= record.id - _RUN_HISTORY]:
+                del self._runs[old_id]
+        self.current_run = record
+        logger.info("Pipeline run #%d started (%s)", record.id, reason)
+        self.events.publish("run_started", record.id, reason=reason)
+        return record
+
+    def _execute(self, record: RunRecord) -> PipelineRunSummary | None:
+        """Run the pipeline for ``record`` and release the run lock taken by ``_begin``."""
+
+        try:
+            try:
+                summary = self._run(self.deps)
+            except Exception as exc:
+                logger.exception("Pipeline run #%d failed", record.id)
+                record.status, record.error = "failed", str(exc)
+                self.last_error = str(exc)
+                return None
+            record.status, record.summary = summary.status, summary
+            self.last_summary = summary
+            self.last_error = None
+            return summary
+        finally:
+            record.finished_at = self._clock()
+            self.current_run = None
+            self.events.publish("run_finished", record.id, status=record.status, error=record.error)
+            self._run_lock.release()
+
+    def _on_progress(self, stage: str, data: dict[str, Any]) -> None:
+        current = self.current_run
+        self.events.publish(stage, None if current is None else current.id, **data)
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the pipeline on a schedule in one long-lived process")
+    parser.add_argument(
+        "--schedule",
+        help='interval ("15m", "900", "@every 1h") or cron expression ("*/15 8-18 * * 1-5"); '
+        "default: DAEMON_SCHEDULE",
+    )
+    parser.add_argument("--run-on-start", action="store_true", help="run once right after start-up")
+    args = parser.parse_args(argv)
+    if args.schedule:
+        try:
+            parse_schedule(args.schedule)
+        except ValueError as exc:
+            parser.error(f"--schedule: {exc}")
+    return args
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    logging_conf()
+    config = load_daemon_config()
+    schedule = parse_schedule(args.schedule or config.schedule)
+
+    # built once: imports, .env, HTTP sessions, LLM client and state DBs stay warm between runs
+    deps = _build_pipeline_deps()
+    stop = threading.Event()
+    refresher = CatalogRefresher(deps.service_catalog_client, config.catalog_refresh_seconds)
+    deps.service_catalog_client = refresher
+    refresher.start(stop)
+
+    def request_stop(signum: int, _frame: Any) -> None:
+        logger.info("Received signal %d; stopping after the current run", signum)
+        stop.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    daemon = PipelineDaemon(deps, schedule)
+    control_api = None
+    if config.control_port is not None:
+        control_api = ControlAPIServer((config.control_host, config.control_port), daemon, stop, config.control_token)
+        control_api.start()
+
+    logger.info("Pipeline daemon started: schedule=%r", schedule)
+    try:
+        daemon.serve(stop, run_on_start=args.run_on_start or config.run_on_start)
+    finally:
+        # a run triggered through the control API finishes before the process exits
+        daemon.wait_idle()
+        if control_api is not None:
+            control_api.shutdown()
+            control_api.server_close()
+    logger.info("Pipeline daemon stopped after %d run(s)", daemon.runs_started)
+
+if __name__ == "__main__":
+    main()
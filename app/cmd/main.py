@@ -1,4 +1,5 @@
 from __future__ import annotations
+import argparse
 import logging
 from app.cmd.pipeline import pipeline
 
@@ -9,9 +10,19 @@ def logging_conf() -> None:
         format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
     )
 
-def main() -> None:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Classify helpdesk requests and email the report")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="ignore the stored ingestion watermark and re-process every helpdesk request",
+    )
+    return parser.parse_args(argv)
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
     logging_conf()
-    pipeline()
+    pipeline(full=args.full)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,13 +3,24 @@ import logging
 from app.infrastructure.helpdesk_client import HelpdeskClient
 from app.application.helpdesk_services import HelpdeskService
 from app.infrastructure.config_loader import (
-    load_helpdesk_config,
+    load_helpdesk_sources_config,
     load_service_catalog_config,
     load_llm_config,
+    load_llm_budget_config,
     load_report_log_config,
     load_email_config,
+    load_pipeline_config,
+    load_http_transport_config,
+    load_cassette_config,
+    load_sla_calendar_config,
 )
+import dataclasses
+from zoneinfo import ZoneInfo
+from app.application.business_calendar import BusinessCalendar
+from app.infrastructure.http_transport import build_session
 from app.infrastructure.service_catalog_client import ServiceCatalogClient
+from app.infrastructure.service_catalog_cache import ServiceCatalogCache
+from app.infrastructure.service_catalog_snapshot import ServiceCatalogSnapshots
 from app.infrastructure.llm_classifier import LLMClassifier
 from pathlib import Path
 from app.infrastructure.report_log import SQLiteReportLog
@@ -18,11 +29,16 @@ from app.infrastructure.email_templates.email_body_builder import TemplateEmailB
 from app.infrastructure.report_exporter_excel import ExcelReportExporter
 from app.infrastructure.email_sender import SMTPSender
 from app.infrastructure.helpdesk_client_request_provider import HelpdeskClientRequestProvider
+from app.infrastructure.ingestion_state import SQLiteIngestionState
+from app.infrastructure.classification_store import SQLiteClassificationStore
+from app.infrastructure.catalog_alias_store import SQLiteCatalogAliasStore
+from app.infrastructure.multi_source_request_provider import MultiSourceRequestProvider
+from app.infrastructure.cassette import Cassette, CassetteEmailSender
 
 
 logger = logging.getLogger(__name__)
 
-def _build_pipeline_deps() -> PipelineDeps:
+def _build_pipeline_deps(full: bool = False) -> PipelineDeps:
     project_root = Path(__file__).resolve().parent.parent.parent
 
     # db / report log
@@ -30,34 +46,132 @@ def _build_pipeline_deps() -> PipelineDeps:
     db_path = Path(report_log_config.db_path)
     if not db_path.is_absolute():
         db_path = project_root / db_path
-    report_log = SQLiteReportLog(db_path)
 
-    # helpdesk
-    helpdesk_config = load_helpdesk_config()
-    helpdesk_client = HelpdeskClient(helpdesk_config)
-    helpdesk_provider = HelpdeskClientRequestProvider(helpdesk_client)
+    # record/replay of helpdesk, catalog, LLM and SMTP interactions
+    cassette_config = load_cassette_config()
+    cassette: Cassette | None = None
+    replay_root: Path | None = None
+    if cassette_config.mode != "off":
+        cassette_dir = Path(cassette_config.directory)
+        if not cassette_dir.is_absolute():
+            cassette_dir = project_root / cassette_dir
+        cassette = Cassette(cassette_dir, cassette_config.mode)
+        logger.info("Cassette %s mode: %s", cassette_config.mode, cassette_dir)
+        if cassette.replaying:
+            # replayed reports are exported and logged apart from the production output/report log
+            replay_root = cassette_dir / "replay"
+    replaying = replay_root is not None
+
+    report_log = SQLiteReportLog(db_path if replay_root is None else replay_root / "report_log.sqlite3")
+
+    # one pooled keep-alive session shared by the HTTP clients
+    http_config = load_http_transport_config()
+    http_session = build_session(http_config.pool_connections, http_config.pool_maxsize, cassette=cassette)
+
+    # helpdesk: one client/provider per tenant, merged when there are several
+    helpdesk_sources = load_helpdesk_sources_config()
+    multi_source = len(helpdesk_sources) > 1
+    # replay feeds the recorded responses as they are, without the live watermark
+    ingestion_state = (
+        SQLiteIngestionState(db_path)
+        if not replaying and any(src.api.incremental for src in helpdesk_sources)
+        else None
+    )
+    source_providers = [
+        HelpdeskClientRequestProvider(
+            HelpdeskClient(
+                src.api,
+                max_retries=http_config.max_retries,
+                backoff_factor=http_config.backoff_factor,
+                session=http_session,
+                max_backoff_seconds=http_config.max_backoff_seconds,
+            ),
+            state=ingestion_state if src.api.incremental else None,
+            source=src.name,
+            full=full,
+            tag_source=multi_source,
+        )
+        for src in helpdesk_sources
+    ]
+    helpdesk_provider: HelpdeskClientRequestProvider | MultiSourceRequestProvider = (
+        MultiSourceRequestProvider(source_providers) if multi_source else source_providers[0]
+    )
     helpdesk_service = HelpdeskService(helpdesk_provider)
 
     # service catalog
     service_catalog_config = load_service_catalog_config()
-    service_catalog_client = ServiceCatalogClient(service_catalog_config)
+    # cassettes need full catalog bodies, not 304s answered from a local cache
+    service_catalog_cache: ServiceCatalogCache | None = None
+    if service_catalog_config.cache_path and cassette is None:
+        cache_path = Path(service_catalog_config.cache_path)
+        if not cache_path.is_absolute():
+            cache_path = project_root / cache_path
+        service_catalog_cache = ServiceCatalogCache(cache_path)
+    service_catalog_snapshots: ServiceCatalogSnapshots | None = None
+    if service_catalog_config.snapshot_dir:
+        snapshot_dir = Path(service_catalog_config.snapshot_dir)
+        if not snapshot_dir.is_absolute():
+            snapshot_dir = project_root / snapshot_dir
+        service_catalog_snapshots = ServiceCatalogSnapshots(snapshot_dir)
+    service_catalog_client = ServiceCatalogClient(
+        service_catalog_config,
+        max_retries=http_config.max_retries,
+        backoff_factor=http_config.backoff_factor,
+        session=http_session,
+        max_backoff_seconds=http_config.max_backoff_seconds,
+        cache=service_catalog_cache,
+        max_stale_seconds=service_catalog_config.cache_max_stale_seconds,
+        snapshots=service_catalog_snapshots,
+    )
 
     # llm
     llm_config = load_llm_config()
-    llm_classifier = LLMClassifier(llm_config)
+    if replaying:
+        # replay runs at CPU speed
+        llm_config = dataclasses.replace(llm_config, delay_between_batches=0.0)
+    llm_classifier = LLMClassifier(llm_config, cassette=cassette)
+    llm_budget_config = load_llm_budget_config()
 
     # email body builder (templates)
     email_body_builder = TemplateEmailBodyBuilder()
 
     # email sender/config built
     email_config = load_email_config()
-    email_sender = SMTPSender(email_config)
+    email_sender: SMTPSender | CassetteEmailSender = SMTPSender(email_config)
+    if cassette is not None:
+        email_sender = CassetteEmailSender(email_sender, cassette)
 
     # report exporter adapter
-    report_exporter = ExcelReportExporter()
+    report_exporter = ExcelReportExporter(output_dir=None if replay_root is None else replay_root / "output")
+
+    # run-wide time budget
+    pipeline_config = load_pipeline_config()
+
+    # stored classifications (off under cassettes: recordings must see every LLM call)
+    classification_store = (
+        SQLiteClassificationStore(db_path)
+        if pipeline_config.classification_store and cassette is None
+        else None
+    )
+    # business hours/holidays of SLA due dates
+    sla_calendar_config = load_sla_calendar_config()
+    sla_calendar = BusinessCalendar(
+        tz=ZoneInfo(sla_calendar_config.timezone),
+        workdays=sla_calendar_config.workdays,
+        start_minute=sla_calendar_config.start_minute,
+        end_minute=sla_calendar_config.end_minute,
+        holidays=sla_calendar_config.holidays,
+    )
+
+    catalog_alias_store = (
+        SQLiteCatalogAliasStore(db_path)
+        if pipeline_config.catalog_aliases and cassette is None
+        else None
+    )
 
     return PipelineDeps(
-        project_root=project_root,
+        # unsent reports are looked up under <project_root>/output, where the exporter writes
+        project_root=project_root if replay_root is None else replay_root,
         helpdesk_service=helpdesk_service,
         service_catalog_client=service_catalog_client,
         llm_classifier=llm_classifier,
@@ -69,8 +183,17 @@ def _build_pipeline_deps() -> PipelineDeps:
         codebase_url=email_config.codebase_url,
         candidate_name=email_config.candidate_name,
         email_title=email_config.email_title,
+        deadline_seconds=pipeline_config.deadline_seconds,
+        deadline_reserve_seconds=pipeline_config.deadline_reserve_seconds,
+        llm_budget=llm_budget_config,
+        early_report_max_priority=pipeline_config.early_report_max_priority,
+        ingestion_checkpoint=helpdesk_provider if ingestion_state is not None else None,
+        split_report_by_source=pipeline_config.split_report_by_source,
+        classification_store=classification_store,
+        catalog_alias_store=catalog_alias_store,
+        sla_calendar=sla_calendar,
     )
 
-def pipeline(explicit_report_path: str | None = None) -> None:
-    deps = _build_pipeline_deps()
+def pipeline(explicit_report_path: str | None = None, full: bool = False) -> None:
+    deps = _build_pipeline_deps(full=full)
     run_pipeline(deps, explicit_report_path=explicit_report_path)
@@ -7,15 +7,15 @@ from pathlib import Path
 from typing import Iterable, Sequence
 from app.application.ports.email_body_builder_port import EmailBodyBuilder
 from app.cmd.ports import ReportLogPort, ServiceCatalogClientPort
-from app.domain.service_catalog import ServiceCatalog
+from app.application.catalog_index import CatalogIndex
 from app.application.ports.report_email_sender_port import ReportEmailSenderPort
 from app.shared.errors import ServiceCatalogLoadError
 
 
 logger = logging.getLogger(__name__)
 
-def _load_service_catalog(client: ServiceCatalogClientPort) -> ServiceCatalog:
-    """Logs the number of categories in the loaded catalog."""
+def _load_service_catalog(client: ServiceCatalogClientPort) -> CatalogIndex:
+    """Load the catalog and index it once for the whole run (logs the number of categories)."""
 
     try:
         service_catalog = client.fetch_catalog()
@@ -27,7 +27,7 @@ def _load_service_catalog(client: ServiceCatalogClientPort) -> ServiceCatalog:
         "Service Catalog loaded: %d categories",
         len(service_catalog.categories),
     )
-    return service_catalog
+    return CatalogIndex.build(service_catalog)
 
 def _log_sample_requests(requests_: Sequence[HelpdeskRequest], limit: int = 5) -> None:
     """Logs up to ``limit`` requests, showing their raw IDs and short descriptions.
@@ -1,9 +1,11 @@
 from __future__ import annotations
 import logging
+from app.domain.helpdesk import HelpdeskRequest
 from app.application.fill_helpdesk_sla import fill_helpdesk_sla
-from app.application.classify_helpdesk_requests import classify_requests
+from app.application.classify_helpdesk_requests import classify_requests, ClassificationStats
 from app.cmd.spinner import Spinner
 from pathlib import Path
+from typing import Any, Callable
 from app.cmd.pipeline_helpers import (
     _load_service_catalog,
     _log_sample_requests,
@@ -13,10 +15,33 @@ from app.cmd.pipeline_helpers import (
 from dataclasses import dataclass
 from app.application.ports.email_body_builder_port import EmailBodyBuilder
 from app.application.classify_helpdesk_requests import RequestClassifier
-from app.cmd.ports import ReportLogPort, ServiceCatalogClientPort, HelpdeskServicePort
+from app.cmd.ports import (
+    ReportLogPort,
+    ServiceCatalogClientPort,
+    HelpdeskServicePort,
+    IngestionCheckpointPort,
+    SupportsWarmUp,
+)
 from app.application.ports.report_exporter_port import ReportExporterPort
 from app.application.ports.report_email_sender_port import ReportEmailSenderPort
 from app.shared.errors import ReportGenerationError, EmailSendError
+from app.shared.deadline import Deadline
+from app.shared.stage_scheduler import StageScheduler, StageTimeoutError
+from app.cmd.pipeline_summary import PipelineRunSummary
+from app.application.llm_budget import LLMBudget
+from app.application.schedule_helpdesk_requests import is_urgent
+from collections.abc import Sequence
+from app.config import LLMBudgetConfig
+from app.application.catalog_index import CatalogIndex
+from app.application.ports.classification_store_port import ClassificationStorePort
+from app.application.ports.catalog_alias_store_port import CatalogAliasStorePort
+from app.application.catalog_aliases import CatalogAliases
+from app.application.business_calendar import BusinessCalendar
+from app.application.stored_classifications import (
+    apply_stored_classifications,
+    reconcile_catalog,
+    remember_classifications,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -35,8 +60,36 @@ class PipelineDeps:
     codebase_url: str
     candidate_name: str
     email_title: str
+    deadline_seconds: float | None = None
+    deadline_reserve_seconds: float = 30.0
+    llm_budget: LLMBudgetConfig | None = None
+    early_report_max_priority: int | None = None
+    ingestion_checkpoint: IngestionCheckpointPort | None = None
+    split_report_by_source: bool = False
+    classification_store: ClassificationStorePort | None = None
+    catalog_alias_store: CatalogAliasStorePort | None = None
+    sla_calendar: BusinessCalendar | None = None
+    # structured progress events (stage name, data), e.g. for the daemon control API
+    progress: Callable[[str, dict[str, Any]], None] | None = None
 
-def run_pipeline(deps: PipelineDeps, explicit_report_path: str | None = None) -> None:
+def run_pipeline(deps: PipelineDeps, explicit_report_path: str | None = None) -> PipelineRunSummary:
+    """Run the pipeline once and return a summary of what was done (and cut)."""
+
+    deadline = Deadline(deps.deadline_seconds)
+    summary = PipelineRunSummary(deadline_seconds=deps.deadline_seconds)
+    try:
+        _run_stages(deps, explicit_report_path, deadline, summary)
+    finally:
+        summary.elapsed_seconds = deadline.elapsed()
+        summary.log()
+    return summary
+
+def _run_stages(
+    deps: PipelineDeps,
+    explicit_report_path: str | None,
+    deadline: Deadline,
+    summary: PipelineRunSummary,
+) -> None:
     project_root = deps.project_root
     report_log = deps.report_log
 
@@ -65,7 +118,10 @@ def run_pipeline(deps: PipelineDeps, explicit_report_path: str | None = None) ->
             )
         except EmailSendError as exc:
             logger.error("Failed to send report email: %s", exc)
+            summary.status = "send_failed"
             return
+        summary.report_paths = list(unsent_reports)
+        summary.status = "sent_unsent_reports"
         return
 
     # if a specific report is already logged as sent — nothing to do
@@ -74,39 +130,141 @@ def run_pipeline(deps: PipelineDeps, explicit_report_path: str | None = None) ->
             "Explicit report %s is already logged as sent and no unsent reports remain",
             explicit_report_path_obj,
         )
+        summary.status = "already_sent"
         return
 
-    # [part 1] fetch helpdesk requests
-    requests_ = deps.helpdesk_service.load_helpdesk_requests()
-
-    # [part 2] fetch service catalog
-    service_catalog = _load_service_catalog(deps.service_catalog_client)
-
-    # [part 3 and 4] classify the requests by LLM
-    # classify all requests (even if not success by LLM) and log first 3 of them
-    # (displaying spinner while requests in LLM in progress)
-    with Spinner("Classifying helpdesk requests with LLM"):
-        classified_requests = classify_requests(
-            deps.llm_classifier,
-            service_catalog,
-            requests_,
-            batch_size=deps.batch_size,
+    reserve = deps.deadline_reserve_seconds
+
+    # [part 1 and 2] fetch helpdesk requests and the service catalog concurrently,
+    # warming up the LLM/SMTP connections meanwhile; join only where data is needed
+    stages = StageScheduler()
+    try:
+        stages.start("helpdesk", deps.helpdesk_service.load_helpdesk_requests)
+        if deadline.has_at_least(reserve):
+            stages.start("service_catalog", _load_service_catalog, deps.service_catalog_client)
+        _start_warm_ups(stages, deps)
+
+        try:
+            # the whole remaining budget: fetched requests are reported even without classification
+            requests_ = stages.result("helpdesk", timeout=_stage_timeout(deadline, 0.0))
+        except StageTimeoutError:
+            # nothing to report without the requests
+            logger.error("Run deadline reached while fetching helpdesk requests; aborting the run")
+            summary.stages_cut.append("helpdesk")
+            summary.status = "helpdesk_timeout"
+            return
+        summary.requests_fetched = len(requests_)
+        _progress(deps, "helpdesk_fetched", requests=len(requests_))
+
+        # incremental ingestion: nothing new since the last delivered report
+        if deps.ingestion_checkpoint is not None and not requests_:
+            logger.info("No new or changed helpdesk requests since the last report; nothing to send")
+            summary.status = "no_new_requests"
+            return
+
+        service_catalog: CatalogIndex | None = None
+        if stages.started("service_catalog") and deadline.has_at_least(reserve):
+            try:
+                service_catalog = stages.result("service_catalog", timeout=_stage_timeout(deadline, reserve))
+            except StageTimeoutError:
+                logger.warning("Run deadline reached while loading the Service Catalog")
+            else:
+                _progress(deps, "catalog_loaded")
+    finally:
+        stages.shutdown()
+
+    classified_requests: list[HelpdeskRequest]
+
+    if service_catalog is not None:
+        # [part 3 and 4] classify the requests by LLM
+        # classify all requests (even if not success by LLM) and log first 3 of them
+        # (displaying spinner while requests in LLM in progress)
+        stats = ClassificationStats()
+        budget = _build_llm_budget(deps.llm_budget)
+        catalog = service_catalog
+        store = deps.classification_store
+        if store is not None:
+            # catalog edits invalidate only the stored classifications they affect
+            reconcile_catalog(store, catalog)
+        alias_store = deps.catalog_alias_store
+        aliases = None if alias_store is None else CatalogAliases.load(alias_store, catalog)
+
+        def classify(subset: Sequence[HelpdeskRequest]) -> list[HelpdeskRequest]:
+            if store is None:
+                pending: Sequence[HelpdeskRequest] = subset
+            else:
+                # requests are updated in-place; only the rest goes to the LLM
+                pending = apply_stored_classifications(store, catalog, subset)
+            with Spinner("Classifying helpdesk requests with LLM"):
+                classified = classify_requests(
+                    deps.llm_classifier,
+                    catalog,
+                    pending,
+                    batch_size=deps.batch_size,
+                    deadline=deadline,
+                    deadline_reserve_seconds=reserve,
+                    stats=stats,
+                    budget=budget,
+                    aliases=aliases,
+                )
+            _progress(
+                deps,
+                "classification_progress",
+                batches_total=stats.batches_total,
+                batches_sent=stats.batches_sent,
+                batches_failed=stats.batches_failed,
+                batches_skipped=stats.batches_skipped,
+            )
+            if store is None:
+                return classified
+            remember_classifications(store, catalog, classified)
+            return list(subset)
+
+        urgent, rest = _split_urgent(requests_, deps.early_report_max_priority)
+        if urgent and rest:
+            # urgent tickets first, reported on their own before the full run finishes
+            classified_urgent = classify([requests_[i] for i in urgent])
+            fill_helpdesk_sla(classified_urgent, service_catalog, deps.sla_calendar)
+            _send_early_report(deps, classified_urgent, summary)
+            classified_rest = classify([requests_[i] for i in rest])
+            # the full report keeps the helpdesk order
+            classified_requests = _in_input_order(urgent + rest, classified_urgent + classified_rest)
+        else:
+            classified_requests = classify(requests_)
+        if alias_store is not None and aliases is not None:
+            aliases.save(alias_store)
+        summary.apply_classification_stats(stats)
+        if stats.batches_skipped:
+            summary.stages_cut.append(f"classification:{stats.skip_reason}")
+
+        fill_helpdesk_sla(classified_requests, service_catalog, deps.sla_calendar)
+    else:
+        # no budget left for catalog + LLM: report the fetched requests as-is
+        logger.warning(
+            "Run deadline is close after the fetch stages (%.1fs left); "
+            "skipping Service Catalog and LLM classification",
+            deadline.remaining() or 0.0,
         )
+        classified_requests = list(requests_)
+        summary.stages_cut.extend(["service_catalog", "classification"])
+        summary.requests_cut += len(classified_requests)
 
-    # [part 5] build Excel file
-    fill_helpdesk_sla(classified_requests, service_catalog)
+    # [part 5] build Excel file(s)
     try:
-        report_path = deps.report_exporter.export(classified_requests)
+        report_paths = _export_reports(deps, classified_requests)
     except ReportGenerationError as exc:
         logger.error("Aborting pipeline: failed to export report: %s", exc)
+        summary.status = "export_failed"
         return
+    summary.report_paths = list(report_paths)
+    _progress(deps, "report_exported", paths=[str(path) for path in report_paths])
 
     _log_sample_requests(requests_)
 
     # [part 6] send the report to email
     try:
         _send_report(
-            [report_path],
+            report_paths,
             report_log,
             deps.email_body_builder,
             deps.email_sender,
@@ -116,4 +274,122 @@ def run_pipeline(deps: PipelineDeps, explicit_report_path: str | None = None) ->
         )
     except EmailSendError as exc:
         logger.error("Failed to send report email: %s", exc)
+        summary.status = "send_failed"
+        return
+    summary.status = "sent"
+    _progress(deps, "report_sent", paths=[str(path) for path in report_paths])
+
+    # advance the ingestion watermark only once the report was delivered
+    if deps.ingestion_checkpoint is not None:
+        if summary.stages_cut or summary.requests_cut or summary.batches_failed:
+            # cut or failed tickets are behind the new mark; keep the old one so the next run retries them
+            logger.warning(
+                "Not advancing the ingestion watermark: %d request(s) cut, %d LLM batch(es) failed",
+                summary.requests_cut,
+                summary.batches_failed,
+            )
+        else:
+            deps.ingestion_checkpoint.commit()
+
+def _stage_timeout(deadline: Deadline, reserve: float) -> float | None:
+    """How long a stage may be waited for while keeping ``reserve`` for export and send."""
+
+    remaining = deadline.remaining()
+    if remaining is None:
+        return None
+    return max(0.0, remaining - reserve)
+
+def _progress(deps: PipelineDeps, stage: str, **data: Any) -> None:
+    """Report a stage to ``deps.progress``; a failing listener never breaks the run."""
+
+    if deps.progress is None:
+        return
+    try:
+        deps.progress(stage, data)
+    except Exception as exc:
+        logger.warning("Progress listener failed on %r (ignored): %s", stage, exc)
+
+def _export_reports(deps: PipelineDeps, requests_: Sequence[HelpdeskRequest]) -> list[Path]:
+    """One report, or one per helpdesk source when the split is enabled and sources differ."""
+
+    by_source: dict[str, list[HelpdeskRequest]] = {}
+    for req in requests_:
+        by_source.setdefault(req.source or "default", []).append(req)
+
+    if not deps.split_report_by_source or len(by_source) < 2:
+        return [deps.report_exporter.export(requests_)]
+    return [
+        deps.report_exporter.export(subset, filename_prefix=f"{source}_")
+        for source, subset in by_source.items()
+    ]
+
+def _start_warm_ups(stages: StageScheduler, deps: PipelineDeps) -> None:
+    """Open LLM/SMTP connections in the background while the inputs are fetched."""
+
+    if isinstance(deps.llm_classifier, SupportsWarmUp):
+        stages.warm_up("llm_warm_up", deps.llm_classifier.warm_up)
+    if isinstance(deps.email_sender, SupportsWarmUp):
+        stages.warm_up("smtp_warm_up", deps.email_sender.warm_up)
+
+def _build_llm_budget(config: LLMBudgetConfig | None) -> LLMBudget | None:
+    """Create a fresh per-run budget from config (None when no limits are configured)."""
+
+    if config is None:
+        return None
+    budget = LLMBudget(
+        max_input_tokens=config.max_input_tokens,
+        max_output_tokens=config.max_output_tokens,
+        max_cost=config.max_cost,
+        input_price_per_million=config.input_price_per_million,
+        output_price_per_million=config.output_price_per_million,
+    )
+    return budget if budget.limited else None
+
+def _split_urgent(
+    requests_: Sequence[HelpdeskRequest],
+    max_priority: int | None,
+) -> tuple[list[int], list[int]]:
+    """Split request positions into (urgent, rest); nothing is urgent when early reports are disabled."""
+
+    if max_priority is None:
+        return [], list(range(len(requests_)))
+
+    urgent: list[int] = []
+    rest: list[int] = []
+    for position, req in enumerate(requests_):
+        (urgent if is_urgent(req, max_priority) else rest).append(position)
+    return urgent, rest
+
+def _in_input_order(positions: Sequence[int], requests_: Sequence[HelpdeskRequest]) -> list[HelpdeskRequest]:
+    """Put ``requests_`` (classified out of order) back at their input ``positions``."""
+
+    by_position = dict(zip(positions, requests_))
+    return [by_position[position] for position in sorted(by_position)]
+
+def _send_early_report(
+    deps: PipelineDeps,
+    urgent_requests: list[HelpdeskRequest],
+    summary: PipelineRunSummary,
+) -> None:
+    """Export and send a report with only the urgent requests; failures do not stop the run."""
+
+    logger.info(
+        "Sending early report with %d urgent request(s) (priority <= %s)",
+        len(urgent_requests),
+        deps.early_report_max_priority,
+    )
+    try:
+        early_report_path = deps.report_exporter.export(urgent_requests)
+        _send_report(
+            [early_report_path],
+            deps.report_log,
+            deps.email_body_builder,
+            deps.email_sender,
+            deps.codebase_url,
+            deps.candidate_name,
+            f"{deps.email_title} (urgent)",
+        )
+    except (ReportGenerationError, EmailSendError) as exc:
+        logger.error("Failed to send early urgent report; continuing with full run: %s", exc)
         return
+    summary.early_report_path = early_report_path
@@ -0,0 +1,73 @@
+from __future__ import annotations
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+from app.application.classify_helpdesk_requests import ClassificationStats
+
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PipelineRunSummary:
+    """What a single run_pipeline call did, including anything cut by the run deadline."""
+
+    status: str = "started"
+    requests_fetched: int = 0
+    batches_total: int = 0
+    batches_sent: int = 0
+    batches_failed: int = 0
+    batches_skipped: int = 0
+    requests_cut: int = 0
+    llm_input_tokens: int = 0
+    llm_output_tokens: int = 0
+    llm_cost: float = 0.0
+    stages_cut: list[str] = field(default_factory=list)
+    report_paths: list[Path] = field(default_factory=list)
+    early_report_path: Path | None = None
+    deadline_seconds: float | None = None
+    elapsed_seconds: float = 0.0
+
+    def apply_classification_stats(self, stats: ClassificationStats) -> None:
+        self.batches_total = stats.batches_total
+        self.batches_sent = stats.batches_sent
+        self.batches_failed = stats.batches_failed
+        self.batches_skipped = stats.batches_skipped
+        self.requests_cut += stats.requests_skipped
+        self.llm_input_tokens = stats.input_tokens
+        self.llm_output_tokens = stats.output_tokens
+        self.llm_cost = stats.cost
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready view (paths as strings)."""
+
+        data = asdict(self)
+        data["report_paths"] = [str(path) for path in self.report_paths]
+        data["early_report_path"] = None if self.early_report_path is None else str(self.early_report_path)
+        return data
+
+    def log(self) -> None:
+        logger.info(
+            "Pipeline summary: status=%s requests=%d batches sent=%d/%d failed=%d skipped=%d "
+            "requests_cut=%d stages_cut=%s tokens=%d/%d cost=%.4f reports=%d elapsed=%.1fs deadline=%s",
+            self.status,
+            self.requests_fetched,
+            self.batches_sent,
+            self.batches_total,
+            self.batches_failed,
+            self.batches_skipped,
+            self.requests_cut,
+            ",".join(self.stages_cut) or "-",
+            self.llm_input_tokens,
+            self.llm_output_tokens,
+            self.llm_cost,
+            len(self.report_paths),
+            self.elapsed_seconds,
+            "none" if self.deadline_seconds is None else f"{self.deadline_seconds:.0f}s",
+        )
+        if self.stages_cut or self.requests_cut:
+            logger.warning(
+                "Run budget cut work: stages=%s, %d request(s) reported unclassified",
+                ",".join(self.stages_cut) or "-",
+                self.requests_cut,
+            )
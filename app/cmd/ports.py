@@ -1,4 +1,4 @@
-from typing import Any, Protocol
+from typing import Any, Protocol, runtime_checkable
 from pathlib import Path
 from collections.abc import Sequence
 from app.domain.helpdesk import HelpdeskRequest
@@ -17,4 +17,13 @@ class ReportLogPort(Protocol):
 
 class HelpdeskServicePort(Protocol):
     def load_helpdesk_requests(self) -> Sequence[HelpdeskRequest]:
+        ...
+
+class IngestionCheckpointPort(Protocol):
+    def commit(self) -> None:
+        ...
+
+@runtime_checkable
+class SupportsWarmUp(Protocol):
+    def warm_up(self) -> None:
         ...
\ No newline at end of file
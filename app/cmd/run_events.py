@@ -0,0 +1,61 @@
+from __future__ import annotations
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(frozen=True)
+class RunEvent:
+    id: int
+    type: str
+    run_id: int | None
+    at: datetime
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "run_id": self.run_id,
+            "at": self.at.isoformat(timespec="seconds"),
+            "data": self.data,
+        }
+
+    def to_sse(self) -> bytes:
+        """One Server-Sent Events message (``id`` lets clients resume with Last-Event-ID)."""
+
+        payload = json.dumps(self.to_dict(), ensure_ascii=False, default=str)
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n".encode("utf-8")
+
+class RunEventLog:
+    """Bounded, thread-safe log of run progress events that readers can wait on.
+
+        Events get increasing ids. ``wait_since`` blocks until an event newer
+        than the given id exists (or the timeout passes); a reader that fell
+        behind by more than ``max_events`` just misses the oldest ones.
+        """
+
+    def __init__(self, max_events: int = 1000) -> None:
+        self._events: deque[RunEvent] = deque(maxlen=max_events)
+        self._changed = threading.Condition()
+        self._last_id = 0
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def publish(self, type: str, run_id: int | None = None, **data: Any) -> RunEvent:
+        with self._changed:
+            self._last_id += 1
+            event = RunEvent(id=self._last_id, type=type, run_id=run_id, at=datetime.now().astimezone(), data=data)
+            self._events.append(event)
+            self._changed.notify_all()
+        return event
+
+    def wait_since(self, last_id: int, timeout: float) -> list[RunEvent]:
+        with self._changed:
+            self._changed.wait_for(lambda: self._last_id > last_id, timeout=timeout)
+            return [event for event in self._events if event.id > last_id]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from datetime import date
 
 
 # helpdesk
@@ -9,12 +10,47 @@ class HelpdeskAPIConfig:
     api_key: str
     api_secret: str
     timeout_seconds: float = 10.0
+    # None = single request for the whole set
+    page_size: int | None = None
+    prefetch_pages: bool = True
+    incremental: bool = False
+    # parse the single-request body incrementally (flat memory on large exports)
+    stream_json: bool = False
+    # per-field source paths overriding DEFAULT_FIELD_MAPPING, e.g. (("id", ("key",)),)
+    field_mapping: tuple[tuple[str, tuple[str, ...]], ...] = ()
+
+# one helpdesk tenant when several are ingested into one run
+@dataclass(frozen=True)
+class HelpdeskSourceConfig:
+    name: str
+    api: HelpdeskAPIConfig
+
+# shared HTTP transport (helpdesk + service catalog)
+@dataclass(frozen=True)
+class HTTPTransportConfig:
+    pool_connections: int = 4
+    pool_maxsize: int = 10
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff_seconds: float = 30.0
+
+# record/replay of external I/O (off | record | replay)
+@dataclass(frozen=True)
+class CassetteConfig:
+    mode: str = "off"
+    directory: str = "cassettes"
 
 # service catalog
 @dataclass(frozen=True)
 class ServiceCatalogConfig:
     url: str
     timeout_seconds: float = 10.0
+    # on-disk cache for conditional fetches / stale-if-error (None = disabled)
+    cache_path: str | None = None
+    # oldest cached copy served when the endpoint fails (None = any age)
+    cache_max_stale_seconds: float | None = None
+    # binary snapshots of parsed catalogs keyed by body hash (None = disabled)
+    snapshot_dir: str | None = None
 
 # LLM
 @dataclass(frozen=True)
@@ -26,6 +62,18 @@ class LLMConfig:
     temperature: float = 0.0
     top_p: float = 1.0
     top_k: int = 1
+    request_timeout_seconds: float = 120.0
+    hedge_enabled: bool = False
+    hedge_budget_ratio: float = 0.1
+
+# LLM run budget (None = unlimited)
+@dataclass(frozen=True)
+class LLMBudgetConfig:
+    max_input_tokens: int | None = None
+    max_output_tokens: int | None = None
+    max_cost: float | None = None
+    input_price_per_million: float = 0.0
+    output_price_per_million: float = 0.0
 
 # email
 @dataclass
@@ -41,6 +89,43 @@ class EmailConfig:
     codebase_url: str
     email_title: str
 
+# pipeline run
+@dataclass(frozen=True)
+class PipelineConfig:
+    deadline_seconds: float | None = None
+    deadline_reserve_seconds: float = 30.0
+    early_report_max_priority: int | None = None
+    # one report file per helpdesk source (multi-source runs only)
+    split_report_by_source: bool = False
+    # reuse stored classifications of unchanged tickets (catalog-diff invalidation)
+    classification_store: bool = False
+    # persisted table of confirmed LLM spellings of catalog pairs
+    catalog_aliases: bool = False
+
+# business calendar of SLA due dates (default: calendar time, 24x7 UTC)
+@dataclass(frozen=True)
+class SLACalendarConfig:
+    timezone: str = "UTC"
+    # date.weekday() numbers, 0 = Monday
+    workdays: tuple[int, ...] = (0, 1, 2, 3, 4, 5, 6)
+    # working hours as minutes after local midnight
+    start_minute: int = 0
+    end_minute: int = 24 * 60
+    holidays: tuple[date, ...] = ()
+
+# long-running daemon (app.cmd.daemon)
+@dataclass(frozen=True)
+class DaemonConfig:
+    # interval ("15m", "900", "@every 1h") or 5-field cron expression
+    schedule: str = "15m"
+    # background Service Catalog refresh between runs
+    catalog_refresh_seconds: float = 300.0
+    run_on_start: bool = False
+    # local HTTP control API (None = disabled)
+    control_port: int | None = None
+    control_host: str = "127.0.0.1"
+    control_token: str | None = None
+
 # db
 @dataclass(frozen=True)
 class ReportLogConfig:
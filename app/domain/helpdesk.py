@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass(slots=True)
@@ -10,4 +11,11 @@ class HelpdeskRequest:
     request_category: str | None = None
     request_type: str | None = None
     sla_unit: str | None = None
-    sla_value: int | None = None
\ No newline at end of file
+    sla_value: int | None = None
+    # scheduling signals (priority 1 = most urgent)
+    priority: int | None = None
+    created_at: datetime | None = None
+    # helpdesk tenant the request came from (multi-source runs)
+    source: str | None = None
+    # SLA due date over the business calendar (timezone of that calendar)
+    sla_due_at: datetime | None = None
@@ -0,0 +1,243 @@
+from __future__ import annotations
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+import httpx
+from app.config import HelpdeskAPIConfig, ServiceCatalogConfig
+from app.domain.service_catalog import ServiceCatalog
+from app.application.dto.fetched_helpdesk_request import FetchedHelpdeskRequest
+from app.infrastructure.async_http_transport import AsyncRetryingTransport, build_async_client
+from app.infrastructure.helpdesk_client import (
+    HelpdeskAPIError,
+    _SHAPE_SAMPLE_ITEMS,
+    _build_mapper,
+    _extract_items,
+    _extract_pagination,
+    _map_item,
+    _page_params,
+)
+from app.infrastructure.helpdesk_field_mapping import HelpdeskFieldMapper
+from app.infrastructure.service_catalog_client import ServiceCatalogError, _map_catalog, _parse_catalog_yaml
+from app.shared.errors import ServiceCatalogLoadError
+
+
+logger = logging.getLogger(__name__)
+
+class AsyncHelpdeskClient:
+    """Asyncio counterpart of HelpdeskClient on a shared ``httpx.AsyncClient``.
+
+        Response parsing and field mapping reuse the HelpdeskClient module
+        helpers (no requests session is built). With ``page_size`` and
+        page-number paging, up to ``max_concurrent_pages`` pages are requested
+        at once; cursor paging stays sequential because each cursor comes from
+        the previous page.
+        """
+
+    def __init__(
+        self,
+        config: HelpdeskAPIConfig,
+        client: httpx.AsyncClient | None = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff_seconds: float = 30.0,
+        max_concurrent_pages: int = 4,
+    ) -> None:
+        self._config = config
+        self._client = client if client is not None else build_async_client()
+        # ETag of the latest single-request response (for conditional refetch)
+        self.last_etag: str | None = None
+        self._mapper = _build_mapper(config)
+        self._async_transport = AsyncRetryingTransport(
+            "Helpdesk API",
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            max_backoff_seconds=max_backoff_seconds,
+        )
+        self._max_concurrent_pages = max(1, max_concurrent_pages)
+
+    async def fetch_requests_async(
+        self,
+        updated_since: datetime | None = None,
+        etag: str | None = None,
+    ) -> list[FetchedHelpdeskRequest]:
+        """Fetch helpdesk requests without blocking the event loop."""
+
+        filters: dict[str, Any] = {}
+        if updated_since is not None:
+            filters["updated_since"] = updated_since.isoformat()
+
+        if not self._config.page_size:
+            headers = {"If-None-Match": etag} if etag else None
+            data = await self._post_json_async(filters, headers)
+            if data is None:
+                logger.info("Helpdesk API reported no changes since the last run (304 Not Modified)")
+                return []
+            items = _extract_items(data)
+        else:
+            items = await self._fetch_pages_async(self._config.page_size, filters)
+
+        if self._mapper.shape is None:
+            self._mapper.observe(items[:_SHAPE_SAMPLE_ITEMS])
+        result = [_map_item(item, self._mapper) for item in items]
+        logger.info("Fetched %d helpdesk requests (async)", len(result))
+        return result
+
+    async def _post_json_async(
+        self,
+        extra_payload: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        payload: dict[str, Any] = {
+            "api_key": self._config.api_key,
+            "api_secret": self._config.api_secret,
+        }
+        if extra_payload:
+            payload.update(extra_payload)
+
+        try:
+            response = await self._async_transport.call_async(
+                lambda: self._client.post(
+                    self._config.url,
+                    json=payload,
+                    headers=headers,
+                    timeout=self._config.timeout_seconds,
+                )
+            )
+        except httpx.HTTPError as exc:
+            msg = f"Error calling Helpdesk API (max {self._async_transport.max_retries} attempts): {exc}"
+            logger.error(msg)
+            raise HelpdeskAPIError(msg) from exc
+
+        self.last_etag = response.headers.get("ETag")
+        if response.status_code == 304:
+            return None
+
+        try:
+            return response.json()
+        except ValueError as exc:
+            msg = "Failed to parse Helpdesk API response as JSON"
+            logger.error(msg)
+            raise HelpdeskAPIError(msg) from exc
+
+    async def _fetch_pages_async(self, page_size: int, filters: dict[str, Any]) -> list[dict[str, Any]]:
+        first = await self._post_json_async(_page_params(1, page_size, None, filters))
+        if first is None:
+            return []
+
+        items = _extract_items(first)
+        next_cursor, has_more = _extract_pagination(first)
+
+        # an explicit stop (has_more=false or an empty page) wins over a next cursor
+        if has_more is False or not items:
+            return items
+        if next_cursor is not None:
+            return items + await self._follow_cursor_async(page_size, filters, next_cursor)
+        if len(items) < page_size:
+            return items
+
+        # page-number paging: request a window of pages at once, stop at the first short page
+        first_ids = {_first_id(items, self._mapper)}
+        page = 2
+        while True:
+            window = range(page, page + self._max_concurrent_pages)
+            pages = await asyncio.gather(
+                *(self._post_json_async(_page_params(p, page_size, None, filters)) for p in window)
+            )
+            for number, data in zip(window, pages):
+                page_items = [] if data is None else _extract_items(data)
+                first_id = _first_id(page_items, self._mapper)
+                if first_id is not None and first_id in first_ids:
+                    logger.warning(
+                        "Helpdesk API page %d repeats an earlier page (first id %r); "
+                        "assuming pagination is not supported and stopping",
+                        number,
+                        first_id,
+                    )
+                    return items
+                first_ids.add(first_id)
+                items.extend(page_items)
+
+                _, page_has_more = _extract_pagination(data)
+                if page_has_more is False or len(page_items) < page_size:
+                    return items
+            page += self._max_concurrent_pages
+
+    async def _follow_cursor_async(
+        self,
+        page_size: int,
+        filters: dict[str, Any],
+        cursor: str,
+    ) -> list[dict[str, Any]]:
+        items: list[dict[str, Any]] = []
+        seen_cursors = {cursor}
+        page = 2
+        while True:
+            data = await self._post_json_async(_page_params(page, page_size, cursor, filters))
+            if data is None:
+                return items
+            page_items = _extract_items(data)
+            items.extend(page_items)
+
+            next_cursor, has_more = _extract_pagination(data)
+            if next_cursor is None or next_cursor in seen_cursors or has_more is False or not page_items:
+                return items
+            seen_cursors.add(next_cursor)
+            cursor = next_cursor
+            page += 1
+
+class AsyncServiceCatalogClient:
+    """Asyncio counterpart of ServiceCatalogClient on a shared ``httpx.AsyncClient``.
+
+        Parsing and mapping reuse the ServiceCatalogClient module helpers.
+        """
+
+    def __init__(
+        self,
+        config: ServiceCatalogConfig,
+        client: httpx.AsyncClient | None = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff_seconds: float = 30.0,
+    ) -> None:
+        self._config = config
+        self._client = client if client is not None else build_async_client()
+        self._async_transport = AsyncRetryingTransport(
+            "Service Catalog",
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            max_backoff_seconds=max_backoff_seconds,
+        )
+
+    async def fetch_catalog_async(self) -> ServiceCatalog:
+        """Download (async) and parse the Service Catalog; same errors as fetch_catalog."""
+
+        try:
+            response = await self._async_transport.call_async(
+                lambda: self._client.get(self._config.url, timeout=self._config.timeout_seconds)
+            )
+            return _map_catalog(_parse_catalog_yaml(response.text))
+        except ServiceCatalogError as exc:
+            raise ServiceCatalogLoadError(str(exc)) from exc
+        except (httpx.HTTPError, ValueError, TypeError, KeyError) as exc:
+            logger.error("Error calling Service Catalog endpoint: %s", exc)
+            raise ServiceCatalogLoadError("Failed to load Service Catalog") from exc
+
+async def fetch_helpdesk_and_catalog_async(
+    helpdesk_client: AsyncHelpdeskClient,
+    catalog_client: AsyncServiceCatalogClient,
+) -> tuple[list[FetchedHelpdeskRequest], ServiceCatalog]:
+    """Fetch helpdesk requests and the Service Catalog concurrently on one event loop."""
+
+    try:
+        requests_, catalog = await asyncio.gather(
+            helpdesk_client.fetch_requests_async(),
+            catalog_client.fetch_catalog_async(),
+        )
+    finally:
+        helpdesk_client._async_transport.log_stats()
+        catalog_client._async_transport.log_stats()
+    return requests_, catalog
+
+def _first_id(items: list[dict[str, Any]], mapper: HelpdeskFieldMapper) -> str | None:
+    return mapper.request_id(items[0]) if items else None
@@ -0,0 +1,73 @@
+from __future__ import annotations
+import asyncio
+import importlib.util
+import logging
+import time
+from collections.abc import Awaitable, Callable
+import httpx
+from app.infrastructure.http_transport import RetryingTransport, _is_retryable
+
+
+logger = logging.getLogger(__name__)
+
+def http2_available() -> bool:
+    """HTTP/2 in httpx needs the optional ``h2`` package (``httpx[http2]``)."""
+
+    return importlib.util.find_spec("h2") is not None
+
+def build_async_client(
+    pool_connections: int = 4,
+    pool_maxsize: int = 10,
+    http2: bool | None = None,
+) -> httpx.AsyncClient:
+    """Create one pooled ``httpx.AsyncClient`` to share between the async clients.
+
+        ``http2=None`` enables HTTP/2 when ``h2`` is installed and falls back to
+        HTTP/1.1 keep-alive otherwise. Timeouts are passed per request.
+        """
+
+    if http2 is None:
+        http2 = http2_available()
+    elif http2 and not http2_available():
+        logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+        http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_connections,
+        ),
+        headers={"Accept-Encoding": "gzip, deflate"},
+    )
+
+class AsyncRetryingTransport(RetryingTransport):
+    """``RetryingTransport`` for coroutine senders; backoff waits on the event loop."""
+
+    async def call_async(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        with self._lock:
+            self.stats.calls += 1
+
+        for attempt in range(1, self.max_retries + 1):
+            started = time.monotonic()
+            response: httpx.Response | None = None
+            try:
+                response = await send()
+                # 304 is an answer to a conditional request, not a failure
+                if response.status_code != 304:
+                    response.raise_for_status()
+            except httpx.HTTPError as exc:
+                final = attempt == self.max_retries or not _is_retryable(exc)
+                self._record(started, failed=final)
+                if final:
+                    raise
+                if response is not None:
+                    await response.aclose()
+                await asyncio.sleep(self._prepare_retry(attempt, exc))
+                continue
+
+            elapsed = self._record(started, failed=False)
+            logger.debug("%s attempt %d succeeded in %.3fs", self.name, attempt, elapsed)
+            return response
+
+        raise RuntimeError(f"{self.name}: max_retries must be >= 1")
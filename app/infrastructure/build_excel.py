@@ -56,7 +56,9 @@ def build_excel(requests: Iterable[HelpdeskRequest]) -> bytes:
         "short_description",
         "sla_value",
         "sla_unit",
+        "sla_due_at",
     ]
+    due_column = headers.index("sla_due_at") + 1
     ws.append(headers)
 
     # write data rows
@@ -69,8 +71,12 @@ def build_excel(requests: Iterable[HelpdeskRequest]) -> bytes:
                 req.short_description or "",
                 req.sla_value if req.sla_value is not None else "",
                 req.sla_unit or "",
+                # Excel has no timezones: write the calendar's local wall time
+                req.sla_due_at.replace(tzinfo=None) if req.sla_due_at is not None else "",
             ]
         )
+        if req.sla_due_at is not None:
+            ws.cell(row=ws.max_row, column=due_column).number_format = "yyyy-mm-dd hh:mm"
 
     # apply styles
     for row_idx, row in enumerate(
@@ -0,0 +1,248 @@
+from __future__ import annotations
+import base64
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from app.application.ports.report_email_sender_port import ReportEmailSenderPort
+
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+# never part of a fingerprint nor written to disk
+_SECRET_KEYS = frozenset(("api_key", "api_secret", "password", "token"))
+
+# transport headers that no longer describe the stored (decoded) body
+_DROPPED_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding", "connection"))
+
+class CassetteMissError(RuntimeError):
+    """Replay mode found no recorded interaction for a request."""
+
+class Cassette:
+    """Stores external interactions under ``directory`` keyed by request fingerprint.
+
+        Each fingerprint (``<kind>/<sha256>.json``) holds the responses in the
+        order they were recorded, so retried calls replay their failures too;
+        the last response repeats once the list is exhausted. A ``loose`` key
+        (e.g. method + URL) lets replay fall back to the recordings of the same
+        endpoint when volatile request fields such as filters changed.
+        """
+
+    def __init__(self, directory: str | Path, mode: str) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', got {mode!r}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self._lock = threading.Lock()
+        # fingerprint -> replay position / fingerprints written in this recording session
+        self._positions: dict[str, int] = {}
+        self._recorded: set[str] = set()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(self, kind: str, key: Mapping[str, Any], response: Mapping[str, Any], loose: str = "") -> None:
+        fingerprint = _fingerprint(kind, key)
+        path = self._path(kind, fingerprint)
+        with self._lock:
+            entry: dict[str, Any]
+            if fingerprint in self._recorded and path.exists():
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            else:
+                # first call of this session replaces an older recording
+                entry = {"kind": kind, "key": key, "loose": loose, "responses": []}
+                self._recorded.add(fingerprint)
+            entry["responses"].append(dict(response))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(entry, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    def replay(self, kind: str, key: Mapping[str, Any], loose: str = "") -> dict[str, Any]:
+        fingerprint = _fingerprint(kind, key)
+        path = self._path(kind, fingerprint)
+        if not path.exists() and loose:
+            fallback = self._find_loose(kind, loose)
+            if fallback is not None:
+                logger.warning("Cassette: no exact %s recording; replaying %s for %s", kind, fallback.name, loose)
+                path, fingerprint = fallback, fallback.stem
+        if not path.exists():
+            raise CassetteMissError(f"No recorded {kind} interaction {fingerprint[:12]} in {self.directory}")
+
+        responses = json.loads(path.read_text(encoding="utf-8"))["responses"]
+        with self._lock:
+            position = self._positions.get(fingerprint, 0)
+            self._positions[fingerprint] = position + 1
+        return dict(responses[min(position, len(responses) - 1)])
+
+    def _path(self, kind: str, fingerprint: str) -> Path:
+        return self.directory / kind / f"{fingerprint}.json"
+
+    def _find_loose(self, kind: str, loose: str) -> Path | None:
+        for path in sorted((self.directory / kind).glob("*.json")):
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if entry.get("loose") == loose:
+                return path
+        return None
+
+class CassetteHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that records responses to, or replays them from, a cassette."""
+
+    def __init__(self, cassette: Cassette, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._cassette = cassette
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        key = {"method": request.method, "url": request.url, "body": _redacted_body(request.body)}
+        loose = f"{request.method} {request.url}"
+
+        if self._cassette.replaying:
+            return _build_response(request, self._cassette.replay("http", key, loose=loose))
+
+        response = super().send(request, *args, **kwargs)
+        content = response.content
+        self._cassette.record(
+            "http",
+            key,
+            {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in _DROPPED_HEADERS
+                },
+                "body": base64.b64encode(content).decode("ascii"),
+            },
+            loose=loose,
+        )
+        return response
+
+class CassetteGenAIClient:
+    """Stands in for ``genai.Client``: ``models.generate_content`` goes through the cassette.
+
+        Only the response text and token usage are stored. ``models.get`` (the
+        warm-up lookup) is a no-op on replay. The real client is built lazily,
+        so replay never creates one.
+        """
+
+    def __init__(self, cassette: Cassette, client_factory: Callable[[], Any]) -> None:
+        self.models = _CassetteModels(cassette, client_factory)
+
+class _CassetteModels:
+    def __init__(self, cassette: Cassette, client_factory: Callable[[], Any]) -> None:
+        self._cassette = cassette
+        self._client_factory = client_factory
+        self._client: Any = None
+        self._lock = threading.Lock()
+
+    def get(self, model: str) -> Any:
+        if self._cassette.replaying:
+            return None
+        return self._real().models.get(model=model)
+
+    def generate_content(self, model: str, contents: Any, config: Any = None) -> Any:
+        key = {"model": model, "contents": contents, "config": _config_key(config)}
+        if self._cassette.replaying:
+            stored = self._cassette.replay("llm", key)
+            usage = stored.get("usage")
+            return SimpleNamespace(
+                text=stored.get("text"),
+                usage_metadata=None if usage is None else SimpleNamespace(**usage),
+            )
+
+        response = self._real().models.generate_content(model=model, contents=contents, config=config)
+        usage_metadata = getattr(response, "usage_metadata", None)
+        self._cassette.record(
+            "llm",
+            key,
+            {
+                "text": getattr(response, "text", None),
+                "usage": None if usage_metadata is None else {
+                    name: getattr(usage_metadata, name, None)
+                    for name in ("prompt_token_count", "candidates_token_count", "thoughts_token_count")
+                },
+            },
+        )
+        return response
+
+    def _real(self) -> Any:
+        with self._lock:
+            if self._client is None:
+                self._client = self._client_factory()
+            return self._client
+
+class CassetteEmailSender(ReportEmailSenderPort):
+    """Records report emails on the way to ``inner``; on replay nothing is sent."""
+
+    def __init__(self, inner: ReportEmailSenderPort, cassette: Cassette) -> None:
+        self._inner = inner
+        self._cassette = cassette
+
+    def send_report_email(
+        self,
+        subject: str,
+        body: str,
+        attachments: list[Path],
+        html_body: str | None = None,
+    ) -> None:
+        names = [path.name for path in attachments]
+        if self._cassette.replaying:
+            logger.info("Cassette replay: email %r with attachment(s) %s not sent", subject, names)
+            return
+
+        self._inner.send_report_email(subject, body, attachments, html_body=html_body)
+        self._cassette.record(
+            "smtp",
+            {"subject": subject, "attachments": names},
+            {"body": body, "html_body": html_body},
+        )
+
+def _fingerprint(kind: str, key: Mapping[str, Any]) -> str:
+    canonical = json.dumps({"kind": kind, "key": key}, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def _redacted_body(body: Any) -> Any:
+    """JSON bodies without credentials; other bodies by digest."""
+
+    if body is None:
+        return None
+    raw = body if isinstance(body, bytes) else str(body).encode("utf-8")
+    try:
+        parsed = json.loads(raw)
+    except ValueError:
+        return hashlib.sha256(raw).hexdigest()
+    if isinstance(parsed, dict):
+        return {k: v for k, v in parsed.items() if k not in _SECRET_KEYS}
+    return parsed
+
+def _config_key(config: Any) -> Any:
+    if config is None:
+        return None
+    dump = getattr(config, "model_dump", None)
+    if callable(dump):
+        return dump(exclude_none=True, mode="json")
+    return repr(config)
+
+def _build_response(request: requests.PreparedRequest, stored: Mapping[str, Any]) -> requests.Response:
+    response = requests.Response()
+    response.status_code = int(stored["status"])
+    response.reason = stored.get("reason") or ""
+    response.headers = CaseInsensitiveDict(stored.get("headers") or {})
+    response._content = base64.b64decode(stored.get("body") or "")
+    response._content_consumed = True  # type: ignore[attr-defined]
+    response.url = request.url or ""
+    response.request = request
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
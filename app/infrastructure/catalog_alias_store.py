@@ -0,0 +1,95 @@
+from __future__ import annotations
+import sqlite3
+from collections.abc import Mapping
+from datetime import datetime
+from pathlib import Path
+from app.application.catalog_index import Pair
+
+
+class CatalogAliasStoreError(RuntimeError):
+    """Raised when the catalog alias store cannot be accessed."""
+
+class SQLiteCatalogAliasStore:
+    """SQLite-based table of confirmed raw LLM spellings of catalog pairs, per catalog fingerprint.
+        """
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """Ensure the 'catalog_aliases' table exists."""
+
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS catalog_aliases (
+                        catalog_fingerprint TEXT NOT NULL,
+                        raw_category TEXT NOT NULL,
+                        raw_type TEXT NOT NULL,
+                        request_category TEXT NOT NULL,
+                        request_type TEXT NOT NULL,
+                        hits INTEGER NOT NULL,
+                        first_seen TEXT NOT NULL,
+                        last_seen TEXT NOT NULL,
+                        PRIMARY KEY (catalog_fingerprint, raw_category, raw_type)
+                    )
+                    """
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise CatalogAliasStoreError("Failed to initialize catalog alias store database") from exc
+
+    def load(self, catalog_fingerprint: str) -> dict[Pair, Pair]:
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT raw_category, raw_type, request_category, request_type FROM catalog_aliases "
+                    "WHERE catalog_fingerprint = ?",
+                    (catalog_fingerprint,),
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise CatalogAliasStoreError("Failed to read from catalog alias store") from exc
+        return {(row[0], row[1]): (row[2], row[3]) for row in rows}
+
+    def record(self, catalog_fingerprint: str, hits: Mapping[Pair, tuple[Pair, int]]) -> None:
+        if not hits:
+            return
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (catalog_fingerprint, raw[0], raw[1], pair[0], pair[1], count, now, now)
+            for raw, (pair, count) in hits.items()
+        ]
+        try:
+            conn = self._connect()
+            try:
+                conn.executemany(
+                    """
+                    INSERT INTO catalog_aliases
+                        (catalog_fingerprint, raw_category, raw_type, request_category, request_type,
+                         hits, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (catalog_fingerprint, raw_category, raw_type) DO UPDATE SET
+                        request_category = excluded.request_category,
+                        request_type = excluded.request_type,
+                        hits = hits + excluded.hits,
+                        last_seen = excluded.last_seen
+                    """,
+                    rows,
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise CatalogAliasStoreError("Failed to write to catalog alias store") from exc
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path)
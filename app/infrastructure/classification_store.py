@@ -0,0 +1,151 @@
+from __future__ import annotations
+import json
+import sqlite3
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from app.application.dto.stored_classification import StoredClassification
+from app.domain.service_catalog import ServiceCatalog
+from app.infrastructure.service_catalog_json import catalog_from_json, catalog_to_json
+
+
+# SQLite default limit for bound parameters is 999 on older builds
+_CHUNK = 500
+
+class ClassificationStoreError(RuntimeError):
+    """Raised when the classification store cannot be accessed."""
+
+class SQLiteClassificationStore:
+    """SQLite-based store of per-ticket classifications and the catalog they were made against.
+        """
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """Ensure the 'classifications' and 'classification_catalog' tables exist."""
+
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._execute_script(
+            """
+            CREATE TABLE IF NOT EXISTS classifications (
+                request_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                request_category TEXT NOT NULL,
+                request_type TEXT NOT NULL,
+                classified_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS classifications_pair
+                ON classifications (request_category, request_type);
+            CREATE TABLE IF NOT EXISTS classification_catalog (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                catalog_json TEXT NOT NULL,
+                saved_at TEXT NOT NULL
+            );
+            """,
+            "Failed to initialize classification store database",
+        )
+
+    def get_many(self, request_ids: Sequence[str]) -> dict[str, StoredClassification]:
+        result: dict[str, StoredClassification] = {}
+        try:
+            conn = self._connect()
+            try:
+                for start in range(0, len(request_ids), _CHUNK):
+                    chunk = list(request_ids[start:start + _CHUNK])
+                    rows = conn.execute(
+                        "SELECT request_id, content_hash, request_category, request_type FROM classifications "
+                        f"WHERE request_id IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                    for row in rows:
+                        result[row[0]] = StoredClassification(*row)
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise ClassificationStoreError("Failed to read from classification store") from exc
+        return result
+
+    def save_many(self, records: Sequence[StoredClassification]) -> None:
+        now = datetime.now().isoformat(timespec="seconds")
+        self._execute_many(
+            """
+            INSERT OR REPLACE INTO classifications
+                (request_id, content_hash, request_category, request_type, classified_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [(r.request_id, r.content_hash, r.request_category, r.request_type, now) for r in records],
+        )
+
+    def rename_pairs(self, renamed: Mapping[tuple[str, str], tuple[str, str]]) -> int:
+        return self._execute_many(
+            """
+            UPDATE classifications SET request_category = ?, request_type = ?
+            WHERE request_category = ? AND request_type = ?
+            """,
+            [(new[0], new[1], old[0], old[1]) for old, new in renamed.items()],
+        )
+
+    def invalidate_pairs(self, pairs: Iterable[tuple[str, str]]) -> int:
+        return self._execute_many(
+            "DELETE FROM classifications WHERE request_category = ? AND request_type = ?",
+            list(pairs),
+        )
+
+    def invalidate_categories(self, categories: Iterable[str]) -> int:
+        return self._execute_many(
+            "DELETE FROM classifications WHERE request_category = ?",
+            [(category,) for category in categories],
+        )
+
+    def load_catalog(self) -> ServiceCatalog | None:
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT catalog_json FROM classification_catalog WHERE id = 1").fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise ClassificationStoreError("Failed to read from classification store") from exc
+        if row is None:
+            return None
+        return catalog_from_json(json.loads(row[0]))
+
+    def save_catalog(self, catalog: ServiceCatalog) -> None:
+        self._execute_many(
+            "INSERT OR REPLACE INTO classification_catalog (id, catalog_json, saved_at) VALUES (1, ?, ?)",
+            [(json.dumps(catalog_to_json(catalog), ensure_ascii=False), datetime.now().isoformat(timespec="seconds"))],
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path)
+
+    def _execute_many(self, sql: str, rows: Sequence[tuple[Any, ...]]) -> int:
+        """Run ``sql`` for every row in one transaction; return the number of changed rows."""
+
+        if not rows:
+            return 0
+        try:
+            conn = self._connect()
+            try:
+                before = conn.total_changes
+                conn.executemany(sql, rows)
+                conn.commit()
+                return conn.total_changes - before
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise ClassificationStoreError("Failed to write to classification store") from exc
+
+    def _execute_script(self, script: str, error: str) -> None:
+        try:
+            conn = self._connect()
+            try:
+                conn.executescript(script)
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise ClassificationStoreError(error) from exc
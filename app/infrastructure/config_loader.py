@@ -1,13 +1,26 @@
 from __future__ import annotations
 import os
+from datetime import date
+from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from dotenv import load_dotenv
 from app.config import (
     HelpdeskAPIConfig,
+    HelpdeskSourceConfig,
+    HTTPTransportConfig,
+    CassetteConfig,
     ServiceCatalogConfig,
     LLMConfig,
+    LLMBudgetConfig,
     EmailConfig,
     ReportLogConfig,
+    PipelineConfig,
+    SLACalendarConfig,
+    DaemonConfig,
 )
+from app.infrastructure.helpdesk_field_mapping import build_field_mapping
+from app.infrastructure.cassette import CASSETTE_MODES
+from app.shared.schedule import parse_schedule
 
 
 load_dotenv()
@@ -18,22 +31,143 @@ def _get_required_env(name: str) -> str:
         raise RuntimeError(f"Environment variable {name} is required but not set")
     return value
 
-def load_helpdesk_config() -> HelpdeskAPIConfig:
-    url = _get_required_env("HELPDESK_API_URL")
-    api_key = _get_required_env("HELPDESK_API_KEY")
-    api_secret = _get_required_env("HELPDESK_API_SECRET")
+def _get_optional_number(name: str, cast: type[int] | type[float]) -> int | float | None:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return None
+    try:
+        number = cast(value)
+    except ValueError as exc:
+        raise RuntimeError(f"{name} must be {cast.__name__}") from exc
+    if number < 0:
+        raise RuntimeError(f"{name} must be >= 0")
+    return number
+
+def load_helpdesk_config(prefix: str = "HELPDESK_") -> HelpdeskAPIConfig:
+    """Load one helpdesk endpoint; with a source prefix, unset options fall back to ``HELPDESK_*``."""
+
+    def env(name: str, default: str = "") -> str:
+        value = os.getenv(prefix + name)
+        if value is None and prefix != "HELPDESK_":
+            value = os.getenv("HELPDESK_" + name)
+        return default if value is None else value
+
+    url = _get_required_env(f"{prefix}API_URL")
+    api_key = _get_required_env(f"{prefix}API_KEY")
+    api_secret = _get_required_env(f"{prefix}API_SECRET")
+
+    page_size_str = env("PAGE_SIZE").strip()
+    try:
+        page_size = int(page_size_str) if page_size_str else None
+    except ValueError as exc:
+        raise RuntimeError(f"{prefix}PAGE_SIZE must be int") from exc
+    if page_size is not None and page_size < 1:
+        raise RuntimeError(f"{prefix}PAGE_SIZE must be >= 1 (leave empty to disable paging)")
+    prefetch_pages = env("PREFETCH_PAGES", "true").lower() in ("1", "true", "yes", "y")
+    incremental = env("INCREMENTAL", "false").lower() in ("1", "true", "yes", "y")
+    stream_json = env("STREAM_JSON", "false").lower() in ("1", "true", "yes", "y")
 
     return HelpdeskAPIConfig(
         url=url,
         api_key=api_key,
         api_secret=api_secret,
+        page_size=page_size,
+        prefetch_pages=prefetch_pages,
+        incremental=incremental,
+        stream_json=stream_json,
+        field_mapping=_load_field_mapping(env("FIELD_MAPPING_FILE").strip()),
+    )
+
+def load_helpdesk_sources_config() -> list[HelpdeskSourceConfig]:
+    """Load the helpdesk tenants listed in ``HELPDESK_SOURCES`` (e.g. ``emea,apac``).
+
+        Each source reads ``HELPDESK_<NAME>_API_URL``/``_API_KEY``/``_API_SECRET``
+        and may override any other ``HELPDESK_*`` option the same way. Without
+        ``HELPDESK_SOURCES`` the single ``HELPDESK_API_*`` endpoint is returned
+        as source ``default``.
+        """
+
+    names = [name.strip() for name in os.getenv("HELPDESK_SOURCES", "").split(",") if name.strip()]
+    if not names:
+        return [HelpdeskSourceConfig(name="default", api=load_helpdesk_config())]
+
+    sources: list[HelpdeskSourceConfig] = []
+    for name in names:
+        if not name.replace("_", "").replace("-", "").isalnum():
+            raise RuntimeError(f"HELPDESK_SOURCES entry {name!r} must be alphanumeric (with - or _)")
+        if any(source.name == name for source in sources):
+            raise RuntimeError(f"HELPDESK_SOURCES lists {name!r} more than once")
+        prefix = f"HELPDESK_{name.upper().replace('-', '_')}_"
+        sources.append(HelpdeskSourceConfig(name=name, api=load_helpdesk_config(prefix)))
+    return sources
+
+def _load_field_mapping(path: str) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Read a YAML/JSON ``{field: path | [paths]}`` file into validated config overrides."""
+
+    if not path:
+        return ()
+
+    import yaml
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError) as exc:
+        raise RuntimeError(f"Cannot read HELPDESK_FIELD_MAPPING_FILE {path!r}: {exc}") from exc
+
+    if not isinstance(raw, dict):
+        raise RuntimeError("HELPDESK_FIELD_MAPPING_FILE must contain a mapping of field -> path(s)")
+    try:
+        mapping = build_field_mapping(raw)
+    except ValueError as exc:
+        raise RuntimeError(f"Invalid HELPDESK_FIELD_MAPPING_FILE: {exc}") from exc
+    return tuple((field, mapping[field]) for field in raw)
+
+def load_http_transport_config() -> HTTPTransportConfig:
+    defaults = HTTPTransportConfig()
+
+    pool_connections = _get_optional_number("HTTP_POOL_CONNECTIONS", int)
+    pool_maxsize = _get_optional_number("HTTP_POOL_MAXSIZE", int)
+    max_retries = _get_optional_number("HTTP_MAX_RETRIES", int)
+    backoff_factor = _get_optional_number("HTTP_BACKOFF_FACTOR", float)
+    max_backoff_seconds = _get_optional_number("HTTP_MAX_BACKOFF_SECONDS", float)
+
+    for name, value in (
+        ("HTTP_POOL_CONNECTIONS", pool_connections),
+        ("HTTP_POOL_MAXSIZE", pool_maxsize),
+        ("HTTP_MAX_RETRIES", max_retries),
+    ):
+        if value is not None and value < 1:
+            raise RuntimeError(f"{name} must be >= 1")
+
+    return HTTPTransportConfig(
+        pool_connections=defaults.pool_connections if pool_connections is None else int(pool_connections),
+        pool_maxsize=defaults.pool_maxsize if pool_maxsize is None else int(pool_maxsize),
+        max_retries=defaults.max_retries if max_retries is None else int(max_retries),
+        backoff_factor=defaults.backoff_factor if backoff_factor is None else float(backoff_factor),
+        max_backoff_seconds=(
+            defaults.max_backoff_seconds if max_backoff_seconds is None else float(max_backoff_seconds)
+        ),
+    )
+
+def load_cassette_config() -> CassetteConfig:
+    mode = os.getenv("CASSETTE_MODE", "off").strip().lower() or "off"
+    if mode not in CASSETTE_MODES:
+        raise RuntimeError(f"CASSETTE_MODE must be one of: {', '.join(CASSETTE_MODES)}")
+    return CassetteConfig(
+        mode=mode,
+        directory=os.getenv("CASSETTE_DIR", "").strip() or CassetteConfig.directory,
     )
 
 def load_service_catalog_config() -> ServiceCatalogConfig:
     url = _get_required_env("SERVICE_CATALOG_URL")
+    max_stale = _get_optional_number("SERVICE_CATALOG_CACHE_MAX_STALE_SECONDS", float)
 
     return ServiceCatalogConfig(
         url=url,
+        cache_path=os.getenv("SERVICE_CATALOG_CACHE_PATH", "").strip() or None,
+        cache_max_stale_seconds=None if max_stale is None else float(max_stale),
+        snapshot_dir=os.getenv("SERVICE_CATALOG_SNAPSHOT_DIR", "").strip() or None,
     )
 
 def load_llm_config() -> LLMConfig:
@@ -70,6 +204,21 @@ def load_llm_config() -> LLMConfig:
     if top_k < 1:
         raise RuntimeError("LLM_TOP_K must be >= 1")
 
+    timeout_str = os.getenv("LLM_REQUEST_TIMEOUT_SECONDS", "120")
+    hedge_ratio_str = os.getenv("LLM_HEDGE_BUDGET_RATIO", "0.1")
+    hedge_enabled = os.getenv("LLM_HEDGE_ENABLED", "false").lower() in ("1", "true", "yes", "y")
+
+    try:
+        request_timeout_seconds = float(timeout_str)
+        hedge_budget_ratio = float(hedge_ratio_str)
+    except ValueError as exc:
+        raise RuntimeError("LLM_REQUEST_TIMEOUT_SECONDS/LLM_HEDGE_BUDGET_RATIO must be float") from exc
+
+    if request_timeout_seconds <= 0.0:
+        raise RuntimeError("LLM_REQUEST_TIMEOUT_SECONDS must be > 0.0")
+    if not (0.0 <= hedge_budget_ratio <= 1.0):
+        raise RuntimeError("LLM_HEDGE_BUDGET_RATIO must be in [0.0, 1.0]")
+
     return LLMConfig(
         model_name=model_name,
         api_key=api_key,
@@ -78,6 +227,29 @@ def load_llm_config() -> LLMConfig:
         temperature=temperature,
         top_p=top_p,
         top_k=top_k,
+        request_timeout_seconds=request_timeout_seconds,
+        hedge_enabled=hedge_enabled,
+        hedge_budget_ratio=hedge_budget_ratio,
+    )
+
+def load_llm_budget_config() -> LLMBudgetConfig:
+    max_input_tokens = _get_optional_number("LLM_MAX_INPUT_TOKENS_PER_RUN", int)
+    max_output_tokens = _get_optional_number("LLM_MAX_OUTPUT_TOKENS_PER_RUN", int)
+    max_cost = _get_optional_number("LLM_MAX_COST_PER_RUN", float)
+    input_price = _get_optional_number("LLM_INPUT_PRICE_PER_MILLION", float) or 0.0
+    output_price = _get_optional_number("LLM_OUTPUT_PRICE_PER_MILLION", float) or 0.0
+
+    if max_cost is not None and input_price == 0.0 and output_price == 0.0:
+        raise RuntimeError(
+            "LLM_MAX_COST_PER_RUN requires LLM_INPUT_PRICE_PER_MILLION/LLM_OUTPUT_PRICE_PER_MILLION"
+        )
+
+    return LLMBudgetConfig(
+        max_input_tokens=None if max_input_tokens is None else int(max_input_tokens),
+        max_output_tokens=None if max_output_tokens is None else int(max_output_tokens),
+        max_cost=max_cost,
+        input_price_per_million=float(input_price),
+        output_price_per_million=float(output_price),
     )
 
 def load_email_config() -> EmailConfig:
@@ -114,5 +286,127 @@ def load_report_log_config() -> ReportLogConfig:
     db_path = _get_required_env("REPORT_LOG_DB_PATH")
     return ReportLogConfig(db_path=db_path)
 
+def load_pipeline_config() -> PipelineConfig:
+    deadline_str = os.getenv("PIPELINE_DEADLINE_SECONDS", "")
+    reserve_str = os.getenv("PIPELINE_DEADLINE_RESERVE_SECONDS", "30")
+
+    try:
+        deadline_seconds = float(deadline_str) if deadline_str.strip() else None
+        deadline_reserve_seconds = float(reserve_str)
+    except ValueError as exc:
+        raise RuntimeError(
+            "PIPELINE_DEADLINE_SECONDS/PIPELINE_DEADLINE_RESERVE_SECONDS must be float"
+        ) from exc
+
+    if deadline_seconds is not None and deadline_seconds <= 0.0:
+        raise RuntimeError("PIPELINE_DEADLINE_SECONDS must be > 0.0 (leave empty to disable)")
+    if deadline_reserve_seconds < 0.0:
+        raise RuntimeError("PIPELINE_DEADLINE_RESERVE_SECONDS must be >= 0.0")
+
+    early_report_max_priority = _get_optional_number("PIPELINE_EARLY_REPORT_MAX_PRIORITY", int)
+    if early_report_max_priority is not None and early_report_max_priority < 1:
+        raise RuntimeError("PIPELINE_EARLY_REPORT_MAX_PRIORITY must be >= 1 (leave empty to disable)")
+
+    split_by_source = os.getenv("PIPELINE_SPLIT_REPORT_BY_SOURCE", "false").lower() in ("1", "true", "yes", "y")
+    classification_store = os.getenv("PIPELINE_CLASSIFICATION_STORE", "false").lower() in ("1", "true", "yes", "y")
+    catalog_aliases = os.getenv("PIPELINE_CATALOG_ALIASES", "false").lower() in ("1", "true", "yes", "y")
+
+    return PipelineConfig(
+        deadline_seconds=deadline_seconds,
+        deadline_reserve_seconds=deadline_reserve_seconds,
+        early_report_max_priority=None if early_report_max_priority is None else int(early_report_max_priority),
+        split_report_by_source=split_by_source,
+        classification_store=classification_store,
+        catalog_aliases=catalog_aliases,
+    )
+
+_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+def load_sla_calendar_config() -> SLACalendarConfig:
+    """Business calendar of SLA due dates; unset options keep the 24x7 UTC default."""
+
+    defaults = SLACalendarConfig()
+
+    timezone = os.getenv("SLA_CALENDAR_TIMEZONE", "").strip() or defaults.timezone
+    try:
+        ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise RuntimeError(f"SLA_CALENDAR_TIMEZONE: unknown timezone {timezone!r}") from exc
+
+    workdays_str = os.getenv("SLA_CALENDAR_WORKDAYS", "").strip().lower()
+    workdays = defaults.workdays
+    if workdays_str:
+        names = [name.strip()[:3] for name in workdays_str.split(",") if name.strip()]
+        unknown = [name for name in names if name not in _WEEKDAYS]
+        if unknown or not names:
+            raise RuntimeError("SLA_CALENDAR_WORKDAYS must be a comma-separated list of mon..sun")
+        workdays = tuple(sorted({_WEEKDAYS.index(name) for name in names}))
+
+    hours_str = os.getenv("SLA_CALENDAR_HOURS", "").strip()
+    start_minute, end_minute = defaults.start_minute, defaults.end_minute
+    if hours_str:
+        try:
+            start_str, end_str = hours_str.split("-")
+            start_minute, end_minute = _minute_of_day(start_str), _minute_of_day(end_str)
+        except ValueError as exc:
+            raise RuntimeError("SLA_CALENDAR_HOURS must look like 09:00-17:00") from exc
+        if not 0 <= start_minute < end_minute <= 24 * 60:
+            raise RuntimeError("SLA_CALENDAR_HOURS: start must be before end (end may be 24:00)")
+
+    holiday_strs = os.getenv("SLA_CALENDAR_HOLIDAYS", "").split(",")
+    holidays_file = os.getenv("SLA_CALENDAR_HOLIDAYS_FILE", "").strip()
+    if holidays_file:
+        try:
+            lines = Path(holidays_file).read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            raise RuntimeError(f"SLA_CALENDAR_HOLIDAYS_FILE: cannot read {holidays_file}") from exc
+        # one ISO date per line; '#' starts a comment
+        holiday_strs.extend(line.split("#", 1)[0] for line in lines)
+    try:
+        holidays = tuple(sorted({date.fromisoformat(value.strip()) for value in holiday_strs if value.strip()}))
+    except ValueError as exc:
+        raise RuntimeError("SLA calendar holidays must be ISO dates (YYYY-MM-DD)") from exc
+
+    return SLACalendarConfig(
+        timezone=timezone,
+        workdays=workdays,
+        start_minute=start_minute,
+        end_minute=end_minute,
+        holidays=holidays,
+    )
 
+def _minute_of_day(value: str) -> int:
+    hours, minutes = value.strip().split(":")
+    return int(hours) * 60 + int(minutes)
 
+def load_daemon_config() -> DaemonConfig:
+    defaults = DaemonConfig()
+
+    schedule = os.getenv("DAEMON_SCHEDULE", "").strip() or defaults.schedule
+    try:
+        parse_schedule(schedule)
+    except ValueError as exc:
+        raise RuntimeError(f"DAEMON_SCHEDULE is not an interval or cron expression: {exc}") from exc
+
+    refresh = _get_optional_number("DAEMON_CATALOG_REFRESH_SECONDS", float)
+    if refresh is not None and refresh <= 0.0:
+        raise RuntimeError("DAEMON_CATALOG_REFRESH_SECONDS must be > 0.0")
+
+    run_on_start = os.getenv("DAEMON_RUN_ON_START", "false").lower() in ("1", "true", "yes", "y")
+
+    control_port = _get_optional_number("DAEMON_CONTROL_PORT", int)
+    if control_port is not None and not 0 < control_port < 65536:
+        raise RuntimeError("DAEMON_CONTROL_PORT must be 1..65535 (leave empty to disable)")
+    control_host = os.getenv("DAEMON_CONTROL_HOST", "").strip() or defaults.control_host
+    control_token = os.getenv("DAEMON_CONTROL_TOKEN", "").strip() or None
+    if control_port is not None and control_token is None and control_host not in ("127.0.0.1", "localhost", "::1"):
+        raise RuntimeError("DAEMON_CONTROL_TOKEN is required when the control API listens beyond localhost")
+
+    return DaemonConfig(
+        schedule=schedule,
+        catalog_refresh_seconds=defaults.catalog_refresh_seconds if refresh is None else float(refresh),
+        run_on_start=run_on_start,
+        control_port=None if control_port is None else int(control_port),
+        control_host=control_host,
+        control_token=control_token,
+    )
@@ -3,6 +3,8 @@ import logging
 import mimetypes
 import smtplib
 import ssl
+import threading
+import time
 from email.message import EmailMessage
 from pathlib import Path
 from app.config import EmailConfig
@@ -12,9 +14,54 @@ from app.shared.errors import EmailSendError
 
 logger = logging.getLogger(__name__)
 
+# a warmed-up connection older than this is not reused (servers drop idle clients)
+_WARM_CONNECTION_MAX_AGE_SECONDS = 120.0
+
 class SMTPSender(ReportEmailSenderPort):
     def __init__(self, config: EmailConfig) -> None:
         self._config = config
+        self._lock = threading.Lock()
+        self._warm_smtp: smtplib.SMTP | None = None
+        self._warm_since = 0.0
+
+    def warm_up(self) -> None:
+        """Connect, STARTTLS and log in ahead of time; the next send reuses the session."""
+
+        started = time.monotonic()
+        smtp = self._connect()
+        with self._lock:
+            previous, self._warm_smtp, self._warm_since = self._warm_smtp, smtp, time.monotonic()
+        if previous is not None:
+            _close_quietly(previous)
+        logger.info("SMTP connection warmed up in %.2fs", time.monotonic() - started)
+
+    def _connect(self) -> smtplib.SMTP:
+        context = ssl.create_default_context()
+        smtp = smtplib.SMTP(self._config.smtp_host, self._config.smtp_port)
+        try:
+            if self._config.use_tls:
+                smtp.starttls(context=context)
+            smtp.login(self._config.username, self._config.password)
+        except BaseException:
+            _close_quietly(smtp)
+            raise
+        return smtp
+
+    def _take_warm_connection(self) -> smtplib.SMTP | None:
+        """Return the warmed-up session if it is recent and still answers NOOP."""
+
+        with self._lock:
+            smtp, self._warm_smtp = self._warm_smtp, None
+            age = time.monotonic() - self._warm_since
+        if smtp is None:
+            return None
+        try:
+            if age <= _WARM_CONNECTION_MAX_AGE_SECONDS and smtp.noop()[0] == 250:
+                return smtp
+        except (smtplib.SMTPException, OSError):
+            pass
+        _close_quietly(smtp)
+        return None
 
     # send a single email with one or more attachments
     def send_report_email(
@@ -73,16 +120,18 @@ class SMTPSender(ReportEmailSenderPort):
         )
 
         try:
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self._config.smtp_host, self._config.smtp_port) as smtp:
-                if self._config.use_tls:
-                    smtp.starttls(context=context)
-
-                smtp.login(self._config.username, self._config.password)
+            smtp = self._take_warm_connection() or self._connect()
+            with smtp:
                 smtp.send_message(msg)
 
         except smtplib.SMTPException as exc:
             logger.exception("Failed to send report email via SMTP")
             raise EmailSendError("Failed to send report email") from exc
 
-        logger.info("Report email successfully sent to %s", self._config.recipient)
\ No newline at end of file
+        logger.info("Report email successfully sent to %s", self._config.recipient)
+
+def _close_quietly(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.quit()
+    except (smtplib.SMTPException, OSError):
+        smtp.close()
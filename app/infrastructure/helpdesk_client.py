@@ -2,23 +2,33 @@ from __future__ import annotations
 import logging
 from typing import Any
 import requests
-from requests import HTTPError, RequestException
+from requests import RequestException
 from app.config import HelpdeskAPIConfig
-from app.domain.helpdesk import HelpdeskRequest
-import time
+from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from app.application.dto.fetched_helpdesk_request import FetchedHelpdeskRequest
+from app.infrastructure.json_item_stream import JSONItemStream
+from app.infrastructure.http_transport import RetryingTransport, build_session
+from app.infrastructure.helpdesk_field_mapping import HelpdeskFieldMapper
 
 
 logger = logging.getLogger(__name__)
 
+# body chunk size read from the socket when streaming the response
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+# items sampled to detect the payload shape the field mapping is compiled for
+_SHAPE_SAMPLE_ITEMS = 200
+
 class HelpdeskAPIError(RuntimeError):
     """Raised when Helpdesk API cannot be called or its response cannot be parsed/validated."""
 
 class HelpdeskClient:
     """HTTP client for fetching helpdesk requests from the Helpdesk API.
-        Calls the configured endpoint with credentials, parses the JSON response,
-        extracts request items, and returns them as `FetchedHelpdeskRequest`
-        (domain request + raw payload envelope).
+        Calls the configured endpoint with credentials (optionally page by page),
+        parses the JSON response, extracts request items, and returns them as
+        `FetchedHelpdeskRequest` (domain request + raw payload envelope).
         """
 
     def __init__(
@@ -26,64 +36,77 @@ class HelpdeskClient:
         config: HelpdeskAPIConfig,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        session: requests.Session | None = None,
+        max_backoff_seconds: float = 30.0,
     ) -> None:
         self._config = config
-        self._session = requests.Session()
-        self._max_retries = max_retries
-        self._backoff_factor = backoff_factor
+        self._session = session if session is not None else build_session()
+        self._transport = RetryingTransport(
+            "Helpdesk API",
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            max_backoff_seconds=max_backoff_seconds,
+        )
+        # ETag of the latest single-request response (for conditional refetch)
+        self.last_etag: str | None = None
+        self._mapper = _build_mapper(config)
 
-    def _post_json(self) -> Any:
-        """Call the Helpdesk API and return the parsed JSON body.
-            Retries on HTTP/network failures with exponential backoff.
+    def _post(
+        self,
+        extra_payload: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response | None:
+        """Call the Helpdesk API and return the response (None on 304 Not Modified).
+            ``extra_payload`` (e.g. paging params) is merged into the request body.
+            With ``stream`` the body is left unread for the caller to consume.
+            Transient HTTP/network failures are retried by the shared transport.
             Raises:
-                HelpdeskAPIError: on request failures after retries or invalid JSON.
+                HelpdeskAPIError: on request failures after retries.
             """
 
-        payload = {
+        payload: dict[str, Any] = {
             "api_key": self._config.api_key,
             "api_secret": self._config.api_secret,
         }
+        if extra_payload:
+            payload.update(extra_payload)
 
-        # retry POST with exponential backoff on HTTP/network errors
-        response: requests.Response | None = None
-        last_exc: Exception | None = None
-
-        for attempt in range(1, self._max_retries + 1):
-            try:
-                response = self._session.post(
+        # pooled keep-alive session; retries with jittered backoff + Retry-After
+        try:
+            response = self._transport.call(
+                lambda: self._session.post(
                     self._config.url,
                     json=payload,
+                    headers=headers,
                     timeout=self._config.timeout_seconds,
+                    stream=stream,
                 )
-                response.raise_for_status()
-                break
-            except (HTTPError, RequestException) as exc:
-                last_exc = exc
-                if attempt == self._max_retries:
-                    msg = (
-                        f"Error calling Helpdesk API after {self._max_retries} "
-                        f"attempts: {exc}"
-                    )
-                    logger.error(msg)
-                    raise HelpdeskAPIError(msg) from exc
-
-                sleep_seconds = self._backoff_factor * (2 ** (attempt - 1))
-                logger.warning(
-                    "Helpdesk API call failed on attempt %d/%d: %s; "
-                    "retrying in %.1f seconds",
-                    attempt,
-                    self._max_retries,
-                    exc,
-                    sleep_seconds,
-                )
-                time.sleep(sleep_seconds)
+            )
+        except RequestException as exc:
+            msg = f"Error calling Helpdesk API (max {self._transport.max_retries} attempts): {exc}"
+            logger.error(msg)
+            raise HelpdeskAPIError(msg) from exc
+
+        self.last_etag = response.headers.get("ETag")
+        if response.status_code == 304:
+            response.close()
+            return None
+        return response
+
+    def _post_json(
+        self,
+        extra_payload: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Call the Helpdesk API and return the parsed JSON body (None on 304).
+            Raises:
+                HelpdeskAPIError: on request failures after retries or invalid JSON.
+            """
 
+        response = self._post(extra_payload, headers)
         if response is None:
-            msg = "Helpdesk API call failed without a response object"
-            logger.error(msg)
-            if last_exc is not None:
-                raise HelpdeskAPIError(msg) from last_exc
-            raise HelpdeskAPIError(msg)
+            return None
 
         try:
             return response.json()
@@ -99,98 +122,278 @@ class HelpdeskClient:
     def fetch_requests(self) -> list[FetchedHelpdeskRequest]:
         """Fetch helpdesk requests and map them into domain + raw envelope."""
 
-        data = self._post_json()
+        result = list(self.iter_requests())
+        logger.info("Fetched %d helpdesk requests", len(result))
+        return result
+
+    def iter_requests(
+        self,
+        updated_since: datetime | None = None,
+        etag: str | None = None,
+    ) -> Iterator[FetchedHelpdeskRequest]:
+        """Yield helpdesk requests as they arrive.
+
+            Without ``page_size`` the whole set comes from a single POST. With
+            ``page_size`` pages are requested one by one (cursor-aware) and, if
+            ``prefetch_pages`` is on, the next page is already in flight while the
+            current one is consumed.
+
+            ``updated_since`` is sent as a server-side filter hint and ``etag`` as
+            ``If-None-Match`` (single-request mode only); a 304 yields nothing.
+
+            With ``stream_json`` the single-request body is parsed incrementally
+            and items are yielded as they are decoded instead of after
+            ``response.json()`` materialized the whole document.
+            """
+
+        filters: dict[str, Any] = {}
+        if updated_since is not None:
+            filters["updated_since"] = updated_since.isoformat()
+        try:
+            yield from self._iter_fetched(filters, etag)
+        finally:
+            self._transport.log_stats()
+
+    def _iter_fetched(self, filters: dict[str, Any], etag: str | None) -> Iterator[FetchedHelpdeskRequest]:
+        if not self._config.page_size:
+            headers = {"If-None-Match": etag} if etag else None
+            if self._config.stream_json:
+                yield from self._iter_streamed(filters, headers)
+                return
+
+            data = self._post_json(filters, headers)
+            if data is None:
+                logger.info("Helpdesk API reported no changes since the last run (304 Not Modified)")
+                return
+            logger.info(
+                "Raw Helpdesk API response keys: %s",
+                list(data.keys()) if isinstance(data, dict) else type(data),
+            )
+            items = _extract_items(data)
+            if self._mapper.shape is None:
+                self._mapper.observe(items[:_SHAPE_SAMPLE_ITEMS])
+            for item in items:
+                yield _map_item(item, self._mapper)
+            return
+
+        for page_items in self._iter_pages(self._config.page_size, filters):
+            if self._mapper.shape is None:
+                # payload shape is detected from the first page
+                self._mapper.observe(page_items[:_SHAPE_SAMPLE_ITEMS])
+            for item in page_items:
+                yield _map_item(item, self._mapper)
+
+    def _iter_streamed(
+        self,
+        filters: dict[str, Any],
+        headers: dict[str, str] | None,
+    ) -> Iterator[FetchedHelpdeskRequest]:
+        """Yield requests while the response body is still being read."""
+
+        response = self._post(filters, headers, stream=True)
+        if response is None:
+            logger.info("Helpdesk API reported no changes since the last run (304 Not Modified)")
+            return
+
+        stream = JSONItemStream(response.iter_content(chunk_size=_STREAM_CHUNK_BYTES))
+        count = 0
+        # the shape is detected from the same sample size as the buffered path
+        sample: list[dict[str, Any]] | None = [] if self._mapper.shape is None else None
+        try:
+            for item in stream:
+                count += 1
+                if sample is None:
+                    yield _map_item(item, self._mapper)
+                    continue
+                sample.append(item)
+                if len(sample) >= _SHAPE_SAMPLE_ITEMS:
+                    yield from self._observe_and_map(sample)
+                    sample = None
+            if sample:
+                yield from self._observe_and_map(sample)
+        except ValueError as exc:
+            msg = "Failed to parse Helpdesk API response as JSON"
+            logger.error("%s (after %d item(s)): %s", msg, count, exc)
+            raise HelpdeskAPIError(msg) from exc
+        except RequestException as exc:
+            msg = f"Helpdesk API response stream broke after {count} item(s): {exc}"
+            logger.error(msg)
+            raise HelpdeskAPIError(msg) from exc
+        finally:
+            response.close()
+
+        if not stream.items_found:
+            # no supported items list: reuse the shape errors of the buffered path
+            _extract_items(stream.envelope)
         logger.info(
-            "Raw Helpdesk API response keys: %s",
-            list(data.keys()) if isinstance(data, dict) else type(data),
+            "Streamed %d helpdesk item(s); response envelope keys: %s",
+            count,
+            list(stream.envelope.keys()),
         )
 
-        items = self._extract_items(data)
-
-        result: list[FetchedHelpdeskRequest] = []
+    def _observe_and_map(self, items: list[dict[str, Any]]) -> Iterator[FetchedHelpdeskRequest]:
+        self._mapper.observe(items)
         for item in items:
-            id = _normalize_optional_str(item.get("id") or item.get("ticket_id"))
-            short_description = _normalize_optional_str(item.get("short_description") or item.get("subject"))
+            yield _map_item(item, self._mapper)
 
-            long_description = _normalize_optional_str(
-                item.get("long_description") or item.get("description") or item.get("body")
-            )
+    def _iter_pages(self, page_size: int, filters: dict[str, Any]) -> Iterator[list[dict[str, Any]]]:
+        """Yield item lists page by page until the API reports no more data."""
 
-            request_category = _normalize_optional_str(item.get("request_category"))
-            request_type = _normalize_optional_str(item.get("request_type"))
-
-            sla_payload = item.get("sla")
-            sla_unit: str | None = None
-            sla_value: int | None = None
-            if isinstance(sla_payload, dict):
-                sla_unit = _normalize_optional_str(sla_payload.get("unit"))
-                sla_value = _normalize_optional_int(sla_payload.get("value"))
-
-            domain_req = HelpdeskRequest(
-                id=id,
-                short_description=short_description,
-                long_description=long_description,
-                request_category=request_category,
-                request_type=request_type,
-                sla_unit=sla_unit,
-                sla_value=sla_value,
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="helpdesk-page")
+        try:
+            page = 1
+            cursor: str | None = None
+            seen_cursors: set[str] = set()
+            first_ids: set[Any] = set()
+            pending: Future[Any] | None = executor.submit(
+                self._post_json,
+                _page_params(page, page_size, cursor, filters),
             )
 
-            result.append(
-                FetchedHelpdeskRequest(
-                    request=domain_req,
-                    raw_payload=item,
+            while pending is not None:
+                data = pending.result()
+                pending = None
+                if data is None:
+                    return
+
+                items = _extract_items(data)
+                next_cursor, has_more = _extract_pagination(data)
+                logger.info(
+                    "Helpdesk API page %d: %d item(s) (cursor=%r, next_cursor=%r, has_more=%r)",
+                    page,
+                    len(items),
+                    cursor,
+                    next_cursor,
+                    has_more,
                 )
-            )
 
-        logger.info("Fetched %d helpdesk requests", len(result))
-        return result
-
-    def _extract_items(self, data: Any) -> list[dict[str, Any]]:
-        """Extract a list of request dicts from the Helpdesk API JSON.
-            Supported shapes:
-            - top-level list of dicts
-            - top-level dict with `data` as list of dicts
-            - top-level dict with `data.requests` as list of dicts
-            Raises:
-                HelpdeskAPIError: if no supported shape matches.
-            """
-
-        if isinstance(data, list):
-            return [item for item in data if isinstance(item, dict)]
+                # guard against APIs that ignore paging and return the same data again
+                first_id = self._mapper.request_id(items[0]) if items else None
+                repeated = first_id is not None and first_id in first_ids
+                if first_id is not None:
+                    first_ids.add(first_id)
+
+                if repeated:
+                    logger.warning(
+                        "Helpdesk API page %d repeats an earlier page (first id %r); "
+                        "assuming pagination is not supported and stopping",
+                        page,
+                        first_id,
+                    )
+                    return
+
+                # an explicit stop (has_more=false or an empty page) wins over a next cursor
+                if has_more is False or not items:
+                    more = False
+                elif next_cursor is not None and next_cursor not in seen_cursors:
+                    seen_cursors.add(next_cursor)
+                    cursor = next_cursor
+                    more = True
+                elif has_more is not None:
+                    more = has_more
+                else:
+                    more = len(items) >= page_size
+
+                if not more:
+                    yield items
+                    return
+
+                page += 1
+                params = _page_params(page, page_size, cursor, filters)
+                if self._config.prefetch_pages:
+                    # next page downloads while the caller consumes this one
+                    pending = executor.submit(self._post_json, params)
+                    yield items
+                else:
+                    yield items
+                    pending = executor.submit(self._post_json, params)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+def _build_mapper(config: HelpdeskAPIConfig) -> HelpdeskFieldMapper:
+    return HelpdeskFieldMapper(
+        dict(config.field_mapping),
+        normalize_str=_normalize_optional_str,
+        normalize_int=_normalize_optional_int,
+    )
+
+def _extract_items(data: Any) -> list[dict[str, Any]]:
+    """Extract a list of request dicts from the Helpdesk API JSON.
+        Supported shapes:
+        - top-level list of dicts
+        - top-level dict with `data` as list of dicts
+        - top-level dict with `data.requests` as list of dicts
+        Raises:
+            HelpdeskAPIError: if no supported shape matches.
+        """
 
-        if isinstance(data, dict):
-            payload = data.get("data", data)
+    if isinstance(data, list):
+        return [item for item in data if isinstance(item, dict)]
 
-            if isinstance(payload, list):
-                return [item for item in payload if isinstance(item, dict)]
+    if isinstance(data, dict):
+        payload = data.get("data", data)
 
-            if isinstance(payload, dict):
-                items_payload = payload.get("requests")
-                if isinstance(items_payload, list):
-                    return [item for item in items_payload if isinstance(item, dict)]
+        if isinstance(payload, list):
+            return [item for item in payload if isinstance(item, dict)]
 
-                logger.error(
-                    "Helpdesk API 'data' dict has no 'requests' list. data keys=%s, payload keys=%s",
-                    list(data.keys()),
-                    list(payload.keys()),
-                )
-                raise HelpdeskAPIError(
-                    "Unexpected response shape from Helpdesk API: "
-                    "'data.requests' key missing or not a list"
-                )
+        if isinstance(payload, dict):
+            items_payload = payload.get("requests")
+            if isinstance(items_payload, list):
+                return [item for item in items_payload if isinstance(item, dict)]
 
             logger.error(
-                "Helpdesk API 'data' has unexpected type: %s",
-                type(payload).__name__,
+                "Helpdesk API 'data' dict has no 'requests' list. data keys=%s, payload keys=%s",
+                list(data.keys()),
+                list(payload.keys()),
             )
             raise HelpdeskAPIError(
-                "Unexpected response shape from Helpdesk API: 'data' is not dict or list"
+                "Unexpected response shape from Helpdesk API: "
+                "'data.requests' key missing or not a list"
             )
 
-        msg = f"Unexpected response format from Helpdesk API: {type(data).__name__}"
-        logger.error(msg)
-        raise HelpdeskAPIError(msg)
+        logger.error(
+            "Helpdesk API 'data' has unexpected type: %s",
+            type(payload).__name__,
+        )
+        raise HelpdeskAPIError(
+            "Unexpected response shape from Helpdesk API: 'data' is not dict or list"
+        )
+
+    msg = f"Unexpected response format from Helpdesk API: {type(data).__name__}"
+    logger.error(msg)
+    raise HelpdeskAPIError(msg)
+
+def _page_params(page: int, page_size: int, cursor: str | None, filters: dict[str, Any]) -> dict[str, Any]:
+    params: dict[str, Any] = {"page": page, "page_size": page_size, **filters}
+    if cursor is not None:
+        params["cursor"] = cursor
+    return params
+
+def _extract_pagination(data: Any) -> tuple[str | None, bool | None]:
+    """Return (next_cursor, has_more) from top-level, ``pagination``/``meta`` or ``data`` dicts."""
+
+    if not isinstance(data, dict):
+        return None, None
+
+    containers = [data]
+    for key in ("pagination", "meta", "data"):
+        nested = data.get(key)
+        if isinstance(nested, dict):
+            containers.append(nested)
+
+    next_cursor: str | None = None
+    has_more: bool | None = None
+    for container in containers:
+        if next_cursor is None:
+            next_cursor = _normalize_optional_str(container.get("next_cursor") or container.get("cursor_next"))
+        if has_more is None and isinstance(container.get("has_more"), bool):
+            has_more = container["has_more"]
+    return next_cursor, has_more
+
+def _map_item(item: dict[str, Any], mapper: HelpdeskFieldMapper) -> FetchedHelpdeskRequest:
+    """Map one raw helpdesk item into the domain request + raw envelope."""
+
+    return FetchedHelpdeskRequest(request=mapper.map(item), raw_payload=item)
 
 def _normalize_optional_str(value: Any) -> str | None:
     """Return stripped string or None for empty/whitespace."""
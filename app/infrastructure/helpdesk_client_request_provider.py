@@ -1,14 +1,228 @@
 from __future__ import annotations
-from collections.abc import Sequence
+import logging
+import re
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import datetime, timezone
+from typing import Any
 from app.application.ports.helpdesk_service_port import HelpdeskRequestProvider
 from app.domain.helpdesk import HelpdeskRequest
 from app.infrastructure.helpdesk_client import HelpdeskClient
+from app.infrastructure.ingestion_state import IngestionWatermark, SQLiteIngestionState
 
 
+logger = logging.getLogger(__name__)
+
+
+# raw payload keys carrying scheduling signals, first non-empty wins
+_PRIORITY_KEYS = ("priority", "urgency", "severity")
+_CREATED_AT_KEYS = ("created_at", "opened_at", "created", "submitted_at")
+_UPDATED_AT_KEYS = ("updated_at", "modified_at", "updated", "last_updated", *_CREATED_AT_KEYS)
+
+_DIGITS_RE = re.compile(r"(\d+)")
+_P_LEVEL_RE = re.compile(r"p\d+")
+
+_PRIORITY_WORDS: dict[str, int] = {
+    "critical": 1,
+    "urgent": 1,
+    "highest": 1,
+    "high": 2,
+    "medium": 3,
+    "normal": 3,
+    "moderate": 3,
+    "low": 4,
+    "lowest": 5,
+    "planning": 5,
+}
+
 class HelpdeskClientRequestProvider(HelpdeskRequestProvider):
-    def __init__(self, client: HelpdeskClient) -> None:
+    """Maps client results into domain requests, optionally incrementally.
+
+        With an ingestion ``state`` (and ``full=False``) only tickets newer than
+        the stored high-water mark are returned: the mark is sent to the API as a
+        filter hint/ETag and applied client-side as well. The new mark is kept
+        pending until ``commit()`` is called after the report was delivered.
+        With ``tag_source`` requests carry ``source`` and ids are namespaced as
+        ``"<source>:<id>"`` so several tenants can share one classification run.
+        """
+
+    def __init__(
+        self,
+        client: HelpdeskClient,
+        state: SQLiteIngestionState | None = None,
+        source: str = "default",
+        full: bool = False,
+        tag_source: bool = False,
+    ) -> None:
         self._client = client
+        self._state = state
+        self._source = source
+        self._full = full
+        self._tag_source = tag_source
+        self._pending_watermark: IngestionWatermark | None = None
+
+    @property
+    def source(self) -> str:
+        return self._source
 
     def fetch_requests(self) -> Sequence[HelpdeskRequest]:
-        fetched = self._client.fetch_requests()
-        return [f.request for f in fetched]
\ No newline at end of file
+        # the run needs the whole set (urgent split, batching, report), so the
+        # streamed items are collected here; only the raw JSON is never held at once
+        return list(self._iter_requests())
+
+    def _iter_requests(self) -> Iterator[HelpdeskRequest]:
+        """Map the client's streamed items into domain requests, skipping already ingested ones."""
+
+        watermark: IngestionWatermark | None = None
+        if self._state is not None and not self._full:
+            watermark = self._state.load(self._source)
+            logger.info(
+                "Incremental helpdesk ingestion for %r since %s",
+                self._source,
+                "the beginning" if watermark is None else (watermark.last_updated_at or watermark.last_id),
+            )
+
+        max_updated_at = None if watermark is None else watermark.last_updated_at
+        max_id = None if watermark is None else watermark.last_id
+        ids_at_max: set[str] = set() if watermark is None else set(watermark.last_updated_ids)
+        kept = 0
+        skipped = 0
+
+        fetched_iter = self._client.iter_requests(
+            updated_since=None if watermark is None else watermark.last_updated_at,
+            etag=None if watermark is None else watermark.etag,
+        )
+
+        # carry priority/age signals from the raw payload for batch scheduling
+        for f in fetched_iter:
+            req = f.request
+            updated_at = _parse_datetime(_first_present(f.raw_payload, _UPDATED_AT_KEYS))
+
+            if updated_at is not None and (max_updated_at is None or updated_at > max_updated_at):
+                max_updated_at = updated_at
+                ids_at_max = set()
+            if updated_at is not None and updated_at == max_updated_at and req.id:
+                ids_at_max.add(req.id)
+            if req.id and (max_id is None or _natural_key(req.id) > _natural_key(max_id)):
+                max_id = req.id
+
+            if watermark is not None and not _is_newer(watermark, req.id, updated_at):
+                skipped += 1
+                continue
+
+            kept += 1
+            req.priority = _parse_priority(_first_present(f.raw_payload, _PRIORITY_KEYS))
+            req.created_at = _parse_datetime(_first_present(f.raw_payload, _CREATED_AT_KEYS))
+            if self._tag_source:
+                # after the watermark checks, which compare the tenant's own ids
+                req.source = self._source
+                if req.id:
+                    req.id = f"{self._source}:{req.id}"
+            yield req
+
+        if self._state is not None:
+            self._pending_watermark = IngestionWatermark(
+                last_id=max_id,
+                last_updated_at=max_updated_at,
+                etag=self._client.last_etag or (None if watermark is None else watermark.etag),
+                last_updated_ids=tuple(sorted(ids_at_max)),
+            )
+            logger.info(
+                "Helpdesk ingestion for %r: %d new/changed request(s), %d already ingested",
+                self._source,
+                kept,
+                skipped,
+            )
+
+    def commit(self) -> None:
+        """Persist the high-water mark of the last fetch (call after the report was delivered)."""
+
+        if self._state is None or self._pending_watermark is None:
+            return
+        self._state.save(self._source, self._pending_watermark)
+        logger.info(
+            "Saved helpdesk ingestion watermark for %r: last_id=%r last_updated_at=%s",
+            self._source,
+            self._pending_watermark.last_id,
+            self._pending_watermark.last_updated_at,
+        )
+        self._pending_watermark = None
+
+def _is_newer(watermark: IngestionWatermark, id: str | None, updated_at: datetime | None) -> bool:
+    """Compare by timestamp when both sides have one, else by natural id order, else keep.
+
+        A ticket at exactly the watermark timestamp is new unless its id was
+        already ingested at that timestamp.
+        """
+
+    if watermark.last_updated_at is not None and updated_at is not None:
+        if updated_at != watermark.last_updated_at:
+            return updated_at > watermark.last_updated_at
+        if watermark.last_updated_ids:
+            return id not in watermark.last_updated_ids
+        # watermark saved without the ids: fall back to the id order
+    if watermark.last_id is not None and id:
+        return _natural_key(id) > _natural_key(watermark.last_id)
+    return True
+
+def _natural_key(value: str) -> list[tuple[int, int | str]]:
+    """Sort key where "req_99" < "req_101"."""
+
+    return [
+        (0, int(part)) if part.isdigit() else (1, part)
+        for part in _DIGITS_RE.split(value)
+        if part
+    ]
+
+def _first_present(payload: Mapping[str, Any], keys: Sequence[str]) -> Any:
+    for key in keys:
+        value = payload.get(key)
+        if value not in (None, ""):
+            return value
+    return None
+
+def _parse_priority(value: Any) -> int | None:
+    """Map P1..P5, 1..5 or words (critical/high/medium/low) to 1..5."""
+
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        number = int(value)
+        return number if number >= 1 else None
+
+    text = str(value).strip().lower()
+    if _P_LEVEL_RE.fullmatch(text):
+        # "P1".."P5"; words such as "planning" keep their leading "p"
+        text = text[1:]
+    if text.isdigit():
+        number = int(text)
+        return number if number >= 1 else None
+
+    # "1 - Critical" / "High priority" style labels
+    for token in text.replace("-", " ").split():
+        if token.isdigit() and int(token) >= 1:
+            return int(token)
+        if token in _PRIORITY_WORDS:
+            return _PRIORITY_WORDS[token]
+    return None
+
+def _parse_datetime(value: Any) -> datetime | None:
+    """Parse ISO-8601 strings or epoch seconds into an aware datetime (UTC if naive)."""
+
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        try:
+            return datetime.fromtimestamp(value, tz=timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return None
+
+    text = str(value).strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
@@ -0,0 +1,171 @@
+from __future__ import annotations
+import logging
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Callable
+from app.domain.helpdesk import HelpdeskRequest
+
+
+logger = logging.getLogger(__name__)
+
+# HelpdeskRequest field -> source paths tried in order (first truthy wins, dots go into nested dicts)
+DEFAULT_FIELD_MAPPING: dict[str, tuple[str, ...]] = {
+    "id": ("id", "ticket_id"),
+    "short_description": ("short_description", "subject"),
+    "long_description": ("long_description", "description", "body"),
+    "request_category": ("request_category",),
+    "request_type": ("request_type",),
+    "sla_unit": ("sla.unit",),
+    "sla_value": ("sla.value",),
+}
+
+_INT_FIELDS = frozenset({"sla_value"})
+
+Extractor = Callable[[Mapping[str, Any]], HelpdeskRequest]
+
+def build_field_mapping(overrides: Mapping[str, Sequence[str] | str] | None = None) -> dict[str, tuple[str, ...]]:
+    """Merge per-field overrides (a path or list of paths) into the default mapping."""
+
+    mapping = dict(DEFAULT_FIELD_MAPPING)
+    for field, paths in (overrides or {}).items():
+        if field not in DEFAULT_FIELD_MAPPING:
+            raise ValueError(
+                f"Unknown helpdesk field {field!r} in field mapping; "
+                f"expected one of {sorted(DEFAULT_FIELD_MAPPING)}"
+            )
+        path_list = (paths,) if isinstance(paths, str) else tuple(paths)
+        if not path_list or not all(isinstance(p, str) and p.strip() for p in path_list):
+            raise ValueError(f"Field mapping for {field!r} must be a non-empty path or list of paths")
+        mapping[field] = tuple(p.strip() for p in path_list)
+    return mapping
+
+class HelpdeskFieldMapper:
+    """Maps raw helpdesk items to HelpdeskRequest via a compiled field mapping.
+
+        The mapping is compiled into one lookup closure per field, with the
+        source paths split once up front. When a payload shape is observed (the
+        keys of the first page), an extractor specialised for that shape is
+        compiled: paths absent from the shape are dropped. Items carrying one of the
+        dropped keys are routed to the generic extractor, so heterogeneous
+        payloads map exactly as before.
+        """
+
+    def __init__(
+        self,
+        mapping: Mapping[str, Sequence[str] | str] | None,
+        normalize_str: Callable[[Any], str | None],
+        normalize_int: Callable[[Any], int | None],
+    ) -> None:
+        self._mapping = build_field_mapping(mapping)
+        self._normalize_str = normalize_str
+        self._normalize_int = normalize_int
+        self._request_id = self._field_getter("id", self._mapping["id"])
+        self._generic = self._compile(self._mapping, shape=None)
+        self._shape: frozenset[str] | None = None
+        self._extract: Extractor = self._generic
+
+    @property
+    def shape(self) -> frozenset[str] | None:
+        return self._shape
+
+    def observe(self, items: Iterable[Mapping[str, Any]]) -> None:
+        """Detect the payload shape from sample items (e.g. the first page) and compile for it."""
+
+        keys: set[str] = set()
+        for item in items:
+            keys.update(item.keys())
+        if not keys:
+            return
+
+        shape = frozenset(keys)
+        pruned = {
+            field: tuple(p for p in paths if p.split(".", 1)[0] in shape)
+            for field, paths in self._mapping.items()
+        }
+        self._shape = shape
+        self._extract = self._compile(pruned, shape=shape)
+        logger.info(
+            "Helpdesk payload shape detected (%d keys); compiled field mapping: %s",
+            len(shape),
+            {field: paths for field, paths in pruned.items() if paths},
+        )
+
+    def map(self, item: Mapping[str, Any]) -> HelpdeskRequest:
+        if self._shape is None:
+            self.observe((item,))
+        return self._extract(item)
+
+    def request_id(self, item: Mapping[str, Any]) -> str | None:
+        """The item's id as the mapping reads it (e.g. to recognise repeated pages)."""
+
+        return self._request_id(item)
+
+    def _compile(self, mapping: Mapping[str, Sequence[str]], shape: frozenset[str] | None) -> Extractor:
+        """Build ``extract(item) -> HelpdeskRequest`` from one lookup closure per field."""
+
+        getters = [(field, self._field_getter(field, paths)) for field, paths in mapping.items()]
+        generic = getattr(self, "_generic", None)
+        dropped: frozenset[str] = frozenset()
+        if shape is not None:
+            # route items that carry any key the specialised extractor dropped
+            dropped = frozenset(
+                {path.split(".", 1)[0] for paths in self._mapping.values() for path in paths} - shape
+            )
+
+        def extract(item: Mapping[str, Any]) -> HelpdeskRequest:
+            if dropped and generic is not None and not dropped.isdisjoint(item.keys()):
+                return generic(item)
+            return HelpdeskRequest(**{field: get(item) for field, get in getters})
+
+        return extract
+
+    def _field_getter(self, field: str, paths: Sequence[str]) -> Callable[[Mapping[str, Any]], Any]:
+        """First truthy value of ``paths`` (the last one if none is), normalized for ``field``."""
+
+        lookups = [_path_lookup(path) for path in paths]
+        if not lookups:
+            return lambda item: None
+
+        if field in _INT_FIELDS:
+            normalize_int = self._normalize_int
+
+            def get_int(item: Mapping[str, Any]) -> Any:
+                value = None
+                for lookup in lookups:
+                    value = lookup(item)
+                    if value:
+                        break
+                return normalize_int(value)
+
+            return get_int
+
+        normalize_str = self._normalize_str
+
+        def get_str(item: Mapping[str, Any]) -> Any:
+            value = None
+            for lookup in lookups:
+                value = lookup(item)
+                if value:
+                    break
+            if type(value) is str:
+                # fast path for plain strings, normalizer for everything else
+                return value.strip() or None
+            return normalize_str(value)
+
+        return get_str
+
+def _path_lookup(path: str) -> Callable[[Mapping[str, Any]], Any]:
+    """``item.get(a)`` for a plain key; for ``a.b.c`` walk nested dicts (None past a non-dict)."""
+
+    head, *rest = path.split(".")
+    if not rest:
+        return lambda item: item.get(head)
+
+    def lookup(item: Mapping[str, Any]) -> Any:
+        value = item.get(head)
+        for key in rest:
+            if type(value) is not dict:
+                return None
+            value = value.get(key)
+        return value
+
+    return lookup
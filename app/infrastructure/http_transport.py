@@ -0,0 +1,206 @@
+from __future__ import annotations
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+import requests
+from requests import RequestException
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from app.infrastructure.cassette import Cassette
+
+
+logger = logging.getLogger(__name__)
+
+# transient statuses worth retrying; other 4xx are returned to the caller at once
+RETRYABLE_STATUSES = frozenset((408, 425, 429, 500, 502, 503, 504))
+
+def build_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 10,
+    cassette: Cassette | None = None,
+) -> requests.Session:
+    """Create a keep-alive session with sized connection pools and gzip/deflate negotiation.
+
+        Retries are not delegated to urllib3; ``RetryingTransport`` owns them so
+        that backoff, Retry-After and metrics are handled in one place. With a
+        ``cassette`` every response is recorded to, or replayed from, disk.
+        """
+
+    session = requests.Session()
+    adapter_kwargs: dict[str, Any] = {
+        "pool_connections": pool_connections,
+        "pool_maxsize": pool_maxsize,
+        "max_retries": 0,
+    }
+    if cassette is not None:
+        from app.infrastructure.cassette import CassetteHTTPAdapter
+
+        adapter: HTTPAdapter = CassetteHTTPAdapter(cassette, **adapter_kwargs)
+    else:
+        adapter = HTTPAdapter(**adapter_kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+@dataclass
+class TransportStats:
+    """Per-transport counters; latency covers every attempt including failed ones."""
+
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    total_latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+    last_latency_seconds: float = 0.0
+
+    @property
+    def mean_latency_seconds(self) -> float:
+        return self.total_latency_seconds / self.attempts if self.attempts else 0.0
+
+class RetryingTransport:
+    """Runs an HTTP call with jittered exponential backoff that honours Retry-After.
+
+        ``call(send)`` invokes ``send`` (which must call ``raise_for_status``) up
+        to ``max_retries`` times. Connection errors, timeouts and
+        ``RETRYABLE_STATUSES`` are retried; other HTTP errors are raised at once.
+        A failed response is closed before the next attempt. After the last
+        attempt the original exception is re-raised so callers keep wrapping it
+        into their own error types.
+        """
+
+    def __init__(
+        self,
+        name: str,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff_seconds: float = 30.0,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.name = name
+        self.max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._max_backoff_seconds = max_backoff_seconds
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self.stats = TransportStats()
+
+    def call(self, send: Callable[[], requests.Response]) -> requests.Response:
+        with self._lock:
+            self.stats.calls += 1
+
+        for attempt in range(1, self.max_retries + 1):
+            started = time.monotonic()
+            response: requests.Response | None = None
+            try:
+                response = send()
+                response.raise_for_status()
+            except RequestException as exc:
+                final = attempt == self.max_retries or not _is_retryable(exc)
+                self._record(started, failed=final)
+                if final:
+                    raise
+                if response is not None:
+                    # hand the connection back to the pool (a streamed body holds it until closed)
+                    response.close()
+                time.sleep(self._prepare_retry(attempt, exc))
+                continue
+
+            elapsed = self._record(started, failed=False)
+            logger.debug("%s attempt %d succeeded in %.3fs", self.name, attempt, elapsed)
+            return response
+
+        raise RuntimeError(f"{self.name}: max_retries must be >= 1")
+
+    def log_stats(self) -> TransportStats:
+        """Log the counters gathered since the previous call and start new ones (once per fetch)."""
+
+        with self._lock:
+            stats, self.stats = self.stats, TransportStats()
+        if stats.calls:
+            logger.info(
+                "%s transport: calls=%d attempts=%d retries=%d failures=%d latency mean=%.3fs max=%.3fs",
+                self.name,
+                stats.calls,
+                stats.attempts,
+                stats.retries,
+                stats.failures,
+                stats.mean_latency_seconds,
+                stats.max_latency_seconds,
+            )
+        return stats
+
+    def _record(self, started: float, failed: bool) -> float:
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self.stats.attempts += 1
+            self.stats.failures += int(failed)
+            self.stats.total_latency_seconds += elapsed
+            self.stats.last_latency_seconds = elapsed
+            self.stats.max_latency_seconds = max(self.stats.max_latency_seconds, elapsed)
+        return elapsed
+
+    def _prepare_retry(self, attempt: int, exc: Exception) -> float:
+        """Count and log a retry; return how long to wait before the next attempt."""
+
+        sleep_seconds = self._delay(attempt, exc)
+        logger.warning(
+            "%s call failed on attempt %d/%d: %s; retrying in %.1f seconds",
+            self.name,
+            attempt,
+            self.max_retries,
+            exc,
+            sleep_seconds,
+        )
+        with self._lock:
+            self.stats.retries += 1
+        return sleep_seconds
+
+    def _delay(self, attempt: int, exc: Exception) -> float:
+        """Equal-jitter backoff, raised to the server's Retry-After (both capped)."""
+
+        backoff = min(self._max_backoff_seconds, self._backoff_factor * (2 ** (attempt - 1)))
+        delay = backoff / 2 + self._rng.uniform(0, backoff / 2)
+
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self._max_backoff_seconds))
+        return delay
+
+def _status_code(exc: Exception) -> int | None:
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+def _is_retryable(exc: Exception) -> bool:
+    status = _status_code(exc)
+    # network errors/timeouts and unknown statuses are treated as transient
+    return status is None or status in RETRYABLE_STATUSES
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    """Parse Retry-After (delta-seconds or HTTP-date) from the failed response."""
+
+    response = getattr(exc, "response", None)
+    headers: Any = getattr(response, "headers", None)
+    value = headers.get("Retry-After") if hasattr(headers, "get") else None
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
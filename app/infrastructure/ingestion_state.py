@@ -0,0 +1,115 @@
+from __future__ import annotations
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class IngestionWatermark:
+    """High-water mark of the last successfully reported helpdesk ingestion."""
+
+    last_id: str | None = None
+    last_updated_at: datetime | None = None
+    etag: str | None = None
+    # ids already ingested at ``last_updated_at`` (tickets sharing it are not dropped)
+    last_updated_ids: tuple[str, ...] = ()
+
+class IngestionStateError(RuntimeError):
+    """Raised when the ingestion state cannot be accessed."""
+
+class SQLiteIngestionState:
+    """SQLite-based store of per-source ingestion watermarks.
+        """
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """Ensure the SQLite database and 'ingestion_state' table exist."""
+
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            conn = sqlite3.connect(self._db_path)
+            try:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS ingestion_state (
+                        source TEXT PRIMARY KEY,
+                        last_id TEXT,
+                        last_updated_at TEXT,
+                        etag TEXT,
+                        saved_at TEXT NOT NULL,
+                        last_updated_ids TEXT
+                    )
+                    """
+                )
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(ingestion_state)")}
+                if "last_updated_ids" not in columns:
+                    # databases created before the ids were recorded
+                    conn.execute("ALTER TABLE ingestion_state ADD COLUMN last_updated_ids TEXT")
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise IngestionStateError("Failed to initialize ingestion state database") from exc
+
+    def load(self, source: str) -> Optional[IngestionWatermark]:
+        """Return the stored watermark for ``source``, or None if nothing was ingested yet."""
+
+        try:
+            conn = sqlite3.connect(self._db_path)
+            try:
+                cur = conn.execute(
+                    "SELECT last_id, last_updated_at, etag, last_updated_ids FROM ingestion_state WHERE source = ?",
+                    (source,),
+                )
+                row = cur.fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise IngestionStateError("Failed to read from ingestion state database") from exc
+
+        if row is None:
+            return None
+
+        last_id, last_updated_at_str, etag, last_updated_ids_json = row
+        last_updated_at = datetime.fromisoformat(last_updated_at_str) if last_updated_at_str else None
+        last_updated_ids = tuple(json.loads(last_updated_ids_json)) if last_updated_ids_json else ()
+        return IngestionWatermark(
+            last_id=last_id,
+            last_updated_at=last_updated_at,
+            etag=etag,
+            last_updated_ids=last_updated_ids,
+        )
+
+    def save(self, source: str, watermark: IngestionWatermark) -> None:
+        """Store (replace) the watermark for ``source``."""
+
+        try:
+            conn = sqlite3.connect(self._db_path)
+            try:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO ingestion_state
+                        (source, last_id, last_updated_at, etag, saved_at, last_updated_ids)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        source,
+                        watermark.last_id,
+                        None if watermark.last_updated_at is None else watermark.last_updated_at.isoformat(),
+                        watermark.etag,
+                        datetime.now().isoformat(timespec="seconds"),
+                        json.dumps(sorted(watermark.last_updated_ids)) if watermark.last_updated_ids else None,
+                    ),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            raise IngestionStateError("Failed to write to ingestion state database") from exc
@@ -0,0 +1,151 @@
+from __future__ import annotations
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+class JSONStreamError(ValueError):
+    """Raised when the streamed body is not valid JSON."""
+
+class JSONItemStream:
+    """Incremental parser yielding request items from a Helpdesk API body.
+
+        Reads the body chunk by chunk and yields the dicts of the first items
+        list it finds (top-level list, ``data``, ``data.requests`` or top-level
+        ``requests``), one at a time. Only the item being decoded and the unread
+        tail of the current chunk are held in memory. Values outside the items
+        list are kept in ``envelope`` (e.g. pagination fields); ``items_found``
+        tells whether a supported items list was present at all.
+        """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.envelope: dict[str, Any] = {}
+        self.items_found = False
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        ch = self._peek()
+        if ch == "[":
+            yield from self._array_items()
+        elif ch == "{":
+            yield from self._object_items(self.envelope, top_level=True)
+        else:
+            # scalar body: decode it for the error message / envelope
+            value = self._value()
+            self.envelope = {"value": value}
+
+        if self._peek() != "":
+            raise JSONStreamError(f"Extra data after JSON document at offset {self._pos}")
+
+    def _object_items(self, target: dict[str, Any], top_level: bool) -> Iterator[dict[str, Any]]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise JSONStreamError(f"Expected object key at offset {self._pos}")
+            self._expect(":")
+
+            ch = self._peek()
+            if not self.items_found and top_level and key == "data" and ch == "[":
+                yield from self._array_items()
+            elif not self.items_found and top_level and key == "data" and ch == "{":
+                nested: dict[str, Any] = {}
+                target["data"] = nested
+                yield from self._object_items(nested, top_level=False)
+            elif not self.items_found and key == "requests" and ch == "[":
+                yield from self._array_items()
+            else:
+                target[key] = self._value()
+
+            ch = self._peek()
+            self._pos += 1
+            if ch == "}":
+                return
+            if ch != ",":
+                raise JSONStreamError(f"Expected ',' or '}}' at offset {self._pos - 1}")
+
+    def _array_items(self) -> Iterator[dict[str, Any]]:
+        self._expect("[")
+        self.items_found = True
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            item = self._value()
+            if isinstance(item, dict):
+                yield item
+
+            ch = self._peek()
+            self._pos += 1
+            if ch == "]":
+                return
+            if ch != ",":
+                raise JSONStreamError(f"Expected ',' or ']' at offset {self._pos - 1}")
+
+    def _value(self) -> Any:
+        """Decode one complete JSON value at the cursor, reading more input as needed."""
+
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise JSONStreamError(str(exc)) from exc
+
+            # a number/literal ending exactly at the buffer end may continue in the next chunk
+            if end == len(self._buf) and self._buf[self._pos] not in '{["' and self._fill():
+                continue
+
+            self._pos = end
+            return value
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+
+        while True:
+            match = _WHITESPACE_RE.match(self._buf, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise JSONStreamError(f"Expected {char!r} at offset {self._pos}")
+        self._pos += 1
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping what was already consumed. False at end of input."""
+
+        if self._eof:
+            return False
+
+        self._buf = self._buf[self._pos:]
+        self._pos = 0
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            if text:
+                self._buf += text
+                return True
+
+        self._eof = True
+        tail = self._text_decoder.decode(b"", final=True)
+        self._buf += tail
+        return bool(tail)
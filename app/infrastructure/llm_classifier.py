@@ -1,21 +1,27 @@
 from __future__ import annotations
-import json
 import logging
 from typing import Any
 from app.application.llm_classifier import (
     LLMClassificationResult,
     LLMClassificationError,
+    LLMUsage,
 )
 from app.domain.helpdesk import HelpdeskRequest
 from app.domain.service_catalog import ServiceCatalog
+from app.application.catalog_index import CatalogIndex
 from app.config import LLMConfig
 from google import genai
 from google.genai import types
-from app.shared.normalization import normalize_str_or_none
 from app.infrastructure.llm_classifier_prompt import LLM_BATCH_PROMPT_TEMPLATE
-from typing import Sequence
+from app.infrastructure.llm_request_hedger import HedgedCaller, LLMCallTimeoutError
+from app.infrastructure.llm_response_decoder import decode_batch_response
+from typing import TYPE_CHECKING, Sequence
+import threading
 import time
 
+if TYPE_CHECKING:
+    from app.infrastructure.cassette import Cassette
+
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +33,59 @@ class LLMClassifier:
         objects keyed by id.
         """
 
-    def __init__(self, config: LLMConfig) -> None:
+    def __init__(self, config: LLMConfig, cassette: Cassette | None = None) -> None:
         if not config.api_key:
             raise LLMClassificationError("LLM_API_KEY must be configured.")
 
         self._config = config
-        self._client = genai.Client(api_key=config.api_key)
+        # built lazily (or by warm_up) so wiring the pipeline stays cheap
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+        self._cassette = cassette
         self._model = config.model_name
         self._delay_between_batches: float = config.delay_between_batches
+        self._caller = HedgedCaller(
+            timeout_seconds=config.request_timeout_seconds,
+            hedge_enabled=config.hedge_enabled,
+            hedge_budget_ratio=config.hedge_budget_ratio,
+        )
+        self._last_usage: LLMUsage | None = None
+
+    def _get_client(self) -> Any:
+        with self._client_lock:
+            if self._client is None:
+                if self._cassette is not None:
+                    from app.infrastructure.cassette import CassetteGenAIClient
+
+                    self._client = CassetteGenAIClient(self._cassette, self._build_client)
+                else:
+                    self._client = self._build_client()
+            return self._client
+
+    def _build_client(self) -> genai.Client:
+        # transport-level timeout (ms) releases worker threads of abandoned calls
+        return genai.Client(
+            api_key=self._config.api_key,
+            http_options=types.HttpOptions(timeout=int(self._config.request_timeout_seconds * 1000)),
+        )
+
+    def warm_up(self) -> None:
+        """Build the client and open its connection with a token-free model lookup."""
+
+        started = time.monotonic()
+        self._get_client().models.get(model=self._model)
+        logger.info("LLM connection warmed up in %.2fs", time.monotonic() - started)
+
+    @property
+    def last_usage(self) -> LLMUsage | None:
+        """Token usage of the most recent classify_batch call (None if unknown)."""
+        return self._last_usage
 
-    def classify_helpdesk_request(self, request: HelpdeskRequest, catalog: ServiceCatalog) -> LLMClassificationResult:
+    def classify_helpdesk_request(
+        self,
+        request: HelpdeskRequest,
+        catalog: ServiceCatalog | CatalogIndex,
+    ) -> LLMClassificationResult:
         """Classify a single helpdesk request using the LLM.
 
             Internally calls classify_batch with a single-element list, then:
@@ -67,23 +116,32 @@ class LLMClassifier:
         )
         return next(iter(results.values()))
 
-    def classify_batch(self,requests: Sequence[HelpdeskRequest], catalog: ServiceCatalog) -> dict[
-        str, LLMClassificationResult]:
+    def classify_batch(
+        self,
+        requests: Sequence[HelpdeskRequest],
+        catalog: ServiceCatalog | CatalogIndex,
+        timeout_seconds: float | None = None,
+    ) -> dict[str, LLMClassificationResult]:
         """Classify a batch of helpdesk requests using the LLM.
 
             Builds a prompt from the Service Catalog and the given requests, asks
             the model for JSON output, then validates and converts the 'items' list
             into a dict keyed by id.
 
-            Raises LLMClassificationError on API failures, invalid JSON, missing
+            The API call is bounded by ``request_timeout_seconds`` (or the smaller
+            ``timeout_seconds``, e.g. what is left of the run deadline) and may be
+            hedged with a duplicate request when it runs past the observed p95 latency.
+
+            Raises LLMClassificationError on API failures or timeouts, invalid JSON, missing
             'items', empty results, or when all items are rejected as malformed.
             """
 
+        self._last_usage = None
         if not requests:
             return {}
 
         requests_list: list[HelpdeskRequest] = list(requests)
-        catalog_fragment = _catalog_to_prompt_fragment(catalog)
+        catalog_fragment = CatalogIndex.of(catalog).prompt_fragment
         requests_block = _build_batch(requests_list)
 
         prompt = LLM_BATCH_PROMPT_TEMPLATE.format(
@@ -91,92 +149,39 @@ class LLMClassifier:
             requests_block=requests_block,
         )
 
+        generate_config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            temperature=self._config.temperature,
+            top_p=self._config.top_p,
+            top_k=self._config.top_k,
+        )
+
+        timeout = self._config.request_timeout_seconds
+        if timeout_seconds is not None:
+            timeout = min(timeout, timeout_seconds)
+
         try:
-            response = self._client.models.generate_content(
-                model=self._model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    temperature=self._config.temperature,
-                    top_p=self._config.top_p,
-                    top_k=self._config.top_k,
+            # deadline-bounded (and optionally hedged) call; see HedgedCaller
+            response = self._caller.call(
+                lambda: self._get_client().models.generate_content(
+                    model=self._model,
+                    contents=prompt,
+                    config=generate_config,
                 ),
+                timeout_seconds=timeout,
             )
+        except LLMCallTimeoutError as exc:
+            logger.error("LLM batch classification call timed out: %s", exc)
+            raise LLMClassificationError("LLM batch API call timed out") from exc
         except Exception as exc:
             logger.error("LLM batch classification call failed: %s", exc)
             raise LLMClassificationError("LLM batch API call failed") from exc
 
-        text = _get_response_text(response)
-
-        try:
-            data: dict[str, Any] = json.loads(text)
-        except json.JSONDecodeError as exc:
-            logger.error("LLM batch returned non-JSON output: %r", text[:300])
-            raise LLMClassificationError("LLM batch output was not valid JSON") from exc
-
-        items = data.get("items")
-        if not isinstance(items, list):
-            logger.error("LLM batch JSON missing 'items' list: %r", data)
-            raise LLMClassificationError("LLM batch JSON missing 'items' list")
-
-        if not items:
-            logger.error("LLM batch JSON contained an empty 'items' list: %r", data)
-            raise LLMClassificationError(
-                "LLM batch JSON contained an empty 'items' list",
-            )
+        # record usage before validation: a malformed answer is billed too
+        self._last_usage = _get_response_usage(response)
 
-        results: dict[str, LLMClassificationResult] = {}
-
-        # log if skip malformed items to catch format drift early
-        for index, item in enumerate(items):
-            if not isinstance(item, dict):
-                logger.warning(
-                    "Skipping non-dict item at index %d in LLM batch JSON: %r",
-                    index,
-                    item,
-                )
-                continue
-
-            id_raw = item.get("id")
-            id = normalize_str_or_none(id_raw)
-            if not id:
-                logger.warning(
-                    "Skipping LLM item without valid 'id' at index %d: %r",
-                    index,
-                    item,
-                )
-                continue
-
-            # warn if model returned SLA fields (must be ignored; SLA comes from Service Catalog)
-            raw_sla_unit = item.get("sla_unit")
-            raw_sla_value = item.get("sla_value")
-            if raw_sla_unit is not None or raw_sla_value is not None:
-                logger.warning(
-                    "LLM returned SLA fields for request %s at index %d (sla_unit=%r, sla_value=%r). "
-                    "Ignoring them; SLA is derived from Service Catalog.",
-                    id,
-                    index,
-                    raw_sla_unit,
-                    raw_sla_value,
-                )
-
-            result = LLMClassificationResult(
-                request_category=normalize_str_or_none(item.get("request_category")),
-                request_type=normalize_str_or_none(item.get("request_type")),
-            )
-            results[id] = result
-
-        # if all items were rejected, treat it as a format error
-        if not results:
-            logger.error(
-                "LLM batch JSON contained %d item(s) but no valid results after "
-                "validation. Data: %r",
-                len(items),
-                items,
-            )
-            raise LLMClassificationError(
-                "LLM batch JSON contained no valid items (all missing or invalid 'id')",
-            )
+        text = _get_response_text(response)
+        results = decode_batch_response(text)
 
         logger.debug("LLM batch classification produced %d items", len(results))
 
@@ -189,20 +194,6 @@ class LLMClassifier:
 
         return results
 
-def _catalog_to_prompt_fragment(catalog: ServiceCatalog) -> str:
-    """Render the Service Catalog into a simple text fragment for the prompt."""
-
-    lines: list[str] = []
-    for category in catalog.categories:
-        for req_type in category.requests:
-            sla = req_type.sla
-            lines.append(
-                f"- Category: {category.name} | "
-                f"Request Type: {req_type.name} | "
-                f"SLA: {sla.value} {sla.unit}"
-            )
-    return "\n".join(lines)
-
 def _build_batch(requests: list[HelpdeskRequest]) -> str:
     """Build the text block describing all requests for the LLM prompt."""
 
@@ -223,4 +214,19 @@ def _get_response_text(response: Any) -> str:
     text = getattr(response, "text", None)
     if isinstance(text, str) and text.strip():
         return text
-    raise LLMClassificationError("LLM response contained no text")
\ No newline at end of file
+    raise LLMClassificationError("LLM response contained no text")
+
+def _get_response_usage(response: Any) -> LLMUsage | None:
+    """Map GenAI usage metadata into LLMUsage (thinking tokens are billed as output)."""
+
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return None
+
+    prompt_tokens = getattr(usage, "prompt_token_count", None) or 0
+    candidates_tokens = getattr(usage, "candidates_token_count", None) or 0
+    thoughts_tokens = getattr(usage, "thoughts_token_count", None) or 0
+    return LLMUsage(
+        input_tokens=int(prompt_tokens),
+        output_tokens=int(candidates_tokens) + int(thoughts_tokens),
+    )
@@ -0,0 +1,142 @@
+from __future__ import annotations
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class LLMCallTimeoutError(TimeoutError):
+    """Raised when an LLM call does not answer before its deadline."""
+
+class LatencyTracker:
+    """Keeps a sliding window of observed call latencies (seconds)."""
+
+    def __init__(self, window: int = 50, min_samples: int = 5) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """Return the ``q`` percentile (0..1) or None until enough samples exist."""
+
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            ordered = sorted(self._samples)
+
+        index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[index]
+
+class HedgedCaller:
+    """Runs blocking calls with a hard deadline and optional request hedging.
+
+        Each call runs on a worker thread and is abandoned once
+        ``timeout_seconds`` elapse. With hedging enabled, a call that has not
+        answered by the observed latency percentile gets a duplicate request and
+        whichever answers first wins. The share of hedged calls is capped by
+        ``hedge_budget_ratio`` so a slow provider does not get twice the load.
+        """
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        hedge_enabled: bool = False,
+        hedge_budget_ratio: float = 0.1,
+        hedge_percentile: float = 0.95,
+        latency_tracker: LatencyTracker | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        self._timeout_seconds = timeout_seconds
+        self._hedge_enabled = hedge_enabled
+        self._hedge_budget_ratio = hedge_budget_ratio
+        self._hedge_percentile = hedge_percentile
+        self._latencies = latency_tracker or LatencyTracker()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="llm-call",
+        )
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._hedges = 0
+
+    @property
+    def hedges_used(self) -> int:
+        return self._hedges
+
+    def call(self, fn: Callable[[], T], timeout_seconds: float | None = None) -> T:
+        """Run ``fn`` and return the first successful result within the deadline.
+
+            Raises LLMCallTimeoutError when no attempt answers in time, or
+            re-raises the last attempt's exception when every attempt failed.
+            """
+
+        timeout = self._timeout_seconds if timeout_seconds is None else timeout_seconds
+        start = time.monotonic()
+        deadline = start + timeout
+
+        with self._lock:
+            self._calls += 1
+
+        pending: set[Future[T]] = {self._executor.submit(fn)}
+
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is not None and hedge_delay < timeout:
+            done, _ = wait(pending, timeout=hedge_delay)
+            if not done and self._take_hedge_slot():
+                logger.warning(
+                    "LLM call has not answered after %.2fs (p%d latency); sending hedged duplicate",
+                    hedge_delay,
+                    int(self._hedge_percentile * 100),
+                )
+                pending.add(self._executor.submit(fn))
+
+        last_exc: BaseException | None = None
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                exc = future.exception()
+                if exc is not None:
+                    last_exc = exc
+                    continue
+
+                self._latencies.record(time.monotonic() - start)
+                # losers cannot be interrupted; they finish in the background and are dropped
+                for loser in pending:
+                    loser.cancel()
+                return future.result()
+
+        if pending or last_exc is None:
+            raise LLMCallTimeoutError(f"LLM call did not answer within {timeout:.1f}s")
+
+        raise last_exc
+
+    def _hedge_delay(self) -> float | None:
+        if not self._hedge_enabled:
+            return None
+        return self._latencies.percentile(self._hedge_percentile)
+
+    def _take_hedge_slot(self) -> bool:
+        with self._lock:
+            if self._hedges + 1 > self._hedge_budget_ratio * self._calls:
+                logger.debug(
+                    "Hedge budget exhausted (%d hedges for %d calls); not hedging",
+                    self._hedges,
+                    self._calls,
+                )
+                return False
+            self._hedges += 1
+            return True
@@ -0,0 +1,110 @@
+from __future__ import annotations
+import json
+import logging
+from typing import Any, Callable
+from app.application.llm_classifier import LLMClassificationResult, LLMClassificationError
+from app.shared.normalization import normalize_str_or_none
+
+
+logger = logging.getLogger(__name__)
+
+# optional fast JSON backend; stdlib json is the fallback
+_loads: Callable[[str], Any]
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:  # pragma: no cover - depends on the environment
+    _loads = json.loads
+    JSON_BACKEND = "json"
+
+# longest payload fragment written to logs on validation errors
+_LOG_PREVIEW_CHARS = 300
+
+def decode_batch_response(text: str) -> dict[str, LLMClassificationResult]:
+    """Decode the LLM batch JSON into LLMClassificationResult objects keyed by id.
+
+        Expected schema: ``{"items": [{"id": str|int, "request_category": str|null,
+        "request_type": str|null, ...}, ...]}``. Items are validated and converted
+        in a single pass; malformed items are skipped with a warning, model-provided
+        SLA fields are ignored.
+
+        Raises LLMClassificationError on invalid JSON, a missing/empty ``items``
+        list, or when no item survives validation.
+        """
+
+    try:
+        data = _loads(text)
+    except ValueError as exc:
+        logger.error("LLM batch returned non-JSON output: %r", text[:_LOG_PREVIEW_CHARS])
+        raise LLMClassificationError("LLM batch output was not valid JSON") from exc
+
+    items = data.get("items") if type(data) is dict else None
+    if type(items) is not list:
+        logger.error("LLM batch JSON missing 'items' list: %s", _preview(data))
+        raise LLMClassificationError("LLM batch JSON missing 'items' list")
+
+    if not items:
+        logger.error("LLM batch JSON contained an empty 'items' list: %s", _preview(data))
+        raise LLMClassificationError(
+            "LLM batch JSON contained an empty 'items' list",
+        )
+
+    results: dict[str, LLMClassificationResult] = {}
+
+    # log if skip malformed items to catch format drift early
+    for index, item in enumerate(items):
+        if type(item) is not dict:
+            logger.warning(
+                "Skipping non-dict item at index %d in LLM batch JSON: %s",
+                index,
+                _preview(item),
+            )
+            continue
+
+        id = normalize_str_or_none(item.get("id"))
+        if not id:
+            logger.warning(
+                "Skipping LLM item without valid 'id' at index %d: %s",
+                index,
+                _preview(item),
+            )
+            continue
+
+        # warn if model returned SLA fields (must be ignored; SLA comes from Service Catalog)
+        raw_sla_unit = item.get("sla_unit")
+        raw_sla_value = item.get("sla_value")
+        if raw_sla_unit is not None or raw_sla_value is not None:
+            logger.warning(
+                "LLM returned SLA fields for request %s at index %d (sla_unit=%r, sla_value=%r). "
+                "Ignoring them; SLA is derived from Service Catalog.",
+                id,
+                index,
+                raw_sla_unit,
+                raw_sla_value,
+            )
+
+        results[id] = LLMClassificationResult(
+            request_category=normalize_str_or_none(item.get("request_category")),
+            request_type=normalize_str_or_none(item.get("request_type")),
+        )
+
+    # if all items were rejected, treat it as a format error
+    if not results:
+        logger.error(
+            "LLM batch JSON contained %d item(s) but no valid results after validation. Items: %s",
+            len(items),
+            _preview(items),
+        )
+        raise LLMClassificationError(
+            "LLM batch JSON contained no valid items (all missing or invalid 'id')",
+        )
+
+    return results
+
+def _preview(value: Any) -> str:
+    text = repr(value)
+    if len(text) <= _LOG_PREVIEW_CHARS:
+        return text
+    return f"{text[:_LOG_PREVIEW_CHARS]}... ({len(text)} chars)"
@@ -0,0 +1,62 @@
+from __future__ import annotations
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from app.application.ports.helpdesk_service_port import HelpdeskRequestProvider
+from app.domain.helpdesk import HelpdeskRequest
+from app.infrastructure.helpdesk_client import HelpdeskAPIError
+from app.infrastructure.helpdesk_client_request_provider import HelpdeskClientRequestProvider
+
+
+logger = logging.getLogger(__name__)
+
+class MultiSourceRequestProvider(HelpdeskRequestProvider):
+    """Fetches several helpdesk tenants concurrently and merges them into one stream.
+
+        Each source is fetched through its own provider (and client) on a worker
+        thread; results are concatenated in configuration order. A failing source
+        is logged and left out as long as another source succeeded; its
+        watermark is not advanced, so incremental runs pick it up next time.
+        """
+
+    def __init__(self, providers: Sequence[HelpdeskClientRequestProvider]) -> None:
+        if not providers:
+            raise ValueError("MultiSourceRequestProvider needs at least one provider")
+        self._providers = list(providers)
+        self.failed_sources: list[str] = []
+
+    @property
+    def sources(self) -> list[str]:
+        return [provider.source for provider in self._providers]
+
+    def fetch_requests(self) -> Sequence[HelpdeskRequest]:
+        self.failed_sources = []
+        with ThreadPoolExecutor(
+            max_workers=len(self._providers),
+            thread_name_prefix="helpdesk-source",
+        ) as executor:
+            futures = [executor.submit(provider.fetch_requests) for provider in self._providers]
+
+        merged: list[HelpdeskRequest] = []
+        first_error: HelpdeskAPIError | None = None
+        for provider, future in zip(self._providers, futures):
+            try:
+                requests_ = future.result()
+            except HelpdeskAPIError as exc:
+                logger.error("Helpdesk source %r failed; continuing without it: %s", provider.source, exc)
+                self.failed_sources.append(provider.source)
+                first_error = first_error or exc
+                continue
+            logger.info("Helpdesk source %r: %d request(s)", provider.source, len(requests_))
+            merged.extend(requests_)
+
+        if first_error is not None and len(self.failed_sources) == len(self._providers):
+            raise first_error
+        return merged
+
+    def commit(self) -> None:
+        """Advance the watermark of every source that was fetched successfully."""
+
+        for provider in self._providers:
+            if provider.source not in self.failed_sources:
+                provider.commit()
@@ -9,9 +9,13 @@ from app.infrastructure.save_excel import save_excel
 
 
 class ExcelReportExporter(ReportExporterPort):
-    def export(self, requests: Sequence[HelpdeskRequest]) -> Path:
+    def __init__(self, output_dir: Path | None = None) -> None:
+        # None = <project root>/output
+        self._output_dir = output_dir
+
+    def export(self, requests: Sequence[HelpdeskRequest], filename_prefix: str = "") -> Path:
         try:
-            excel_path_str = save_excel(list(requests))
+            excel_path_str = save_excel(list(requests), filename_prefix=filename_prefix, output_dir=self._output_dir)
         except ExcelReportError as exc:
             raise ReportGenerationError(str(exc)) from exc
 
@@ -8,7 +8,12 @@ from app.infrastructure.build_excel import build_excel, ExcelReportError
 
 logger = logging.getLogger(__name__)
 
-def save_excel(requests: list[HelpdeskRequest], output_path: str | None = None, filename_prefix: str = "",) -> str:
+def save_excel(
+    requests: list[HelpdeskRequest],
+    output_path: str | None = None,
+    filename_prefix: str = "",
+    output_dir: Path | None = None,
+) -> str:
     try:
         excel_bytes = build_excel(requests)
     except ExcelReportError as exc:
@@ -20,7 +25,7 @@ def save_excel(requests: list[HelpdeskRequest], output_path: str | None = None,
     if output_path is None:
         timestamp = datetime.now().isoformat(timespec="seconds").replace(":", "-")
         filename = f"{filename_prefix}classified_requests_{timestamp}.xlsx"
-        path = project_root / "output" / filename
+        path = (project_root / "output" if output_dir is None else output_dir) / filename
     else:
         path = Path(output_path)
         if not path.is_absolute():
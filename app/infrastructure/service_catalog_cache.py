@@ -0,0 +1,80 @@
+from __future__ import annotations
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from app.domain.service_catalog import ServiceCatalog
+from app.infrastructure.service_catalog_json import catalog_from_json, catalog_to_json
+
+
+logger = logging.getLogger(__name__)
+
+_FORMAT_VERSION = 1
+
+@dataclass(frozen=True)
+class CachedServiceCatalog:
+    url: str
+    body: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    catalog: ServiceCatalog
+
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+class ServiceCatalogCache:
+    """On-disk copy of the last Service Catalog response and its parsed model.
+
+        One JSON file holds the raw body, the validators (ETag/Last-Modified)
+        and the domain model, so a 304 needs neither the body nor YAML parsing.
+        A missing, unreadable or foreign (other URL/format) file is a cache miss.
+        """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+
+    def load(self, url: str) -> CachedServiceCatalog | None:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable Service Catalog cache %s: %s", self._path, exc)
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION or data.get("url") != url:
+            return None
+        try:
+            return CachedServiceCatalog(
+                url=url,
+                body=data["body"],
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+                fetched_at=float(data["fetched_at"]),
+                catalog=catalog_from_json(data["catalog"]),
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Ignoring malformed Service Catalog cache %s: %s", self._path, exc)
+            return None
+
+    def save(self, entry: CachedServiceCatalog) -> None:
+        data = {
+            "version": _FORMAT_VERSION,
+            "url": entry.url,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "fetched_at": entry.fetched_at,
+            "body": entry.body,
+            "catalog": catalog_to_json(entry.catalog),
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # write + rename so a crash never leaves a truncated cache behind
+            tmp_path = self._path.with_name(self._path.name + ".tmp")
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+        except OSError as exc:
+            logger.warning("Could not write Service Catalog cache %s: %s", self._path, exc)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 import logging
+import time
+from dataclasses import replace
 from typing import Any, List
 import requests
 from requests import HTTPError, RequestException
 from app.config import ServiceCatalogConfig
 from app.domain.service_catalog import SLA, ServiceRequestType, ServiceCategory, ServiceCatalog
-import time
 from app.shared.errors import ServiceCatalogLoadError
+from app.infrastructure.http_transport import RetryingTransport, build_session
+from app.infrastructure.service_catalog_cache import CachedServiceCatalog, ServiceCatalogCache
+from app.infrastructure.service_catalog_snapshot import ServiceCatalogSnapshots, content_hash
 
 
 logger = logging.getLogger(__name__)
@@ -17,7 +21,11 @@ class ServiceCatalogError(RuntimeError):
 class ServiceCatalogClient:
     """HTTP client for downloading and parsing the Service Catalog.
         Fetches a YAML document from the configured URL and maps it into
-        ServiceCatalog domain objects.
+        ServiceCatalog domain objects. With a ``cache`` the request is
+        conditional (ETag / Last-Modified): a 304 reuses the cached parsed
+        catalog, and if the endpoint fails the cached copy is served while it is
+        younger than ``max_stale_seconds`` (None = any age). With ``snapshots``
+        a body seen before is loaded from its binary snapshot instead of YAML.
         """
 
     def __init__(
@@ -25,11 +33,23 @@ class ServiceCatalogClient:
         config: ServiceCatalogConfig,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
+        session: requests.Session | None = None,
+        max_backoff_seconds: float = 30.0,
+        cache: ServiceCatalogCache | None = None,
+        max_stale_seconds: float | None = None,
+        snapshots: ServiceCatalogSnapshots | None = None,
     ) -> None:
         self._config = config
-        self._session = requests.Session()
-        self._max_retries = max_retries
-        self._backoff_factor = backoff_factor
+        self._cache = cache
+        self._snapshots = snapshots
+        self._max_stale_seconds = max_stale_seconds
+        self._session = session if session is not None else build_session()
+        self._transport = RetryingTransport(
+            "Service Catalog",
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            max_backoff_seconds=max_backoff_seconds,
+        )
 
     def fetch_catalog(self) -> ServiceCatalog:
         """Download and parse the Service Catalog into domain models.
@@ -37,115 +57,187 @@ class ServiceCatalogClient:
             the YAML structure does not match the expected schema.
             """
 
+        cached = self._cache.load(self._config.url) if self._cache is not None else None
         try:
-            text = self._download_text()
-            data = self._parse_yaml(text)
-
-            try:
-                categories_raw = data["service_catalog"]["catalog"]["categories"]
-            except (TypeError, KeyError) as exc:
-                msg = (
-                    "Unexpected Service Catalog shape; "
-                    "expected 'service_catalog.catalog.categories'"
+            return self._fetch(cached)
+        except ServiceCatalogError as exc:
+            stale = self._stale_fallback(cached, exc)
+            if stale is not None:
+                return stale
+            raise ServiceCatalogLoadError(str(exc)) from exc
+        except (RequestException, HTTPError, ValueError, TypeError, KeyError) as exc:
+            stale = self._stale_fallback(cached, exc)
+            if stale is not None:
+                return stale
+            raise ServiceCatalogLoadError("Failed to load Service Catalog") from exc
+        finally:
+            self._transport.log_stats()
+
+    def _fetch(self, cached: CachedServiceCatalog | None) -> ServiceCatalog:
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = self._download(headers or None)
+
+        if cached is not None and response.status_code == 304:
+            logger.info("Service Catalog not modified (304); using cached copy")
+            self._store(replace(cached, fetched_at=time.time()))
+            return cached.catalog
+
+        text = response.text
+        logger.debug("Raw Service Catalog response length=%d", len(text))
+        if cached is not None and text == cached.body:
+            # server without validators: same body, skip parsing
+            catalog = cached.catalog
+        else:
+            catalog = self._catalog_from_text(text)
+
+        if self._cache is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            self._store(
+                CachedServiceCatalog(
+                    url=self._config.url,
+                    body=text,
+                    etag=etag if isinstance(etag, str) else None,
+                    last_modified=last_modified if isinstance(last_modified, str) else None,
+                    fetched_at=time.time(),
+                    catalog=catalog,
                 )
-                logger.error("%s: %s", msg, exc)
-                raise ServiceCatalogError(msg) from exc
-
-            try:
-                categories: List[ServiceCategory] = []
-                for cat in categories_raw:
-                    name = cat["name"]
-                    requests_raw = cat["requests"]
-
-                    requests = [
-                        ServiceRequestType(
-                            name=req["name"],
-                            sla=SLA(
-                                unit=req["sla"]["unit"],
-                                value=int(req["sla"]["value"]),
-                            ),
-                        )
-                        for req in requests_raw
-                    ]
-
-                    categories.append(ServiceCategory(name=name, requests=requests))
-            except (KeyError, TypeError, ValueError) as exc:
-                msg = "Failed to map Service Catalog to domain models"
-                logger.error("%s: %s", msg, exc)
-                raise ServiceCatalogError(msg) from exc
-
-            catalog = ServiceCatalog(categories=categories)
+            )
+        return catalog
+
+    def _store(self, entry: CachedServiceCatalog) -> None:
+        if self._cache is not None:
+            self._cache.save(entry)
+
+    def _stale_fallback(self, cached: CachedServiceCatalog | None, exc: Exception) -> ServiceCatalog | None:
+        """stale-if-error: the cached catalog when it is not too old, else None."""
+
+        if cached is None:
+            return None
+        age = cached.age_seconds()
+        if self._max_stale_seconds is not None and age > self._max_stale_seconds:
+            logger.error(
+                "Service Catalog failed and the cached copy is too old to use (%.0fs > %.0fs)",
+                age,
+                self._max_stale_seconds,
+            )
+            return None
+        logger.warning("Service Catalog failed (%s); using cached copy from %.0fs ago", exc, age)
+        return cached.catalog
+
+    def _catalog_from_text(self, text: str) -> ServiceCatalog:
+        """Map a catalog body, via its content-hash snapshot when one exists."""
+
+        if self._snapshots is None:
+            return self._build_catalog(text)
+
+        key = content_hash(text)
+        catalog = self._snapshots.load(key)
+        if catalog is not None:
             logger.info(
-                "[part 2] Loaded Service Catalog: %d categories, %d total request types",
+                "[part 2] Loaded Service Catalog from snapshot: %d categories, %d total request types",
                 len(catalog.categories),
                 sum(len(c.requests) for c in catalog.categories),
             )
             return catalog
-        except ServiceCatalogError as exc:
-            raise ServiceCatalogLoadError(str(exc)) from exc
-        except (RequestException, HTTPError, ValueError, TypeError, KeyError) as exc:
-            raise ServiceCatalogLoadError("Failed to load Service Catalog") from exc
 
-    def _download_text(self) -> str:
-        """Download the raw YAML text for the Service Catalog."""
+        catalog = self._build_catalog(text)
+        self._snapshots.save(key, catalog)
+        return catalog
+
+    def _build_catalog(self, text: str) -> ServiceCatalog:
+        """Parse the YAML text and map it into domain models (raises ServiceCatalogError)."""
 
-        # retry GET with exponential backoff on HTTP/network errors
-        response: requests.Response | None = None
-        last_exc: Exception | None = None
+        return _map_catalog(self._parse_yaml(text))
 
-        for attempt in range(1, self._max_retries + 1):
-            try:
-                response = self._session.get(
+    def _download(self, headers: dict[str, str] | None = None) -> requests.Response:
+        # pooled keep-alive session; retries with jittered backoff + Retry-After
+        try:
+            return self._transport.call(
+                lambda: self._session.get(
                     self._config.url,
+                    headers=headers,
                     timeout=self._config.timeout_seconds,
                 )
-                response.raise_for_status()
-                break
-            except (HTTPError, RequestException) as exc:
-                last_exc = exc
-                if attempt == self._max_retries:
-                    msg = (
-                        "Error calling Service Catalog endpoint after "
-                        f"{self._max_retries} attempts: {exc}"
-                    )
-                    logger.error(msg)
-                    raise ServiceCatalogError(msg) from exc
-
-                sleep_seconds = self._backoff_factor * (2 ** (attempt - 1))
-                logger.warning(
-                    "Service Catalog request failed on attempt %d/%d: %s; "
-                    "retrying in %.1f seconds",
-                    attempt,
-                    self._max_retries,
-                    exc,
-                    sleep_seconds,
-                )
-                time.sleep(sleep_seconds)
-
-        if response is None:
-            msg = "Service Catalog request failed without a response object"
+            )
+        except RequestException as exc:
+            msg = (
+                "Error calling Service Catalog endpoint "
+                f"(max {self._transport.max_retries} attempts): {exc}"
+            )
             logger.error(msg)
-            if last_exc is not None:
-                raise ServiceCatalogError(msg) from last_exc
-            raise ServiceCatalogError(msg)
-
-        text = response.text
-        logger.debug("Raw Service Catalog response length=%d", len(text))
-        return text
+            raise ServiceCatalogError(msg) from exc
 
     def _parse_yaml(self, text: str) -> Any:
         """Parse the given YAML text into a Python structure"""
 
-        try:
-            import yaml
-        except ImportError as exc:
-            msg = "PyYAML is required to parse the Service Catalog"
-            logger.error(msg)
-            raise ServiceCatalogError(msg) from exc
-
-        try:
-            return yaml.safe_load(text)
-        except yaml.YAMLError as exc:
-            msg = "Failed to parse Service Catalog YAML"
-            logger.error(msg)
-            raise ServiceCatalogError(msg) from exc
\ No newline at end of file
+        return _parse_catalog_yaml(text)
+
+def _map_catalog(data: Any) -> ServiceCatalog:
+    """Map the parsed catalog document into domain models (raises ServiceCatalogError)."""
+
+    try:
+        categories_raw = data["service_catalog"]["catalog"]["categories"]
+    except (TypeError, KeyError) as exc:
+        msg = (
+            "Unexpected Service Catalog shape; "
+            "expected 'service_catalog.catalog.categories'"
+        )
+        logger.error("%s: %s", msg, exc)
+        raise ServiceCatalogError(msg) from exc
+
+    try:
+        categories: List[ServiceCategory] = []
+        for cat in categories_raw:
+            name = cat["name"]
+            requests_raw = cat["requests"]
+
+            requests = [
+                ServiceRequestType(
+                    name=req["name"],
+                    sla=SLA(
+                        unit=req["sla"]["unit"],
+                        value=int(req["sla"]["value"]),
+                    ),
+                )
+                for req in requests_raw
+            ]
+
+            categories.append(ServiceCategory(name=name, requests=requests))
+    except (KeyError, TypeError, ValueError) as exc:
+        msg = "Failed to map Service Catalog to domain models"
+        logger.error("%s: %s", msg, exc)
+        raise ServiceCatalogError(msg) from exc
+
+    catalog = ServiceCatalog(categories=categories)
+    logger.info(
+        "[part 2] Loaded Service Catalog: %d categories, %d total request types",
+        len(catalog.categories),
+        sum(len(c.requests) for c in catalog.categories),
+    )
+    return catalog
+
+def _parse_catalog_yaml(text: str) -> Any:
+    """Parse catalog YAML, with LibYAML's C loader when available (raises ServiceCatalogError)."""
+
+    try:
+        import yaml
+    except ImportError as exc:
+        msg = "PyYAML is required to parse the Service Catalog"
+        logger.error(msg)
+        raise ServiceCatalogError(msg) from exc
+
+    # LibYAML's C loader is several times faster; same safe semantics
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(text, Loader=loader)
+    except yaml.YAMLError as exc:
+        msg = "Failed to parse Service Catalog YAML"
+        logger.error(msg)
+        raise ServiceCatalogError(msg) from exc
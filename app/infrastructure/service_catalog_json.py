@@ -0,0 +1,37 @@
+from __future__ import annotations
+from typing import Any
+from app.domain.service_catalog import SLA, ServiceCatalog, ServiceCategory, ServiceRequestType
+
+
+def catalog_to_json(catalog: ServiceCatalog) -> list[dict[str, Any]]:
+    """JSON-ready list of categories with their request types and SLAs."""
+
+    return [
+        {
+            "name": category.name,
+            "requests": [
+                {"name": req.name, "sla": {"unit": req.sla.unit, "value": req.sla.value}}
+                for req in category.requests
+            ],
+        }
+        for category in catalog.categories
+    ]
+
+def catalog_from_json(raw: list[dict[str, Any]]) -> ServiceCatalog:
+    """Inverse of ``catalog_to_json``."""
+
+    return ServiceCatalog(
+        categories=[
+            ServiceCategory(
+                name=category["name"],
+                requests=[
+                    ServiceRequestType(
+                        name=req["name"],
+                        sla=SLA(unit=req["sla"]["unit"], value=int(req["sla"]["value"])),
+                    )
+                    for req in category["requests"]
+                ],
+            )
+            for category in raw
+        ]
+    )
@@ -0,0 +1,109 @@
+from __future__ import annotations
+import hashlib
+import logging
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Any
+from app.domain.service_catalog import SLA, ServiceCatalog, ServiceCategory, ServiceRequestType
+
+
+logger = logging.getLogger(__name__)
+
+# bump when the payload layout changes; old snapshots are then ignored and rebuilt
+SNAPSHOT_FORMAT_VERSION = 1
+
+# marshal output is only stable within one Python minor version
+_HEADER = f"SCSNAP{SNAPSHOT_FORMAT_VERSION}:py{sys.version_info[0]}{sys.version_info[1]}\n".encode("ascii")
+
+def content_hash(text: str) -> str:
+    """Snapshot key of a catalog body (the raw YAML as served)."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class ServiceCatalogSnapshots:
+    """Compact binary snapshots of mapped ServiceCatalogs, keyed by content hash.
+
+        The payload is plain nested tuples serialized with ``marshal`` (no YAML,
+        no object graph), so loading skips both parsing and validation of the
+        source document. A snapshot written by another format version or Python
+        version is ignored. Only the ``keep`` most recent snapshots are kept.
+        Derived lookups (``CatalogIndex``) are not stored: they are rebuilt per
+        run in one linear pass over the loaded catalog.
+        """
+
+    def __init__(self, directory: str | Path, keep: int = 3) -> None:
+        self._directory = Path(directory)
+        self._keep = max(1, keep)
+
+    def load(self, key: str) -> ServiceCatalog | None:
+        path = self._path(key)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning("Cannot read Service Catalog snapshot %s: %s", path, exc)
+            return None
+
+        if not raw.startswith(_HEADER):
+            logger.info("Ignoring Service Catalog snapshot %s from another format/Python version", path.name)
+            return None
+        try:
+            catalog = _catalog_from_payload(marshal.loads(raw[len(_HEADER):]))
+        except (EOFError, ValueError, TypeError, IndexError) as exc:
+            logger.warning("Ignoring corrupt Service Catalog snapshot %s: %s", path, exc)
+            return None
+
+        logger.debug("Service Catalog loaded from snapshot %s", path.name)
+        return catalog
+
+    def save(self, key: str, catalog: ServiceCatalog) -> None:
+        path = self._path(key)
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_bytes(_HEADER + marshal.dumps(_catalog_to_payload(catalog)))
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not write Service Catalog snapshot %s: %s", path, exc)
+            return
+        self._prune()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.snapshot"
+
+    def _prune(self) -> None:
+        try:
+            snapshots = sorted(
+                self._directory.glob("*.snapshot"),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True,
+            )
+            for old in snapshots[self._keep:]:
+                old.unlink()
+        except OSError as exc:
+            logger.debug("Could not prune Service Catalog snapshots: %s", exc)
+
+def _catalog_to_payload(catalog: ServiceCatalog) -> tuple[Any, ...]:
+    return tuple(
+        (category.name, tuple((req.name, req.sla.unit, req.sla.value) for req in category.requests))
+        for category in catalog.categories
+    )
+
+def _catalog_from_payload(payload: Any) -> ServiceCatalog:
+    if not isinstance(payload, tuple):
+        raise TypeError("snapshot payload must be a tuple")
+    return ServiceCatalog(
+        categories=[
+            ServiceCategory(
+                name=name,
+                requests=[
+                    ServiceRequestType(name=req_name, sla=SLA(unit=unit, value=value))
+                    for req_name, unit, value in requests
+                ],
+            )
+            for name, requests in payload
+        ]
+    )
@@ -0,0 +1,39 @@
+from __future__ import annotations
+import time
+from typing import Callable
+
+
+class Deadline:
+    """Monotonic time budget shared by all stages of a single run.
+
+        ``seconds=None`` means "no budget": every check passes and
+        ``remaining()`` returns None.
+        """
+
+    def __init__(self, seconds: float | None, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._seconds = seconds
+        self._started_at = clock()
+
+    @property
+    def bounded(self) -> bool:
+        return self._seconds is not None
+
+    def elapsed(self) -> float:
+        return self._clock() - self._started_at
+
+    def remaining(self) -> float | None:
+        if self._seconds is None:
+            return None
+        return max(0.0, self._seconds - self.elapsed())
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0.0
+
+    def has_at_least(self, seconds: float) -> bool:
+        """Return True if more than ``seconds`` of budget is left (always True when unbounded)."""
+
+        remaining = self.remaining()
+        return remaining is None or remaining > seconds
+
@@ -0,0 +1,119 @@
+from __future__ import annotations
+import re
+from datetime import datetime, timedelta
+from typing import Protocol
+
+
+_INTERVAL_RE = re.compile(r"^(?:@every\s+)?(\d+)\s*([smhd]?)$")
+_INTERVAL_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+_CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+# give up looking for a matching cron minute after this many years (e.g. "0 0 31 2 *")
+_CRON_SEARCH_YEARS = 5
+
+class Schedule(Protocol):
+    def next_after(self, moment: datetime) -> datetime:
+        """First fire time strictly after ``moment``."""
+        ...
+
+class IntervalSchedule:
+    """Fires ``seconds`` after the moment asked about (a daemon asks when its previous run ends)."""
+
+    def __init__(self, seconds: float) -> None:
+        if seconds <= 0:
+            raise ValueError("interval must be > 0 seconds")
+        self.seconds = seconds
+
+    def next_after(self, moment: datetime) -> datetime:
+        return moment + timedelta(seconds=self.seconds)
+
+    def __repr__(self) -> str:
+        return f"IntervalSchedule({self.seconds:g}s)"
+
+class CronSchedule:
+    """Standard 5-field cron expression (minute hour day-of-month month day-of-week).
+
+        Fields accept ``*``, numbers, ranges (``1-5``), lists (``1,15``) and
+        steps (``*/15``, ``8-18/2``). Day-of-week 0 and 7 are Sunday. As in cron,
+        when both day fields are restricted a day matches if either does.
+        Times are evaluated in the timezone of the datetime passed in.
+        """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = _CRON_ALIASES.get(expression.strip(), expression.strip())
+        fields = self.expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron expression needs 5 fields: {expression!r}")
+        self.minutes = _parse_field(fields[0], 0, 59)
+        self.hours = _parse_field(fields[1], 0, 23)
+        self.days = _parse_field(fields[2], 1, 31)
+        self.months = _parse_field(fields[3], 1, 12)
+        # cron counts Sunday as 0 (and 7); date.weekday() counts Monday as 0
+        self.weekdays = frozenset((day - 1) % 7 for day in _parse_field(fields[4], 0, 7))
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def next_after(self, moment: datetime) -> datetime:
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * _CRON_SEARCH_YEARS)
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                candidate = _first_of_next_month(candidate)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"cron expression never fires: {self.expression!r}")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = moment.weekday() in self.weekdays
+        if self._any_day:
+            return weekday_ok
+        if self._any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+def parse_schedule(spec: str) -> IntervalSchedule | CronSchedule:
+    """``900``, ``15m``, ``@every 1h`` -> interval; anything else is a cron expression."""
+
+    text = spec.strip().lower()
+    match = _INTERVAL_RE.match(text)
+    if match:
+        return IntervalSchedule(int(match.group(1)) * _INTERVAL_UNITS[match.group(2)])
+    return CronSchedule(text)
+
+def _parse_field(field: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        range_part, _, step_part = part.partition("/")
+        step = int(step_part) if step_part else 1
+        if range_part == "*":
+            start, end = low, high
+        elif "-" in range_part:
+            start_str, end_str = range_part.split("-", 1)
+            start, end = int(start_str), int(end_str)
+        else:
+            start = int(range_part)
+            end = high if step_part else start
+        if step < 1 or not low <= start <= end <= high:
+            raise ValueError(f"cron field {field!r} out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+def _first_of_next_month(moment: datetime) -> datetime:
+    if moment.month == 12:
+        return moment.replace(year=moment.year + 1, month=1, day=1, hour=0, minute=0)
+    return moment.replace(month=moment.month + 1, day=1, hour=0, minute=0)
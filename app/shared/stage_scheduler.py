@@ -0,0 +1,77 @@
+from __future__ import annotations
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable
+
+
+logger = logging.getLogger(__name__)
+
+class StageTimeoutError(RuntimeError):
+    """Raised when waiting for a stage exceeds the given timeout (the stage keeps running)."""
+
+class StageScheduler:
+    """Runs independent pipeline stages on worker threads and joins on demand.
+
+        ``start`` launches a stage; ``result`` blocks only when a later stage
+        needs that stage's output and re-raises its exception. ``warm_up``
+        launches best-effort background work whose failures are logged, never
+        raised. Leaving the context does not wait for stages nobody joined.
+        """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="stage")
+        self._futures: dict[str, Future[Any]] = {}
+        self.timings: dict[str, float] = {}
+
+    def __enter__(self) -> StageScheduler:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def start(self, name: str, fn: Callable[..., Any], *args: Any) -> None:
+        if name in self._futures:
+            raise ValueError(f"Stage {name!r} already started")
+        self._futures[name] = self._executor.submit(self._timed, name, fn, *args)
+
+    def warm_up(self, name: str, fn: Callable[[], Any]) -> None:
+        def run() -> None:
+            try:
+                fn()
+            except Exception as exc:
+                logger.warning("Warm-up %r failed (ignored): %s", name, exc)
+
+        self.start(name, run)
+
+    def started(self, name: str) -> bool:
+        return name in self._futures
+
+    def result(self, name: str, timeout: float | None = None) -> Any:
+        """Wait for stage ``name`` and return its value (or raise its error).
+
+            Raises StageTimeoutError if the stage is still running after
+            ``timeout`` seconds (``None`` waits without limit).
+            """
+
+        future = self._futures[name]
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            if future.done():
+                # the stage itself failed with a timeout
+                raise
+            raise StageTimeoutError(f"Stage {name!r} did not finish within {timeout:.1f}s") from None
+
+    def shutdown(self) -> None:
+        # do not block on stages nobody is waiting for (e.g. skipped by the deadline);
+        # queued warm-ups still run
+        self._executor.shutdown(wait=False)
+
+    def _timed(self, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        started = time.monotonic()
+        try:
+            return fn(*args)
+        finally:
+            self.timings[name] = time.monotonic() - started
+            logger.debug("Stage %r finished in %.2fs", name, self.timings[name])
@@ -0,0 +1,89 @@
+from __future__ import annotations
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+import pytest
+from app.application.business_calendar import BusinessCalendar
+from app.application.catalog_index import CatalogIndex
+from app.application.fill_helpdesk_sla import fill_helpdesk_sla
+from app.domain.helpdesk import HelpdeskRequest
+from app.domain.service_catalog import SLA, ServiceCatalog, ServiceCategory, ServiceRequestType
+
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+def _office(holidays: tuple[date, ...] = ()) -> BusinessCalendar:
+    # Mon-Fri 09:00-17:00 Berlin time
+    return BusinessCalendar(tz=BERLIN, workdays=range(5), start_minute=9 * 60, end_minute=17 * 60, holidays=holidays)
+
+def _at(year: int, month: int, day: int, hour: int, minute: int = 0) -> datetime:
+    return datetime(year, month, day, hour, minute, tzinfo=BERLIN)
+
+def test_due_dates_skip_nights_weekends_and_holidays() -> None:
+    calendar = _office(holidays=(date(2026, 12, 25),))
+
+    # Thu 16:00 + 2h -> Thu 17:00 is 1h, Fri is a holiday, weekend -> Mon 10:00
+    assert calendar.add(_at(2026, 12, 24, 16), 2 * 3600) == _at(2026, 12, 28, 10)
+    # created on Saturday: the clock starts on Monday morning
+    assert calendar.add(_at(2026, 10, 24, 12), 3600) == _at(2026, 10, 26, 10)
+    # exactly one business day ends at closing time, not at the next opening
+    assert calendar.add(_at(2026, 10, 26, 9), 8 * 3600) == _at(2026, 10, 26, 17)
+    # before opening counts from opening
+    assert calendar.add(_at(2026, 10, 26, 7), 30 * 60) == _at(2026, 10, 26, 9, 30)
+
+def test_due_dates_follow_local_wall_time_across_dst() -> None:
+    calendar = _office()
+
+    # Fri 16:00 CEST + 8 business hours -> Mon 16:00 CET (clocks go back on Sun 25 Oct)
+    due = calendar.add(_at(2026, 10, 23, 16), 8 * 3600)
+    assert due == _at(2026, 10, 26, 16)
+    assert due.utcoffset() == timedelta(hours=1)
+
+def test_due_dates_far_from_the_first_lookup_grow_the_table() -> None:
+    calendar = _office()
+    calendar.add(_at(2026, 1, 5, 9), 3600)
+
+    # two years later and three years earlier than the first lookup
+    assert calendar.add(_at(2028, 1, 3, 9), 8 * 3600) == _at(2028, 1, 3, 17)
+    assert calendar.add(_at(2023, 1, 2, 9), 5 * 8 * 3600) == _at(2023, 1, 6, 17)
+    # a 300 business-day SLA lies far beyond the initial horizon
+    assert calendar.add(_at(2026, 1, 5, 9), 300 * 8 * 3600).year == 2027
+
+def test_default_calendar_is_calendar_time_and_units_map_to_business_time() -> None:
+    default = BusinessCalendar()
+    created = datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+    assert default.add(created, default.sla_seconds("days", 3) or 0) == created + timedelta(days=3)
+
+    office = _office()
+    assert office.sla_seconds("hours", 4) == 4 * 3600
+    assert office.sla_seconds("Days", 2) == 2 * 8 * 3600
+    assert office.sla_seconds("week", 1) == 5 * 8 * 3600
+    assert office.sla_seconds("fortnights", 1) is None
+
+    with pytest.raises(ValueError):
+        BusinessCalendar(start_minute=17 * 60, end_minute=9 * 60)
+
+def test_fill_helpdesk_sla_sets_due_dates_with_a_calendar() -> None:
+    catalog = ServiceCatalog(
+        categories=[ServiceCategory("Hardware", [ServiceRequestType("Laptop repair", SLA("days", 2))])]
+    )
+    derived = HelpdeskRequest(
+        id="r1",
+        short_description="broken screen",
+        request_category="Hardware",
+        request_type="Laptop repair",
+        created_at=datetime(2026, 10, 23, 14, tzinfo=timezone.utc),  # Fri 16:00 Berlin
+    )
+    preset = HelpdeskRequest(
+        id="r2",
+        short_description="printer",
+        sla_unit="hours",
+        sla_value=1,
+        created_at=datetime(2026, 10, 26, 8, 30),  # naive = UTC, Mon 09:30 Berlin
+    )
+    undated = HelpdeskRequest(id="r3", short_description="no date", request_category="Hardware", request_type="Laptop repair")
+
+    fill_helpdesk_sla([derived, preset, undated], CatalogIndex.build(catalog), _office())
+
+    assert derived.sla_due_at == _at(2026, 10, 27, 16)
+    assert preset.sla_due_at == _at(2026, 10, 26, 10, 30)
+    assert undated.sla_due_at is None
@@ -0,0 +1,43 @@
+from __future__ import annotations
+from app.application.catalog_diff import diff_catalogs
+from app.application.catalog_index import CatalogIndex
+from app.domain.service_catalog import SLA, ServiceCatalog, ServiceCategory, ServiceRequestType
+
+
+def _index(types: dict[str, list[tuple[str, int]]]) -> CatalogIndex:
+    return CatalogIndex.build(
+        ServiceCatalog(
+            categories=[
+                ServiceCategory(
+                    name=category,
+                    requests=[ServiceRequestType(name, SLA("hours", hours)) for name, hours in requests],
+                )
+                for category, requests in types.items()
+            ]
+        )
+    )
+
+def test_diff_detects_added_removed_renamed_and_sla_only_changes() -> None:
+    old = _index({
+        "Access": [("Reset password", 4), ("Grant acces", 8), ("Delete account", 24)],
+        "Hardware": [("Laptop repair", 48)],
+    })
+    new = _index({
+        "Access": [("Reset password", 2), ("Grant access", 8), ("Unlock account", 1)],
+        "Hardware": [("Laptop repair", 48)],
+    })
+
+    diff = diff_catalogs(old, new)
+
+    assert diff.renamed == {("Access", "Grant acces"): ("Access", "Grant access")}
+    assert diff.removed == {("Access", "Delete account")}
+    assert diff.added == {("Access", "Unlock account")}
+    assert diff.sla_changed == {("Access", "Reset password")}
+    assert diff.categories_with_new_types() == {"Access"}
+
+def test_diff_of_sla_only_change_is_not_structural() -> None:
+    diff = diff_catalogs(_index({"Access": [("Reset password", 4)]}), _index({"Access": [("Reset password", 2)]}))
+
+    assert not diff.structural
+    assert diff.sla_changed == {("Access", "Reset password")}
+    assert diff_catalogs(_index({"Access": [("Reset password", 4)]}), _index({"Access": [("Reset password", 4)]})).empty
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from app.application.catalog_index import CatalogIndex
+from app.application.service_catalog_matcher import CatalogMatch, ServiceCatalogMatcher
+from app.domain.service_catalog import SLA, ServiceCatalog, ServiceCategory, ServiceRequestType
+
+
+def _catalog(hours: int = 4) -> ServiceCatalog:
+    return ServiceCatalog(
+        categories=[
+            ServiceCategory(
+                name="Access Management",
+                requests=[
+                    ServiceRequestType("Reset password", SLA("hours", hours)),
+                    ServiceRequestType("reset  PASSWORD", SLA("hours", 8)),
+                    ServiceRequestType("Grant access", SLA("days", 1)),
+                ],
+            ),
+        ]
+    )
+
+def test_catalog_index_precomputes_lookups_once() -> None:
+    index = CatalogIndex.build(_catalog())
+
+    assert index.pairs[index.pair_ids[("Access Management", "Grant access")]] == ("Access Management", "Grant access")
+    assert index.sla[("Access Management", "Reset password")] == ("hours", 4)
+    assert index.resolve("  access management ", "GRANT   access") == ("Access Management", "Grant access")
+    # two entries normalize to the same key: ambiguous, never resolved
+    assert index.resolve("Access Management", "reset password") is None
+    assert index.prompt_fragment.splitlines()[2] == (
+        "- Category: Access Management | Request Type: Grant access | SLA: 1 days"
+    )
+    assert CatalogIndex.of(index) is index
+
+def test_catalog_index_fingerprint_follows_content() -> None:
+    assert CatalogIndex.build(_catalog()).fingerprint == CatalogIndex.build(_catalog()).fingerprint
+    assert CatalogIndex.build(_catalog()).fingerprint != CatalogIndex.build(_catalog(hours=5)).fingerprint
+
+def test_matcher_accepts_a_prebuilt_index() -> None:
+    matcher = ServiceCatalogMatcher(CatalogIndex.build(_catalog()))
+
+    assert matcher.resolve("access management", "grant access") == CatalogMatch("Access Management", "Grant access")
+    assert matcher.resolve("Access Management", "Reset password") is None
+
+def test_matcher_resolve_many_reports_hit_miss_and_collision_counts() -> None:
+    matcher = ServiceCatalogMatcher(CatalogIndex.build(_catalog()))
+    candidates: list[tuple[str | None, str | None]] = [
+        ("access management", "grant access"),
+        ("ACCESS MANAGEMENT", "Grant  Access"),
+        ("Access Management", "Reset password"),
+        ("Access Management", "Grant acess"),
+        ("Network", "VPN"),
+        (None, "Grant access"),
+    ]
+
+    matches, stats = matcher.resolve_many(candidates)
+
+    grant = CatalogMatch("Access Management", "Grant access")
+    assert matches == [grant, grant, None, grant, None, None]
+    assert matches == [matcher.resolve(c, t) for c, t in candidates]
+    assert (stats.exact, stats.recovered, stats.collisions, stats.misses) == (2, 1, 1, 2)
+    assert stats.hits == 3
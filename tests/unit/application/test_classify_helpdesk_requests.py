@@ -1,6 +1,10 @@
 from __future__ import annotations
 from typing import Mapping
-from app.application.classify_helpdesk_requests import classify_requests
+from app.application.classify_helpdesk_requests import classify_requests, ClassificationStats
+from app.application.catalog_index import CatalogIndex
+from app.shared.deadline import Deadline
+from app.application.llm_budget import LLMBudget
+from app.application.llm_classifier import LLMUsage
 from app.application.llm_classifier import LLMClassificationResult, LLMClassificationError
 from app.domain.helpdesk import HelpdeskRequest
 from app.domain.service_catalog import ServiceCatalog, ServiceCategory, ServiceRequestType, SLA
@@ -196,4 +200,144 @@ def test_classify_requests_applies_canonical_strings_case_insensitive() -> None:
     )
 
     assert req1.request_category == "Access"
-    assert req1.request_type == "Password reset"
\ No newline at end of file
+    assert req1.request_type == "Password reset"
+
+# once the run budget is below the reserve, remaining batches pass through unclassified
+def test_classify_requests_stops_dispatching_when_deadline_is_close() -> None:
+    requests = [_make_request("r1"), _make_request("r2"), _make_request("r3")]
+    service_catalog = ServiceCatalog(
+        categories=[
+            ServiceCategory(
+                name="Access",
+                requests=[ServiceRequestType(name="Password reset", sla=SLA(unit="hours", value=4))],
+            ),
+        ]
+    )
+    classifier = FakeClassifier(
+        results_by_id={
+            r.id: LLMClassificationResult(request_category="Access", request_type="Password reset")
+            for r in requests
+            if r.id
+        }
+    )
+
+    now = [0.0]
+    deadline = Deadline(100.0, clock=lambda: now[0])
+    timeouts: list[float | None] = []
+
+    class _AdvancingClassifier:
+        def classify_batch(self, batch, catalog, timeout_seconds=None):
+            timeouts.append(timeout_seconds)
+            # first batch eats most of the budget
+            now[0] = 95.0
+            return classifier.classify_batch(batch, catalog)
+
+    stats = ClassificationStats()
+    classified = classify_requests(
+        classifier=_AdvancingClassifier(),
+        service_catalog=service_catalog,
+        requests_=requests,
+        batch_size=1,
+        deadline=deadline,
+        deadline_reserve_seconds=10.0,
+        stats=stats,
+    )
+
+    assert [r.id for r in classified] == ["r1", "r2", "r3"]
+    assert classifier.calls == 1
+    # the call itself is capped at what is left of the run budget minus the reserve
+    assert timeouts == [90.0]
+    assert requests[0].request_category == "Access"
+    assert requests[1].request_category is None
+    assert stats.batches_sent == 1
+    assert stats.batches_skipped == 2
+    assert stats.requests_skipped == 2
+    assert stats.skip_reason == "deadline"
+
+
+class UsageReportingFakeClassifier(FakeClassifier):
+    def __init__(self, results_by_id: dict[str, LLMClassificationResult], tokens_per_request: int) -> None:
+        super().__init__(results_by_id)
+        self._tokens_per_request = tokens_per_request
+        self.last_usage: LLMUsage | None = None
+
+    def classify_batch(
+        self,
+        requests: Sequence[HelpdeskRequest],
+        service_catalog: ServiceCatalog,
+    ) -> Mapping[str, LLMClassificationResult]:
+        self.last_usage = LLMUsage(
+            input_tokens=self._tokens_per_request * len(requests),
+            output_tokens=10,
+        )
+        return super().classify_batch(requests, service_catalog)
+
+# exhausted budget sends the rest to passthrough; unclassified tickets are dispatched first
+def test_classify_requests_respects_llm_budget_and_prioritizes_unclassified() -> None:
+    done = HelpdeskRequest(id="r1", short_description="done", request_category="Access", request_type="Password reset")
+    fresh1 = _make_request("r2")
+    fresh2 = _make_request("r3")
+    requests = [done, fresh1, fresh2]
+
+    service_catalog = ServiceCatalog(
+        categories=[
+            ServiceCategory(
+                name="Access",
+                requests=[ServiceRequestType(name="Password reset", sla=SLA(unit="hours", value=4))],
+            ),
+        ]
+    )
+    result = LLMClassificationResult(request_category="Access", request_type="Password reset")
+    classifier = UsageReportingFakeClassifier(
+        results_by_id={"r1": result, "r2": result, "r3": result},
+        tokens_per_request=100,
+    )
+
+    stats = ClassificationStats()
+    classified = classify_requests(
+        classifier=classifier,
+        service_catalog=service_catalog,
+        requests_=requests,
+        batch_size=1,
+        stats=stats,
+        budget=LLMBudget(max_input_tokens=250),
+    )
+
+    # input order is preserved in the output
+    assert [r.id for r in classified] == ["r1", "r2", "r3"]
+    # r2 and r3 (no category/type) went first; r1 was cut by the budget
+    assert [[r.id for r in batch] for batch in classifier.batches] == [["r2"], ["r3"]]
+    assert fresh1.request_category == "Access"
+    assert fresh2.request_category == "Access"
+    assert stats.skip_reason == "budget"
+    assert stats.requests_skipped == 1
+    assert stats.input_tokens == 200
+
+# the catalog is indexed once per call and the same index is handed to every batch
+def test_classify_requests_shares_one_catalog_index_across_batches() -> None:
+    service_catalog = ServiceCatalog(
+        categories=[
+            ServiceCategory(
+                name="Access",
+                requests=[ServiceRequestType(name="Password reset", sla=SLA(unit="hours", value=4))],
+            ),
+        ]
+    )
+    seen: list[object] = []
+
+    class _RecordingClassifier:
+        def classify_batch(self, batch, catalog):
+            seen.append(catalog)
+            return {}
+
+    classify_requests(
+        classifier=_RecordingClassifier(),
+        service_catalog=service_catalog,
+        requests_=[_make_request("r1"), _make_request("r2"), _make_request("r3")],
+        batch_size=1,
+    )
+
+    assert len(seen) == 3
+    assert all(catalog is seen[0] for catalog in seen)
+    assert isinstance(seen[0], CatalogIndex)
+    assert seen[0].catalog is service_catalog
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from app.application.catalog_index import CatalogIndex
+from app.application.fuzzy_catalog_resolver import FuzzyCatalogResolver, bounded_edit_distance
+from app.application.service_catalog_matcher import CatalogMatch, ServiceCatalogMatcher
+from app.domain.service_catalog import SLA, ServiceCatalog, ServiceCategory, ServiceRequestType
+
+
+def _catalog() -> ServiceCatalog:
+    return ServiceCatalog(
+        categories=[
+            ServiceCategory(
+                name="Hardware",
+                requests=[
+                    ServiceRequestType("Laptop Repair/Replacement", SLA("days", 3)),
+                    ServiceRequestType("Monitor replacement", SLA("days", 5)),
+                ],
+            ),
+            ServiceCategory(
+                name="Access Management",
+                requests=[
+                    ServiceRequestType("Reset password", SLA("hours", 4)),
+                    ServiceRequestType("reset  PASSWORD", SLA("hours", 8)),
+                    ServiceRequestType("Grant access", SLA("days", 1)),
+                    ServiceRequestType("Revoke access", SLA("days", 1)),
+                ],
+            ),
+        ]
+    )
+
+def test_bounded_edit_distance_stops_past_the_bound() -> None:
+    assert bounded_edit_distance("laptop", "laptpo", 3) == 2
+    assert bounded_edit_distance("hardware", "hardware", 0) == 0
+    assert bounded_edit_distance("access", "network", 2) == 3
+
+def test_matcher_recovers_formatting_drift_typos_and_swaps() -> None:
+    matcher = ServiceCatalogMatcher(_catalog())
+    laptop = CatalogMatch("Hardware", "Laptop Repair/Replacement")
+
+    assert matcher.resolve("Hardware", "Laptop Repair / Replacement") == laptop
+    assert matcher.resolve("Hardwre", "Laptop repair/replacment") == laptop
+    assert matcher.resolve("Laptop Repair - Replacement", "hardware") == laptop
+    assert matcher.resolve("Acess Management", "Grant acces") == CatalogMatch("Access Management", "Grant access")
+    assert matcher.recovered_count == 4
+
+def test_matcher_rejects_unrelated_ambiguous_and_colliding_pairs() -> None:
+    matcher = ServiceCatalogMatcher(_catalog())
+
+    assert matcher.resolve("Network", "VPN setup") is None
+    # one edit away from two entries: no clear winner
+    near_twins = ServiceCatalog(
+        categories=[
+            ServiceCategory(
+                name="Network",
+                requests=[ServiceRequestType("VPN access", SLA("days", 1)), ServiceRequestType("VLN access", SLA("days", 1))],
+            ),
+        ]
+    )
+    assert ServiceCatalogMatcher(near_twins).resolve("Network", "VXN access") is None
+    # a missing word is more than formatting drift
+    assert FuzzyCatalogResolver(CatalogIndex.build(_catalog())).resolve("Access Management", "access") is None
+    # both "Reset password" entries collide after normalization; fuzzy matching must not pick one
+    assert matcher.resolve("Access Management", "Reset pasword") is None
+    assert matcher.resolve("Access Management", "reset password") is None
+    assert matcher.recovered_count == 0
+
+def test_matcher_without_fuzzy_accepts_exact_pairs_only() -> None:
+    matcher = ServiceCatalogMatcher(_catalog(), fuzzy=False)
+
+    assert matcher.resolve("hardware", "LAPTOP repair/replacement") == CatalogMatch("Hardware", "Laptop Repair/Replacement")
+    assert matcher.resolve("Hardware", "Laptop Repair / Replacement") is None
@@ -0,0 +1,36 @@
+from app.application.llm_budget import LLMBudget
+from app.application.llm_classifier import LLMUsage
+
+
+def test_unlimited_budget_always_admits() -> None:
+    budget = LLMBudget()
+
+    budget.record(LLMUsage(input_tokens=10_000_000, output_tokens=10_000_000), requests_count=1)
+
+    assert budget.limited is False
+    assert budget.admit(1000) is True
+
+def test_budget_admits_first_batch_without_samples() -> None:
+    budget = LLMBudget(max_input_tokens=1000)
+
+    assert budget.admit(30) is True
+
+# estimate = observed tokens per request * batch size
+def test_budget_rejects_batch_that_would_exceed_limit() -> None:
+    budget = LLMBudget(max_input_tokens=1000)
+    budget.record(LLMUsage(input_tokens=600, output_tokens=50), requests_count=10)
+
+    assert budget.admit(5) is True     # 600 + 300 <= 1000
+    assert budget.admit(10) is False   # 600 + 600 > 1000
+
+def test_budget_cost_limit_uses_prices_per_million() -> None:
+    budget = LLMBudget(
+        max_cost=1.0,
+        input_price_per_million=1.0,
+        output_price_per_million=10.0,
+    )
+    budget.record(LLMUsage(input_tokens=500_000, output_tokens=40_000), requests_count=100)
+
+    assert budget.cost == 0.9
+    assert budget.admit(10) is True
+    assert budget.admit(100) is False
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+from app.application.schedule_helpdesk_requests import schedule_requests, is_urgent
+from app.domain.helpdesk import HelpdeskRequest
+
+
+NOW = datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc)
+
+def _req(id: str, **kwargs) -> HelpdeskRequest:
+    return HelpdeskRequest(id=id, short_description=id, **kwargs)
+
+def test_schedule_orders_by_priority_then_sla_then_age() -> None:
+    requests = [
+        _req("normal"),
+        _req("p1", priority=1),
+        _req("old", created_at=NOW - timedelta(days=3)),
+        _req("short_sla", sla_unit="hours", sla_value=2),
+        _req("p2", priority=2),
+    ]
+
+    order = schedule_requests(requests, now=NOW)
+
+    assert [requests[i].id for i in order] == ["p1", "p2", "short_sla", "old", "normal"]
+
+def test_schedule_is_stable_without_signals() -> None:
+    requests = [_req("a"), _req("b"), _req("c")]
+
+    assert schedule_requests(requests, now=NOW) == [0, 1, 2]
+
+# tickets whose own SLA is almost used up beat fresh ones with the same SLA
+def test_schedule_uses_time_left_until_sla() -> None:
+    requests = [
+        _req("fresh", sla_unit="days", sla_value=1, created_at=NOW),
+        _req("almost_due", sla_unit="days", sla_value=1, created_at=NOW - timedelta(hours=20)),
+    ]
+
+    order = schedule_requests(requests, now=NOW)
+
+    assert [requests[i].id for i in order] == ["almost_due", "fresh"]
+
+def test_is_urgent() -> None:
+    assert is_urgent(_req("a", priority=1), max_priority=1) is True
+    assert is_urgent(_req("b", priority=2), max_priority=1) is False
+    assert is_urgent(_req("c"), max_priority=5) is False
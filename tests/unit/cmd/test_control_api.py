@@ -0,0 +1,89 @@
+from __future__ import annotations
+import http.client
+import json
+import threading
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+import pytest
+from app.cmd.control_api import ControlAPIServer
+from app.cmd.daemon import PipelineDaemon
+from app.cmd.pipeline_summary import PipelineRunSummary
+from app.shared.schedule import IntervalSchedule
+
+
+class _Pipeline:
+    """Fake run_pipeline that reports progress and waits until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def __call__(self, deps: Any) -> PipelineRunSummary:
+        deps.progress("helpdesk_fetched", {"requests": 2})
+        self.release.wait(5)
+        deps.progress("report_sent", {"paths": ["output/report.xlsx"]})
+        return PipelineRunSummary(status="sent", requests_fetched=2)
+
+@pytest.fixture
+def api() -> Iterator[tuple[ControlAPIServer, _Pipeline]]:
+    pipeline = _Pipeline()
+    daemon = PipelineDaemon(deps=SimpleNamespace(progress=None), schedule=IntervalSchedule(900), run=pipeline)         # type: ignore[arg-type]
+    stop = threading.Event()
+    server = ControlAPIServer(("127.0.0.1", 0), daemon, stop, token="s3cret")
+    server.start()
+    yield server, pipeline
+    stop.set()
+    pipeline.release.set()
+    server.shutdown()
+    server.server_close()
+
+def _request(server: ControlAPIServer, method: str, path: str, token: str = "s3cret") -> tuple[int, dict[str, Any]]:
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    conn.request(method, path, headers={"Authorization": f"Bearer {token}"})
+    response = conn.getresponse()
+    body = json.loads(response.read())
+    conn.close()
+    return response.status, body
+
+def test_trigger_run_stream_progress_and_fetch_summary(api: tuple[ControlAPIServer, _Pipeline]) -> None:
+    server, pipeline = api
+
+    status, body = _request(server, "POST", "/runs")
+    assert status == 202
+    assert body["run"]["id"] == 1 and body["events"] == "/events?run=1"
+
+    # only one run at a time
+    status, body = _request(server, "POST", "/runs")
+    assert status == 409 and body["run"]["id"] == 1
+    assert _request(server, "GET", "/status")[1]["running"] is True
+
+    conn = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    conn.request("GET", "/events?run=1", headers={"Authorization": "Bearer s3cret"})
+    response = conn.getresponse()
+    assert response.getheader("Content-Type") == "text/event-stream"
+    pipeline.release.set()
+    # the run stream replays the run from its start and closes after run_finished
+    stream = response.read().decode("utf-8")
+    conn.close()
+    events = [
+        json.loads(line[len("data: "):])
+        for line in stream.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert [event["type"] for event in events] == ["run_started", "helpdesk_fetched", "report_sent", "run_finished"]
+    assert events[1]["data"] == {"requests": 2}
+    assert events[-1]["data"]["status"] == "sent"
+
+    status, body = _request(server, "GET", "/runs/1")
+    assert status == 200
+    assert body["status"] == "sent"
+    assert body["summary"]["requests_fetched"] == 2
+    assert _request(server, "GET", "/status")[1]["last_run"]["id"] == 1
+    assert _request(server, "GET", "/runs/7")[0] == 404
+
+def test_requests_without_the_token_are_rejected(api: tuple[ControlAPIServer, _Pipeline]) -> None:
+    server, _ = api
+
+    assert _request(server, "POST", "/runs", token="wrong")[0] == 401
+    assert _request(server, "GET", "/health")[1] == {"ok": True}
+    assert server.pipeline_daemon.runs_started == 0
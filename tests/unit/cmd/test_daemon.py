@@ -0,0 +1,152 @@
+from __future__ import annotations
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any
+import pytest
+from app.cmd.daemon import CatalogRefresher, PipelineDaemon
+from app.cmd.pipeline_summary import PipelineRunSummary
+from app.shared.schedule import CronSchedule, IntervalSchedule, parse_schedule
+
+
+def _utc(year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> datetime:
+    return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+
+def test_parse_schedule_accepts_intervals_and_cron() -> None:
+    assert isinstance(parse_schedule("15m"), IntervalSchedule)
+    assert parse_schedule("@every 2h").next_after(_utc(2026, 1, 1)) == _utc(2026, 1, 1, 2)
+    assert parse_schedule("900").next_after(_utc(2026, 1, 1)) == _utc(2026, 1, 1, 0, 15)
+
+    # every 15 minutes during office hours on weekdays (Fri 17:50 -> Mon 08:00)
+    office = parse_schedule("*/15 8-17 * * 1-5")
+    assert isinstance(office, CronSchedule)
+    assert office.next_after(_utc(2026, 10, 23, 17, 50)) == _utc(2026, 10, 26, 8, 0)
+    assert office.next_after(_utc(2026, 10, 26, 8, 0)) == _utc(2026, 10, 26, 8, 15)
+    assert parse_schedule("@monthly").next_after(_utc(2026, 12, 15)) == _utc(2027, 1, 1)
+    # both day fields restricted: either matches (the 1st, or any Sunday)
+    assert parse_schedule("0 6 1 * 0").next_after(_utc(2026, 10, 19)) == _utc(2026, 10, 25, 6)
+
+    for bad in ("0 25 * * *", "* * *", "0 0 31 2 *", "0s"):
+        with pytest.raises(ValueError):
+            parse_schedule(bad).next_after(_utc(2026, 1, 1))
+
+def test_daemon_never_runs_twice_at_once_and_survives_failures() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_run(deps: Any) -> PipelineRunSummary:
+        calls.append("run")
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+            return PipelineRunSummary(status="ok")
+        raise RuntimeError("helpdesk down")
+
+    daemon = PipelineDaemon(deps=None, schedule=IntervalSchedule(60), run=slow_run)                            # type: ignore[arg-type]
+    first = threading.Thread(target=daemon.run_once, args=("manual",))
+    first.start()
+    assert started.wait(5)
+
+    assert daemon.running
+    assert daemon.run_once("schedule") is None
+    release.set()
+    first.join(5)
+
+    assert calls == ["run"]
+    assert daemon.runs_skipped == 1
+    assert daemon.last_summary is not None and daemon.last_summary.status == "ok"
+
+    # a failing run is logged and the daemon stays usable
+    assert daemon.run_once("schedule") is None
+    assert daemon.last_error == "helpdesk down"
+    assert not daemon.running
+
+# shutdown waits for a run triggered on its own thread instead of killing it mid-send
+def test_wait_idle_blocks_until_a_triggered_run_finished() -> None:
+    release = threading.Event()
+
+    def run(deps: Any) -> PipelineRunSummary:
+        release.wait(5)
+        return PipelineRunSummary(status="sent")
+
+    daemon = PipelineDaemon(deps=None, schedule=IntervalSchedule(60), run=run)                                 # type: ignore[arg-type]
+    record = daemon.trigger("api")
+    assert record is not None
+
+    waiter = threading.Thread(target=daemon.wait_idle)
+    waiter.start()
+    waiter.join(0.2)
+    assert waiter.is_alive()
+
+    release.set()
+    waiter.join(5)
+    assert not waiter.is_alive()
+    finished = daemon.get_run(record.id)
+    assert finished is not None and finished.status == "sent"
+    assert [r.id for r in daemon.run_records()] == [record.id]
+
+def test_daemon_serves_on_schedule_until_stopped() -> None:
+    stop = threading.Event()
+    now = [_utc(2026, 1, 1)]
+    runs: list[datetime] = []
+
+    def run(deps: Any) -> PipelineRunSummary:
+        runs.append(now[0])
+        if len(runs) == 3:
+            stop.set()
+        return PipelineRunSummary(status="ok")
+
+    class InstantSchedule:
+        def next_after(self, moment: datetime) -> datetime:
+            now[0] = moment + timedelta(minutes=15)
+            return moment  # due immediately
+
+    daemon = PipelineDaemon(deps=None, schedule=InstantSchedule(), run=run, clock=lambda: now[0])             # type: ignore[arg-type]
+    daemon.serve(stop, run_on_start=True)
+
+    assert len(runs) == 3
+    assert daemon.runs_started == 3
+
+def test_catalog_refresher_serves_cached_catalog_and_keeps_it_on_errors() -> None:
+    class FlakyClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def fetch_catalog(self) -> Any:
+            self.calls += 1
+            if self.calls == 3:
+                raise RuntimeError("catalog down")
+            return f"catalog v{self.calls}"
+
+    client = FlakyClient()
+    refresher = CatalogRefresher(client, refresh_seconds=3600)
+
+    assert refresher.fetch_catalog() == "catalog v1"
+    assert refresher.fetch_catalog() == "catalog v1"
+    refresher.refresh()
+    assert refresher.fetch_catalog() == "catalog v2"
+    refresher.refresh()  # fails: previous catalog stays
+    assert refresher.fetch_catalog() == "catalog v2"
+    assert client.calls == 3
+
+# the first run downloads the catalog; the background loop waits one interval before refreshing
+def test_catalog_refresher_does_not_download_at_start() -> None:
+    class CountingClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def fetch_catalog(self) -> Any:
+            self.calls += 1
+            return "catalog"
+
+    client = CountingClient()
+    refresher = CatalogRefresher(client, refresh_seconds=3600)
+    stop = threading.Event()
+    thread = refresher.start(stop)
+
+    assert refresher.fetch_catalog() == "catalog"
+    stop.set()
+    thread.join(timeout=5.0)
+
+    assert not thread.is_alive()
+    assert client.calls == 1
@@ -0,0 +1,42 @@
+from pathlib import Path
+import pytest
+from app.cmd.pipeline import _build_pipeline_deps
+from app.domain.helpdesk import HelpdeskRequest
+
+
+_REQUIRED_ENV = {
+    "HELPDESK_API_URL": "https://helpdesk.example.com/api",
+    "HELPDESK_API_KEY": "key",
+    "HELPDESK_API_SECRET": "secret",
+    "SERVICE_CATALOG_URL": "https://catalog.example.com/catalog.yaml",
+    "LLM_MODEL_NAME": "model",
+    "LLM_API_KEY": "llm-key",
+    "EMAIL_SMTP_HOST": "smtp.example.com",
+    "EMAIL_SMTP_PORT": "587",
+    "EMAIL_USERNAME": "user",
+    "EMAIL_PASSWORD": "password",
+    "EMAIL_RECIPIENT": "ops@example.com",
+    "CANDIDATE_NAME": "John Doe",
+    "CODEBASE_URL": "https://github.com/iSxHub/automated_ticket_attribution",
+    "EMAIL_TITLE": "Tasks report",
+}
+
+# replayed reports must not be logged as sent (or exported) next to the production ones
+def test_replay_isolates_report_log_and_output(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    for name, value in _REQUIRED_ENV.items():
+        monkeypatch.setenv(name, value)
+    production_db = tmp_path / "reports.sqlite3"
+    cassette_dir = tmp_path / "cassettes"
+    monkeypatch.setenv("REPORT_LOG_DB_PATH", str(production_db))
+    monkeypatch.setenv("CASSETTE_MODE", "replay")
+    monkeypatch.setenv("CASSETTE_DIR", str(cassette_dir))
+
+    deps = _build_pipeline_deps()
+
+    report = deps.report_exporter.export([HelpdeskRequest(id="req_1", short_description="VPN")])
+    deps.report_log.mark_sent(report)
+
+    assert report.parent == cassette_dir / "replay" / "output"
+    assert deps.project_root / "output" == report.parent
+    assert deps.report_log.get_record(report) is not None
+    assert not production_db.exists()
@@ -47,10 +47,11 @@ class FakeReportExporter:
         self.report_path = report_path
         self.called_with: list[Sequence[HelpdeskRequest]] = []
 
-    def export(self, requests: Sequence[HelpdeskRequest]) -> Path:
+    def export(self, requests: Sequence[HelpdeskRequest], filename_prefix: str = "") -> Path:
         self.called_with.append(requests)
-        self.report_path.write_bytes(b"report")
-        return self.report_path
+        path = self.report_path.with_name(filename_prefix + self.report_path.name)
+        path.write_bytes(b"report")
+        return path
 
 class FakeEmailSender:
     def __init__(self) -> None:
@@ -106,7 +107,7 @@ def test_run_pipeline_happy_path(monkeypatch, tmp_path) -> None:
     def fake_load_service_catalog(_client):
         return "fake_catalog"
 
-    def fake_classify_requests(llm, service_catalog, requests_, batch_size: int):
+    def fake_classify_requests(llm, service_catalog, requests_, batch_size: int, **kwargs):
         # echo requests back
         assert llm is fake_llm
         assert service_catalog == "fake_catalog"
@@ -114,10 +115,11 @@ def test_run_pipeline_happy_path(monkeypatch, tmp_path) -> None:
         assert batch_size == 10
         return list(requests_)
 
-    def fake_fill_helpdesk_sla(requests_, service_catalog):
+    def fake_fill_helpdesk_sla(requests_, service_catalog, calendar=None):
         # no-op, ensure it is called with classified requests
         assert [r.id for r in requests_] == ["req1", "req2"]
         assert service_catalog == "fake_catalog"
+        assert calendar is None
 
     def fake_log_sample_requests(requests_, limit: int = 5) -> None:
         assert [r.id for r in requests_] == ["req1", "req2"]
@@ -204,4 +206,356 @@ def test_run_pipeline_sends_unsent_reports(monkeypatch, tmp_path) -> None:
     assert set(attachments) == {unsent1.resolve(), unsent2.resolve()}
 
     # and both should be marked as sent
-    assert set(fake_log.marked) == {unsent1.resolve(), unsent2.resolve()}
\ No newline at end of file
+    assert set(fake_log.marked) == {unsent1.resolve(), unsent2.resolve()}
+
+# run budget already exhausted after fetch: catalog + LLM are cut, report still exported and sent
+def test_run_pipeline_deadline_cuts_classification(monkeypatch, tmp_path) -> None:
+    fake_helpdesk = FakeHelpdeskService(requests_=[_make_req("req1"), _make_req("req2")])
+    fake_catalog_client = FakeServiceCatalogClient()
+    report_path = tmp_path / "report.xlsx"
+    fake_exporter = FakeReportExporter(report_path=report_path)
+    fake_email_sender = FakeEmailSender()
+
+    deps = PipelineDeps(
+        project_root=tmp_path,
+        helpdesk_service=fake_helpdesk,
+        service_catalog_client=fake_catalog_client,
+        llm_classifier=FakeLLMClassifier(),
+        report_log=FakeReportLog(),
+        batch_size=10,
+        email_body_builder=FakeEmailBodyBuilder(),
+        report_exporter=fake_exporter,
+        email_sender=fake_email_sender,
+        codebase_url="https://github.com/iSxHub/automated_ticket_attribution",
+        candidate_name="John Doe",
+        email_title="Tasks report",
+        deadline_seconds=1.0,
+        deadline_reserve_seconds=60.0,
+    )
+
+    def fail_classify_requests(*args, **kwargs):
+        raise AssertionError("classify_requests should not be called without budget")
+
+    monkeypatch.setattr(ps, "_collect_unsent_reports", lambda *args, **kwargs: ([], None))
+    monkeypatch.setattr(ps, "classify_requests", fail_classify_requests)
+
+    summary = run_pipeline(deps, explicit_report_path=None)
+
+    assert fake_catalog_client.called is False
+    assert [r.id for r in fake_exporter.called_with[0]] == ["req1", "req2"]
+    assert len(fake_email_sender.calls) == 1
+
+    assert summary.status == "sent"
+    assert summary.stages_cut == ["service_catalog", "classification"]
+    assert summary.requests_cut == 2
+
+
+# urgent tickets are classified first and sent in their own early report
+def test_run_pipeline_sends_early_report_for_urgent_requests(monkeypatch, tmp_path) -> None:
+    urgent = HelpdeskRequest(id="p1", short_description="p1", priority=1)
+    normal = _make_req("req1")
+    fake_helpdesk = FakeHelpdeskService(requests_=[normal, urgent])
+    fake_exporter = FakeReportExporter(report_path=tmp_path / "report.xlsx")
+    fake_email_sender = FakeEmailSender()
+
+    deps = PipelineDeps(
+        project_root=tmp_path,
+        helpdesk_service=fake_helpdesk,
+        service_catalog_client=FakeServiceCatalogClient(),
+        llm_classifier=FakeLLMClassifier(),
+        report_log=FakeReportLog(),
+        batch_size=10,
+        email_body_builder=FakeEmailBodyBuilder(),
+        report_exporter=fake_exporter,
+        email_sender=fake_email_sender,
+        codebase_url="https://github.com/iSxHub/automated_ticket_attribution",
+        candidate_name="John Doe",
+        email_title="Tasks report",
+        early_report_max_priority=1,
+    )
+
+    classified_batches: list[list[str | None]] = []
+
+    def fake_classify_requests(llm, service_catalog, requests_, batch_size: int, **kwargs):
+        classified_batches.append([r.id for r in requests_])
+        return list(requests_)
+
+    monkeypatch.setattr(ps, "_collect_unsent_reports", lambda *args, **kwargs: ([], None))
+    monkeypatch.setattr(ps, "classify_requests", fake_classify_requests)
+
+    summary = run_pipeline(deps, explicit_report_path=None)
+
+    assert classified_batches == [["p1"], ["req1"]]
+    # the full report keeps the helpdesk order
+    assert [[r.id for r in call] for call in fake_exporter.called_with] == [["p1"], ["req1", "p1"]]
+
+    subjects = [call[0] for call in fake_email_sender.calls]
+    assert subjects == ["Tasks report (urgent) - John Doe", "Tasks report - John Doe"]
+    assert summary.early_report_path == (tmp_path / "report.xlsx")
+    assert summary.status == "sent"
+
+
+class FakeIngestionCheckpoint:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+
+# incremental run: the watermark advances only after the report was sent
+def test_run_pipeline_commits_ingestion_checkpoint_after_send(monkeypatch, tmp_path) -> None:
+    checkpoint = FakeIngestionCheckpoint()
+    fake_email_sender = FakeEmailSender()
+
+    deps = PipelineDeps(
+        project_root=tmp_path,
+        helpdesk_service=FakeHelpdeskService(requests_=[_make_req("req1")]),
+        service_catalog_client=FakeServiceCatalogClient(),
+        llm_classifier=FakeLLMClassifier(),
+        report_log=FakeReportLog(),
+        batch_size=10,
+        email_body_builder=FakeEmailBodyBuilder(),
+        report_exporter=FakeReportExporter(report_path=tmp_path / "report.xlsx"),
+        email_sender=fake_email_sender,
+        codebase_url="https://github.com/iSxHub/automated_ticket_attribution",
+        candidate_name="John Doe",
+        email_title="Tasks report",
+        ingestion_checkpoint=checkpoint,
+    )
+
+    monkeypatch.setattr(ps, "_collect_unsent_reports", lambda *args, **kwargs: ([], None))
+    monkeypatch.setattr(ps, "classify_requests", lambda llm, catalog, requests_, batch_size, **kwargs: list(requests_))
+
+    summary = run_pipeline(deps, explicit_report_path=None)
+
+    assert summary.status == "sent"
+    assert len(fake_email_sender.calls) == 1
+    assert checkpoint.commits == 1
+
+class FakeIncrementalHelpdesk:
+    """Returns tickets after the committed watermark; commit() moves it past the last fetch."""
+
+    def __init__(self, requests_: list[HelpdeskRequest]) -> None:
+        self.requests = requests_
+        self.watermark = 0
+        self._pending = 0
+
+    def load_helpdesk_requests(self) -> list[HelpdeskRequest]:
+        self._pending = len(self.requests)
+        return self.requests[self.watermark:]
+
+    def commit(self) -> None:
+        self.watermark = self._pending
+
+# a deadline-cut run keeps the watermark, so the next run classifies the cut tickets
+def test_run_pipeline_keeps_watermark_when_classification_was_cut(monkeypatch, tmp_path) -> None:
+    helpdesk = FakeIncrementalHelpdesk([_make_req("req1"), _make_req("req2")])
+    fake_email_sender = FakeEmailSender()
+
+    deps = PipelineDeps(
+        project_root=tmp_path,
+        helpdesk_service=helpdesk,
+        service_catalog_client=FakeServiceCatalogClient(),
+        llm_classifier=FakeLLMClassifier(),
+        report_log=FakeReportLog(),
+        batch_size=1,
+        email_body_builder=FakeEmailBodyBuilder(),
+        report_exporter=FakeReportExporter(report_path=tmp_path / "report.xlsx"),
+        email_sender=fake_email_sender,
+        codebase_url="https://github.com/iSxHub/automated_ticket_attribution",
+        candidate_name="John Doe",
+        email_title="Tasks report",
+        ingestion_checkpoint=helpdesk,
+    )
+
+    classified: list[list[str | None]] = []
+    cut = [True]
+
+    def fake_classify_requests(llm, catalog, requests_, batch_size, stats, **kwargs):
+        classified.append([r.id for r in requests_])
+        stats.batches_total = len(requests_)
+        if cut[0]:
+            # the deadline stops after the first batch
+            stats.batches_sent = 1
+            stats.batches_skipped = len(requests_) - 1
+            stats.requests_skipped = len(requests_) - 1
+            stats.skip_reason = "deadline"
+        else:
+            stats.batches_sent = len(requests_)
+        return list(requests_)
+
+    monkeypatch.setattr(ps, "_collect_unsent_reports", lambda *args, **kwargs: ([], None))
+    monkeypatch.setattr(ps, "classify_requests", fake_classify_requests)
+
+    first = run_pipeline(deps, explicit_report_path=None)
+    assert first.status == "sent"
+    assert first.stages_cut == ["classification:deadline"]
+    assert helpdesk.watermark == 0
+
+    cut[0] = False
+    second = run_pipeline(deps, explicit_report_path=None)
+    assert second.status == "sent"
+    assert classified == [["req1", "req2"], ["req1", "req2"]]
+    assert helpdesk.watermark == 2
+    assert len(fake_email_sender.calls) == 2
+
+def test_run_pipeline_skips_report_when_no_new_requests(monkeypatch, tmp_path) -> None:
+    checkpoint = FakeIngestionCheckpoint()
+    fake_exporter = FakeReportExporter(report_path=tmp_path / "report.xlsx")
+    fake_email_sender = FakeEmailSender()
+
+    deps = PipelineDeps(
+        project_root=tmp_path,
+        helpdesk_service=FakeHelpdeskService(requests_=[]),
+        service_catalog_client=FakeServiceCatalogClient(),
+        llm_classifier=FakeLLMClassifier(),
+        report_log=FakeReportLog(),
+        batch_size=10,
+        email_body_builder=FakeEmailBodyBuilder(),
+        report_exporter=fake_exporter,
+        email_sender=fake_email_sender,
+        codebase_url="https://github.com/iSxHub/automated_ticket_attribution",
+        candidate_name="John Doe",
+        email_title="Tasks report",
+        ingestion_checkpoint=checkpoint,
+    )
+
+    monkeypatch.setattr(ps, "_collect_unsent_reports", lambda *args, **kwargs: ([], None))
+
+    summary = run_pipeline(deps, explicit_report_path=None)
+
+    assert summary.status == "no_new_requests"
+    assert fake_exporter.called_with == []
+    assert fake_email_sender.calls == []
+    assert checkpoint.commits == 0
+
+# helpdesk and catalog are fetched concurrently, LLM/SMTP are warmed up meanwhile
+def test_run_pipeline_overlaps_fetch_stages_and_warms_up(monkeypatch, tmp_path) -> None:
+    import threading
+
+    catalog_started = threading.Event()
+
+    class BlockingHelpdeskService(FakeHelpdeskService):
+        def load_helpdesk_requests(self) -> list[HelpdeskRequest]:
+            # would time out if the catalog only started after this fetch
+            assert catalog_started.wait(timeout=5.0)
+            return super().load_helpdesk_requests()
+
+    class SignallingCatalogClient(FakeServiceCatalogClient):
+        def fetch_catalog(self) -> ServiceCatalog:
+            catalog_started.set()
+            return super().fetch_catalog()
+
+    class WarmableEmailSender(FakeEmailSender):
+        def __init__(self) -> None:
+            super().__init__()
+            self.warmed = threading.Event()
+
+        def warm_up(self) -> None:
+            self.warmed.set()
+
+    email_sender = WarmableEmailSender()
+    deps = PipelineDeps(
+        project_root=tmp_path,
+        helpdesk_service=BlockingHelpdeskService(requests_=[_make_req("req1")]),
+        service_catalog_client=SignallingCatalogClient(),
+        llm_classifier=FakeLLMClassifier(),
+        report_log=FakeReportLog(),
+        batch_size=10,
+        email_body_builder=FakeEmailBodyBuilder(),
+        report_exporter=FakeReportExporter(report_path=tmp_path / "report.xlsx"),
+        email_sender=email_sender,
+        codebase_url="https://github.com/iSxHub/automated_ticket_attribution",
+        candidate_name="John Doe",
+        email_title="Tasks report",
+    )
+
+    monkeypatch.setattr(ps, "_collect_unsent_reports", lambda *args, **kwargs: ([], None))
+    monkeypatch.setattr(ps, "classify_requests", lambda llm, catalog, requests_, batch_size, **kwargs: list(requests_))
+
+    summary = run_pipeline(deps, explicit_report_path=None)
+
+    assert summary.status == "sent"
+    assert email_sender.warmed.wait(timeout=5.0)
+
+# multi-source run with the per-tenant split: one report per source, sent in one email
+def test_run_pipeline_splits_report_by_source(monkeypatch, tmp_path) -> None:
+    requests_ = [
+        HelpdeskRequest(id="emea:1", short_description="a", source="emea"),
+        HelpdeskRequest(id="apac:1", short_description="b", source="apac"),
+        HelpdeskRequest(id="emea:2", short_description="c", source="emea"),
+    ]
+    fake_exporter = FakeReportExporter(report_path=tmp_path / "report.xlsx")
+    fake_email_sender = FakeEmailSender()
+
+    deps = PipelineDeps(
+        project_root=tmp_path,
+        helpdesk_service=FakeHelpdeskService(requests_=requests_),
+        service_catalog_client=FakeServiceCatalogClient(),
+        llm_classifier=FakeLLMClassifier(),
+        report_log=FakeReportLog(),
+        batch_size=10,
+        email_body_builder=FakeEmailBodyBuilder(),
+        report_exporter=fake_exporter,
+        email_sender=fake_email_sender,
+        codebase_url="https://github.com/iSxHub/automated_ticket_attribution",
+        candidate_name="John Doe",
+        email_title="Tasks report",
+        split_report_by_source=True,
+    )
+
+    monkeypatch.setattr(ps, "_collect_unsent_reports", lambda *args, **kwargs: ([], None))
+    monkeypatch.setattr(ps, "classify_requests", lambda llm, catalog, requests_, batch_size, **kwargs: list(requests_))
+
+    summary = run_pipeline(deps, explicit_report_path=None)
+
+    assert summary.status == "sent"
+    assert [[r.id for r in call] for call in fake_exporter.called_with] == [["emea:1", "emea:2"], ["apac:1"]]
+    assert [p.name for p in summary.report_paths] == ["emea_report.xlsx", "apac_report.xlsx"]
+    assert len(fake_email_sender.calls) == 1
+    assert fake_email_sender.calls[0][2] == summary.report_paths
+
+
+# a catalog fetch that outlives the budget is abandoned: the requests are reported unclassified
+def test_run_pipeline_stops_waiting_for_slow_catalog(monkeypatch, tmp_path) -> None:
+    import threading
+
+    release = threading.Event()
+
+    class SlowCatalogClient(FakeServiceCatalogClient):
+        def fetch_catalog(self) -> ServiceCatalog:
+            release.wait(timeout=5.0)
+            return super().fetch_catalog()
+
+    fake_exporter = FakeReportExporter(report_path=tmp_path / "report.xlsx")
+    deps = PipelineDeps(
+        project_root=tmp_path,
+        helpdesk_service=FakeHelpdeskService(requests_=[_make_req("req1")]),
+        service_catalog_client=SlowCatalogClient(),
+        llm_classifier=FakeLLMClassifier(),
+        report_log=FakeReportLog(),
+        batch_size=10,
+        email_body_builder=FakeEmailBodyBuilder(),
+        report_exporter=fake_exporter,
+        email_sender=FakeEmailSender(),
+        codebase_url="https://github.com/iSxHub/automated_ticket_attribution",
+        candidate_name="John Doe",
+        email_title="Tasks report",
+        deadline_seconds=0.6,
+        deadline_reserve_seconds=0.3,
+    )
+
+    def fail_classify_requests(*args, **kwargs):
+        raise AssertionError("classify_requests should not be called without a catalog")
+
+    monkeypatch.setattr(ps, "_collect_unsent_reports", lambda *args, **kwargs: ([], None))
+    monkeypatch.setattr(ps, "classify_requests", fail_classify_requests)
+
+    try:
+        summary = run_pipeline(deps, explicit_report_path=None)
+    finally:
+        release.set()
+
+    assert summary.status == "sent"
+    assert summary.stages_cut == ["service_catalog", "classification"]
+    assert [r.id for r in fake_exporter.called_with[0]] == ["req1"]
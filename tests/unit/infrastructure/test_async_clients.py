@@ -0,0 +1,96 @@
+import asyncio
+import json
+import httpx
+import pytest
+from app.config import HelpdeskAPIConfig, ServiceCatalogConfig
+from app.infrastructure.async_clients import (
+    AsyncHelpdeskClient,
+    AsyncServiceCatalogClient,
+    fetch_helpdesk_and_catalog_async,
+)
+from app.infrastructure.helpdesk_client import HelpdeskAPIError
+
+
+CATALOG_YAML = """
+service_catalog:
+  catalog:
+    categories:
+      - name: "Access Management"
+        requests:
+          - name: "Reset Okta password"
+            sla:
+              unit: "hours"
+              value: "4"
+"""
+
+def _helpdesk_config(page_size: int | None = None) -> HelpdeskAPIConfig:
+    return HelpdeskAPIConfig(
+        url="https://helpdesk.example.com/requests",
+        api_key="dummy-key",
+        api_secret="dummy-secret",
+        page_size=page_size,
+    )
+
+def _catalog_config() -> ServiceCatalogConfig:
+    return ServiceCatalogConfig(url="https://catalog.example.com/catalog.yaml")
+
+def test_fetch_helpdesk_and_catalog_concurrently_on_shared_client() -> None:
+    pages = {
+        1: [{"id": "r1"}, {"id": "r2"}],
+        2: [{"id": "r3"}, {"id": "r4"}],
+        3: [{"id": "r5"}],
+    }
+    requested_pages: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "catalog.example.com":
+            return httpx.Response(200, text=CATALOG_YAML)
+        page = json.loads(request.content)["page"]
+        requested_pages.append(page)
+        return httpx.Response(200, json={"data": pages.get(page, [])})
+
+    async def run() -> tuple[list[str | None], int]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as shared:
+            helpdesk = AsyncHelpdeskClient(_helpdesk_config(page_size=2), client=shared, max_concurrent_pages=3)
+            catalog_client = AsyncServiceCatalogClient(_catalog_config(), client=shared)
+            # no sync requests session or transport behind the async clients
+            assert not hasattr(helpdesk, "_session") and not hasattr(catalog_client, "_session")
+            fetched, catalog = await fetch_helpdesk_and_catalog_async(helpdesk, catalog_client)
+            return [f.request.id for f in fetched], len(catalog.categories)
+
+    ids, categories = asyncio.run(run())
+
+    assert ids == ["r1", "r2", "r3", "r4", "r5"]
+    assert categories == 1
+    # pages 2..4 were requested as one concurrent window
+    assert sorted(requested_pages) == [1, 2, 3, 4]
+
+def test_async_helpdesk_retries_transient_errors_then_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def no_sleep(_: float) -> None:
+        return None
+
+    monkeypatch.setattr("app.infrastructure.async_http_transport.asyncio.sleep", no_sleep)
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(503, headers={"Retry-After": "1"})
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as shared:
+            await AsyncHelpdeskClient(_helpdesk_config(), client=shared, max_retries=2).fetch_requests_async()
+
+    with pytest.raises(HelpdeskAPIError):
+        asyncio.run(run())
+    assert len(calls) == 2
+
+def test_async_helpdesk_not_modified_returns_nothing() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["If-None-Match"] == '"v1"'
+        return httpx.Response(304, headers={"ETag": '"v1"'})
+
+    async def run() -> list[object]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as shared:
+            return list(await AsyncHelpdeskClient(_helpdesk_config(), client=shared).fetch_requests_async(etag='"v1"'))
+
+    assert asyncio.run(run()) == []
@@ -1,5 +1,7 @@
 from __future__ import annotations
+from datetime import datetime
 from io import BytesIO
+from zoneinfo import ZoneInfo
 from openpyxl import load_workbook
 from app.domain.helpdesk import HelpdeskRequest
 from app.infrastructure.build_excel import build_excel
@@ -153,4 +155,15 @@ def test_build_excel_auto_fits_columns() -> None:
     # widths should be numbers and short_description column should be wider
     assert isinstance(width_id, (int, float))
     assert isinstance(width_short_desc, (int, float))
-    assert width_short_desc > width_id
\ No newline at end of file
+    assert width_short_desc > width_id
+def test_build_excel_writes_sla_due_at_as_local_wall_time() -> None:
+    due = _make_request(id="1")
+    due.sla_due_at = datetime(2026, 10, 26, 16, 0, tzinfo=ZoneInfo("Europe/Berlin"))
+    requests = [due, _make_request(id="2", short_description="zzz")]
+
+    ws = load_workbook(BytesIO(build_excel(requests))).active
+
+    assert ws["G1"].value == "sla_due_at"
+    assert ws["G2"].value == datetime(2026, 10, 26, 16, 0)
+    assert ws["G2"].number_format == "yyyy-mm-dd hh:mm"
+    assert ws["G3"].value in (None, "")
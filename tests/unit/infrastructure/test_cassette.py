@@ -0,0 +1,87 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from app.infrastructure.cassette import (
+    Cassette,
+    CassetteEmailSender,
+    CassetteGenAIClient,
+    CassetteMissError,
+)
+from app.infrastructure.http_transport import build_session
+
+
+def _fake_send(responses: list[tuple[int, bytes]]) -> Any:
+    def send(self: HTTPAdapter, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:
+        status, body = responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response._content = body                                                    # type: ignore[attr-defined]
+        response.headers["Content-Type"] = "application/json"
+        response.headers["Content-Encoding"] = "gzip"
+        response.url = request.url or ""
+        response.request = request
+        return response
+    return send
+
+def test_http_interactions_replay_in_recorded_order_without_credentials(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(HTTPAdapter, "send", _fake_send([(503, b"busy"), (200, b'{"data": [1, 2]}')]))
+    session = build_session(cassette=Cassette(tmp_path, "record"))
+    payload = {"api_key": "k", "api_secret": "s", "page": 1}
+    assert session.post("https://helpdesk.example/api", json=payload).status_code == 503
+    assert session.post("https://helpdesk.example/api", json=payload).status_code == 200
+    assert "api_secret" not in "".join(p.read_text() for p in tmp_path.rglob("*.json"))
+
+    monkeypatch.setattr(HTTPAdapter, "send", Mock(side_effect=AssertionError("network used on replay")))
+    session = build_session(cassette=Cassette(tmp_path, "replay"))
+    first = session.post("https://helpdesk.example/api", json={**payload, "api_key": "other"})
+    second = session.post("https://helpdesk.example/api", json=payload, stream=True)
+
+    assert first.status_code == 503
+    assert second.status_code == 200
+    assert b"".join(second.iter_content(4)) == b'{"data": [1, 2]}'
+    assert second.json() == {"data": [1, 2]}
+    assert "Content-Encoding" not in second.headers
+
+def test_http_replay_falls_back_to_same_endpoint_and_misses_unknown_ones(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(HTTPAdapter, "send", _fake_send([(200, b"[]")]))
+    build_session(cassette=Cassette(tmp_path, "record")).post(
+        "https://helpdesk.example/api", json={"updated_since": "2026-01-01"}
+    )
+
+    session = build_session(cassette=Cassette(tmp_path, "replay"))
+    assert session.post("https://helpdesk.example/api", json={"updated_since": "2026-02-01"}).json() == []
+    with pytest.raises(CassetteMissError):
+        session.get("https://catalog.example/catalog.yaml")
+
+def test_llm_calls_replay_text_and_usage(tmp_path) -> None:
+    real = Mock()
+    real.models.generate_content.return_value = SimpleNamespace(
+        text='{"items": []}',
+        usage_metadata=SimpleNamespace(prompt_token_count=10, candidates_token_count=3, thoughts_token_count=None),
+    )
+    CassetteGenAIClient(Cassette(tmp_path, "record"), lambda: real).models.generate_content(
+        model="m", contents="prompt"
+    )
+
+    factory = Mock(side_effect=AssertionError("client built on replay"))
+    replay = CassetteGenAIClient(Cassette(tmp_path, "replay"), factory)
+    response = replay.models.generate_content(model="m", contents="prompt")
+
+    assert response.text == '{"items": []}'
+    assert response.usage_metadata.prompt_token_count == 10
+    assert replay.models.get(model="m") is None
+    with pytest.raises(CassetteMissError):
+        replay.models.generate_content(model="m", contents="another prompt")
+
+def test_email_is_recorded_on_send_and_not_sent_on_replay(tmp_path) -> None:
+    inner = Mock()
+    attachments = [Path("report.xlsx")]
+    CassetteEmailSender(inner, Cassette(tmp_path, "record")).send_report_email("Report", "body", attachments)
+    CassetteEmailSender(inner, Cassette(tmp_path, "replay")).send_report_email("Report", "body", attachments)
+
+    inner.send_report_email.assert_called_once()
+    assert len(list((tmp_path / "smtp").glob("*.json"))) == 1
@@ -0,0 +1,88 @@
+from __future__ import annotations
+import sqlite3
+from app.application.catalog_aliases import CatalogAliases
+from app.application.classify_helpdesk_requests import classify_requests
+from app.application.catalog_index import CatalogIndex
+from app.application.llm_classifier import LLMClassificationResult
+from app.application.service_catalog_matcher import CatalogMatch, ServiceCatalogMatcher
+from app.domain.helpdesk import HelpdeskRequest
+from app.domain.service_catalog import SLA, ServiceCatalog, ServiceCategory, ServiceRequestType
+from app.infrastructure.catalog_alias_store import SQLiteCatalogAliasStore
+
+
+def _index(laptop_hours: int = 48) -> CatalogIndex:
+    return CatalogIndex.build(
+        ServiceCatalog(
+            categories=[
+                ServiceCategory(
+                    "Hardware",
+                    [
+                        ServiceRequestType("Laptop Repair/Replacement", SLA("hours", laptop_hours)),
+                        ServiceRequestType("Monitor replacement", SLA("hours", 72)),
+                    ],
+                ),
+            ]
+        )
+    )
+
+def test_confirmed_aliases_resolve_on_later_runs_without_fuzzy_search(tmp_path) -> None:
+    store = SQLiteCatalogAliasStore(tmp_path / "state.db")
+    index = _index()
+    laptop = CatalogMatch("Hardware", "Laptop Repair/Replacement")
+
+    aliases = CatalogAliases.load(store, index)
+    first_run = ServiceCatalogMatcher(index, aliases=aliases)
+    assert first_run.resolve("Hardware", "Laptop Repair / Replacement") == laptop
+    first_run.confirm("Hardware", "Laptop Repair / Replacement")
+    assert first_run.resolve("hardware", "laptop repair / replacement") == laptop
+    aliases.save(store)
+
+    later = CatalogAliases.load(store, index)
+    assert len(later) == 1
+    second_run = ServiceCatalogMatcher(index, fuzzy=False, aliases=later)
+    assert second_run.resolve("HARDWARE ", "Laptop  Repair / Replacement") == laptop
+    assert second_run.resolve("Hardware", "Laptop repair / replacment") is None
+    later.save(store)
+
+    with sqlite3.connect(tmp_path / "state.db") as conn:
+        hits = conn.execute("SELECT raw_type, request_type, hits FROM catalog_aliases").fetchall()
+    assert hits == [("laptop repair / replacement", "Laptop Repair/Replacement", 3)]
+
+def test_aliases_are_scoped_to_the_catalog_fingerprint(tmp_path) -> None:
+    store = SQLiteCatalogAliasStore(tmp_path / "state.db")
+    aliases = CatalogAliases.load(store, _index())
+    matcher = ServiceCatalogMatcher(_index(), aliases=aliases)
+    matcher.resolve("Hardware", "Laptop Repair / Replacement")
+    matcher.confirm("Hardware", "Laptop Repair / Replacement")
+    aliases.save(store)
+
+    assert len(CatalogAliases.load(store, _index())) == 1
+    assert len(CatalogAliases.load(store, _index(laptop_hours=24))) == 0
+    # known aliases to pairs that no longer exist are ignored
+    assert len(CatalogAliases(_index(), {("a", "b"): ("Hardware", "Docking station")})) == 0
+
+class _FixedClassifier:
+    def __init__(self, result: LLMClassificationResult) -> None:
+        self._result = result
+
+    def classify_batch(self, batch, catalog):
+        return {req.id: self._result for req in batch}
+
+# a recovery rejected for contradicting the ticket's own category is not remembered
+def test_rejected_recovery_is_not_saved_as_alias(tmp_path) -> None:
+    store = SQLiteCatalogAliasStore(tmp_path / "state.db")
+    index = _index()
+    aliases = CatalogAliases.load(store, index)
+    request = HelpdeskRequest(id="r1", short_description="laptop", request_category="Hardwre")
+
+    classify_requests(
+        _FixedClassifier(LLMClassificationResult(None, "Laptop Repair / Replacement")),
+        index,
+        [request],
+        batch_size=1,
+        aliases=aliases,
+    )
+    aliases.save(store)
+
+    assert request.request_type is None
+    assert len(CatalogAliases.load(store, index)) == 0
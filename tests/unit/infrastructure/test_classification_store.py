@@ -0,0 +1,65 @@
+from __future__ import annotations
+from app.application.catalog_index import CatalogIndex
+from app.application.stored_classifications import (
+    apply_stored_classifications,
+    reconcile_catalog,
+    remember_classifications,
+)
+from app.domain.helpdesk import HelpdeskRequest
+from app.domain.service_catalog import SLA, ServiceCatalog, ServiceCategory, ServiceRequestType
+from app.infrastructure.classification_store import SQLiteClassificationStore
+
+
+def _index(access: list[tuple[str, int]], hardware: list[tuple[str, int]]) -> CatalogIndex:
+    return CatalogIndex.build(
+        ServiceCatalog(
+            categories=[
+                ServiceCategory("Access", [ServiceRequestType(n, SLA("hours", h)) for n, h in access]),
+                ServiceCategory("Hardware", [ServiceRequestType(n, SLA("hours", h)) for n, h in hardware]),
+            ]
+        )
+    )
+
+def _classified(id: str, category: str, type_: str) -> HelpdeskRequest:
+    return HelpdeskRequest(id=id, short_description=f"text {id}", request_category=category, request_type=type_)
+
+def _fresh(*ids: str) -> list[HelpdeskRequest]:
+    return [HelpdeskRequest(id=id, short_description=f"text {id}") for id in ids]
+
+def test_stored_classifications_skip_the_llm_for_unchanged_tickets(tmp_path) -> None:
+    store = SQLiteClassificationStore(tmp_path / "state.db")
+    index = _index([("Reset password", 4)], [("Laptop repair", 48)])
+    assert reconcile_catalog(store, index) is None
+    remember_classifications(store, index, [_classified("r1", "Access", "Reset password")])
+
+    fresh = _fresh("r1", "r2")
+    edited = HelpdeskRequest(id="r1", short_description="edited text")
+    pending = apply_stored_classifications(store, index, fresh)
+
+    assert [r.id for r in pending] == ["r2"]
+    assert (fresh[0].request_category, fresh[0].request_type) == ("Access", "Reset password")
+    assert apply_stored_classifications(store, index, [edited]) == [edited]
+
+def test_catalog_change_invalidates_only_affected_classifications(tmp_path) -> None:
+    store = SQLiteClassificationStore(tmp_path / "state.db")
+    old = _index([("Reset password", 4), ("Grant acces", 8)], [("Laptop repair", 48), ("Monitor", 24)])
+    reconcile_catalog(store, old)
+    remember_classifications(store, old, [
+        _classified("r1", "Access", "Reset password"),
+        _classified("r2", "Access", "Grant acces"),
+        _classified("r3", "Hardware", "Laptop repair"),
+        _classified("r4", "Hardware", "Monitor"),
+    ])
+
+    # typo fix (rename), SLA-only change, a removed type and a new Hardware type
+    new = _index([("Reset password", 2), ("Grant access", 8)], [("Laptop repair", 48), ("Docking station", 8)])
+    diff = reconcile_catalog(store, new)
+
+    assert diff is not None and diff.structural
+    fresh = _fresh("r1", "r2", "r3", "r4")
+    pending = apply_stored_classifications(store, new, fresh)
+
+    # SLA-only and renamed pairs are kept; the category with new/removed types goes back to the LLM
+    assert [r.id for r in pending] == ["r3", "r4"]
+    assert (fresh[1].request_category, fresh[1].request_type) == ("Access", "Grant access")
+    assert reconcile_catalog(store, new) is not None and store.load_catalog() == new.catalog
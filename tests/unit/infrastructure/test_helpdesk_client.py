@@ -20,6 +20,8 @@ def _make_client_with_mock_session(json_payload: Any) -> HelpdeskClient:
     mock_session = Mock()
     mock_response = Mock()
     mock_response.raise_for_status = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.json = Mock(return_value=json_payload)
 
     mock_session.post = Mock(return_value=mock_response)
@@ -107,6 +109,8 @@ def test_json_error_is_wrapped_in_helpdesk_api_error() -> None:
     mock_session = Mock()
     mock_response = Mock()
     mock_response.raise_for_status = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.json.side_effect = ValueError("invalid json")
 
     mock_session.post.return_value = mock_response
@@ -117,7 +121,7 @@ def test_json_error_is_wrapped_in_helpdesk_api_error() -> None:
 
 def test_fetch_requests_retries_then_succeeds(monkeypatch: pytest.MonkeyPatch) -> None:
     # avoid real sleep during tests
-    monkeypatch.setattr("app.infrastructure.helpdesk_client.time.sleep", lambda _: None)
+    monkeypatch.setattr("app.infrastructure.http_transport.time.sleep", lambda _: None)
 
     config = HelpdeskAPIConfig(
         url="https://example.com/helpdesk",
@@ -138,6 +142,8 @@ def test_fetch_requests_retries_then_succeeds(monkeypatch: pytest.MonkeyPatch) -
     }
     ok_response = Mock()
     ok_response.raise_for_status = Mock()
+    ok_response.status_code = 200
+    ok_response.headers = {}
     ok_response.json = Mock(return_value=ok_payload)
 
     mock_session.post.side_effect = [bad_response, ok_response]
@@ -150,7 +156,7 @@ def test_fetch_requests_retries_then_succeeds(monkeypatch: pytest.MonkeyPatch) -
 
 def test_fetch_requests_retries_exhausted_raises(monkeypatch: pytest.MonkeyPatch) -> None:
     # avoid real sleep during tests
-    monkeypatch.setattr("app.infrastructure.helpdesk_client.time.sleep", lambda _: None)
+    monkeypatch.setattr("app.infrastructure.http_transport.time.sleep", lambda _: None)
 
     config = HelpdeskAPIConfig(
         url="https://example.com/helpdesk",
@@ -184,4 +190,171 @@ def test_fetch_requests_supports_data_as_list() -> None:
     client = _make_client_with_mock_session(payload)
 
     result = client.fetch_requests()
-    assert result[0].request.id == "req_1"
\ No newline at end of file
+    assert result[0].request.id == "req_1"
+def _make_paged_client(
+    pages: list[Any],
+    page_size: int,
+    prefetch_pages: bool = True,
+    field_mapping: tuple[tuple[str, tuple[str, ...]], ...] = (),
+) -> tuple[HelpdeskClient, Mock]:
+    config = HelpdeskAPIConfig(
+        url="https://example.com/helpdesk",
+        api_key="dummy-key",
+        api_secret="dummy-secret",
+        timeout_seconds=5.0,
+        page_size=page_size,
+        prefetch_pages=prefetch_pages,
+        field_mapping=field_mapping,
+    )
+    client = HelpdeskClient(config)
+
+    responses = []
+    for page in pages:
+        response = Mock()
+        response.raise_for_status = Mock()
+        response.status_code = 200
+        response.headers = {}
+        response.json = Mock(return_value=page)
+        responses.append(response)
+
+    mock_session = Mock()
+    mock_session.post.side_effect = responses
+    client._session = mock_session                                                                                          # type: ignore[attr-defined]
+    return client, mock_session
+
+# pages are requested until a short page arrives
+def test_iter_requests_paginates_by_page_number() -> None:
+    pages = [
+        {"data": {"requests": [{"id": "r1"}, {"id": "r2"}]}},
+        {"data": {"requests": [{"id": "r3"}]}},
+    ]
+    client, session = _make_paged_client(pages, page_size=2)
+
+    ids = [f.request.id for f in client.iter_requests()]
+
+    assert ids == ["r1", "r2", "r3"]
+    bodies = [call.kwargs["json"] for call in session.post.call_args_list]
+    assert [(b["page"], b["page_size"]) for b in bodies] == [(1, 2), (2, 2)]
+    assert bodies[0]["api_key"] == "dummy-key"
+
+def test_iter_requests_follows_cursor_and_has_more() -> None:
+    pages = [
+        {"data": [{"id": "r1"}], "pagination": {"next_cursor": "c2", "has_more": True}},
+        {"data": [{"id": "r2"}], "pagination": {"has_more": False}},
+    ]
+    client, session = _make_paged_client(pages, page_size=50, prefetch_pages=False)
+
+    ids = [f.request.id for f in client.iter_requests()]
+
+    assert ids == ["r1", "r2"]
+    second_body = session.post.call_args_list[1].kwargs["json"]
+    assert second_body["cursor"] == "c2"
+
+def test_iter_requests_stops_on_has_more_false_despite_cursor() -> None:
+    pages = [
+        {"data": [{"id": "r1"}], "pagination": {"next_cursor": "c2", "has_more": False}},
+        {"data": [{"id": "r2"}]},
+    ]
+    client, session = _make_paged_client(pages, page_size=1, prefetch_pages=False)
+
+    ids = [f.request.id for f in client.iter_requests()]
+
+    assert ids == ["r1"]
+    assert session.post.call_count == 1
+
+def test_iter_requests_stops_on_empty_page_despite_cursor() -> None:
+    pages = [
+        {"data": [{"id": "r1"}], "pagination": {"next_cursor": "c2"}},
+        {"data": [], "pagination": {"next_cursor": "c3"}},
+        {"data": [{"id": "r3"}]},
+    ]
+    client, session = _make_paged_client(pages, page_size=1, prefetch_pages=False)
+
+    ids = [f.request.id for f in client.iter_requests()]
+
+    assert ids == ["r1"]
+    assert session.post.call_count == 2
+
+# an API that ignores paging returns the same page again -> stop instead of looping
+def test_iter_requests_stops_when_page_repeats() -> None:
+    same = {"data": [{"id": "r1"}, {"id": "r2"}]}
+    client, session = _make_paged_client([same, same, same], page_size=2)
+
+    result = client.fetch_requests()
+
+    assert [f.request.id for f in result] == ["r1", "r2"]
+    assert session.post.call_count <= 3
+
+# the repeat guard reads ids through the configured field mapping
+def test_iter_requests_stops_when_page_repeats_with_mapped_id() -> None:
+    same = {"data": [{"key": "r1"}, {"key": "r2"}]}
+    client, session = _make_paged_client([same] * 5, page_size=2, field_mapping=(("id", ("key",)),))
+
+    result = client.fetch_requests()
+
+    assert [f.request.id for f in result] == ["r1", "r2"]
+    assert session.post.call_count <= 3
+
+def _make_streaming_client(body: bytes, chunk_size: int) -> tuple[HelpdeskClient, Mock]:
+    config = HelpdeskAPIConfig(
+        url="https://example.com/helpdesk",
+        api_key="dummy-key",
+        api_secret="dummy-secret",
+        timeout_seconds=5.0,
+        stream_json=True,
+    )
+    client = HelpdeskClient(config)
+
+    response = Mock()
+    response.raise_for_status = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.iter_content = Mock(
+        return_value=iter([body[i:i + chunk_size] for i in range(0, len(body), chunk_size)])
+    )
+
+    mock_session = Mock()
+    mock_session.post = Mock(return_value=response)
+    client._session = mock_session                                                                                          # type: ignore[attr-defined]
+    return client, response
+
+# items are decoded one by one even when tokens are split across tiny chunks
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"response_code": 200, "data": {"requests": [{"id": "req_1", "short_description": "Caf\xc3\xa9 \\"wifi\\""}, '
+        b'{"id": 2, "sla": {"unit": "hours", "value": 12}}, "skip-me"]}, "meta": {"total": 2}}',
+        b'{"meta": {"total": 2}, "data": [{"id": "req_1", "short_description": "Caf\xc3\xa9 \\"wifi\\""}, '
+        b'{"id": 2, "sla": {"unit": "hours", "value": 12}}]}',
+        b' [ {"id": "req_1", "short_description": "Caf\xc3\xa9 \\"wifi\\""}, {"id": 2, "sla": {"unit": "hours", "value": 12}} ] ',
+    ],
+)
+def test_iter_requests_streams_items(body: bytes) -> None:
+    client, response = _make_streaming_client(body, chunk_size=3)
+
+    result = list(client.iter_requests())
+
+    assert [f.request.id for f in result] == ["req_1", "2"]
+    assert result[0].request.short_description == 'Café "wifi"'
+    assert result[1].request.sla_value == 12
+    response.json.assert_not_called()
+    response.close.assert_called_once()
+
+def test_iter_requests_streaming_rejects_bad_shape_and_truncated_body() -> None:
+    client, _ = _make_streaming_client(b'{"data": {"not_requests": []}}', chunk_size=4)
+    with pytest.raises(HelpdeskAPIError):
+        list(client.iter_requests())
+
+    client, _ = _make_streaming_client(b'{"data": [{"id": "r1"}, {"id": "r2"', chunk_size=4)
+    with pytest.raises(HelpdeskAPIError):
+        list(client.iter_requests())
+
+# the streamed path samples the payload shape like the buffered one, not from the first item only
+def test_iter_requests_streaming_observes_payload_shape() -> None:
+    body = b'{"data": [{"id": "r1"}, {"id": "r2", "subject": "VPN"}]}'
+    client, _ = _make_streaming_client(body, chunk_size=5)
+
+    result = list(client.iter_requests())
+
+    assert [f.request.short_description for f in result] == [None, "VPN"]
+    assert client._mapper.shape == frozenset({"id", "subject"})                                                             # type: ignore[attr-defined]
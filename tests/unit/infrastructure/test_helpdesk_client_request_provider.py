@@ -0,0 +1,107 @@
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import Mock
+from app.application.dto.fetched_helpdesk_request import FetchedHelpdeskRequest
+from app.domain.helpdesk import HelpdeskRequest
+from app.infrastructure.helpdesk_client_request_provider import HelpdeskClientRequestProvider
+from app.infrastructure.ingestion_state import IngestionWatermark, SQLiteIngestionState
+
+
+def _fetched(id: str, raw: dict[str, Any]) -> FetchedHelpdeskRequest:
+    return FetchedHelpdeskRequest(
+        request=HelpdeskRequest(id=id, short_description=id),
+        raw_payload=raw,
+    )
+
+def test_provider_maps_priority_and_created_at_from_raw_payload() -> None:
+    client = Mock()
+    client.iter_requests.return_value = iter([
+        _fetched("r1", {"priority": "P1", "created_at": "2026-01-10T08:00:00Z"}),
+        _fetched("r2", {"urgency": "High", "opened_at": 1767600000}),
+        _fetched("r3", {"priority": "2 - Medium"}),
+        _fetched("r4", {"priority": "whenever", "created_at": "not a date"}),
+        _fetched("r5", {"priority": "Planning"}),
+        _fetched("r6", {"priority": "p3"}),
+    ])
+
+    requests = HelpdeskClientRequestProvider(client).fetch_requests()
+
+    assert [r.priority for r in requests] == [1, 2, 2, None, 5, 3]
+    assert requests[0].created_at == datetime(2026, 1, 10, 8, 0, tzinfo=timezone.utc)
+    assert requests[1].created_at == datetime.fromtimestamp(1767600000, tz=timezone.utc)
+    assert requests[3].created_at is None
+
+def test_provider_returns_only_requests_newer_than_stored_watermark(tmp_path) -> None:
+    state = SQLiteIngestionState(tmp_path / "state.db")
+    state.save(
+        "default",
+        IngestionWatermark(
+            last_id="req_2",
+            last_updated_at=datetime(2026, 1, 10, 8, 0, tzinfo=timezone.utc),
+            etag='"v1"',
+        ),
+    )
+
+    client = Mock()
+    client.last_etag = '"v2"'
+    client.iter_requests.return_value = iter([
+        _fetched("req_1", {"updated_at": "2026-01-09T08:00:00Z"}),
+        _fetched("req_2", {"updated_at": "2026-01-10T08:00:00Z"}),
+        _fetched("req_1b", {"updated_at": "2026-01-11T08:00:00Z"}),
+        _fetched("req_10", {}),
+    ])
+
+    provider = HelpdeskClientRequestProvider(client, state=state)
+    requests = provider.fetch_requests()
+
+    # changed ticket by timestamp, new ticket without timestamp by natural id order
+    assert [r.id for r in requests] == ["req_1b", "req_10"]
+    client.iter_requests.assert_called_once_with(
+        updated_since=datetime(2026, 1, 10, 8, 0, tzinfo=timezone.utc),
+        etag='"v1"',
+    )
+
+    # nothing is persisted until the run commits
+    stored = state.load("default")
+    assert stored is not None and stored.etag == '"v1"'
+
+    provider.commit()
+    assert state.load("default") == IngestionWatermark(
+        last_id="req_10",
+        last_updated_at=datetime(2026, 1, 11, 8, 0, tzinfo=timezone.utc),
+        etag='"v2"',
+        last_updated_ids=("req_1b",),
+    )
+
+# tickets sharing the watermark timestamp are kept unless they were already ingested at it
+def test_provider_keeps_unseen_tickets_at_the_watermark_timestamp(tmp_path) -> None:
+    state = SQLiteIngestionState(tmp_path / "state.db")
+    boundary = datetime(2026, 1, 10, 8, 0, tzinfo=timezone.utc)
+    state.save("default", IngestionWatermark(last_id="req_9", last_updated_at=boundary, last_updated_ids=("req_5",)))
+
+    client = Mock()
+    client.last_etag = None
+    client.iter_requests.return_value = iter([
+        _fetched("req_5", {"updated_at": "2026-01-10T08:00:00Z"}),
+        _fetched("req_3", {"updated_at": "2026-01-10T08:00:00Z"}),
+    ])
+
+    provider = HelpdeskClientRequestProvider(client, state=state)
+
+    assert [r.id for r in provider.fetch_requests()] == ["req_3"]
+    provider.commit()
+    stored = state.load("default")
+    assert stored is not None and stored.last_updated_ids == ("req_3", "req_5")
+
+def test_provider_full_mode_ignores_watermark(tmp_path) -> None:
+    state = SQLiteIngestionState(tmp_path / "state.db")
+    state.save("default", IngestionWatermark(last_id="req_9"))
+
+    client = Mock()
+    client.last_etag = None
+    client.iter_requests.return_value = iter([_fetched("req_1", {}), _fetched("req_2", {})])
+
+    requests = HelpdeskClientRequestProvider(client, state=state, full=True).fetch_requests()
+
+    assert [r.id for r in requests] == ["req_1", "req_2"]
+    client.iter_requests.assert_called_once_with(updated_since=None, etag=None)
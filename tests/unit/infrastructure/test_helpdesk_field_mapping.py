@@ -0,0 +1,50 @@
+import pytest
+from app.infrastructure.helpdesk_client import _normalize_optional_int, _normalize_optional_str
+from app.infrastructure.helpdesk_field_mapping import HelpdeskFieldMapper, build_field_mapping
+
+
+def _mapper(overrides=None) -> HelpdeskFieldMapper:
+    return HelpdeskFieldMapper(
+        overrides,
+        normalize_str=_normalize_optional_str,
+        normalize_int=_normalize_optional_int,
+    )
+
+def test_default_mapping_resolves_aliases_and_nested_sla() -> None:
+    mapper = _mapper()
+
+    req = mapper.map({
+        "ticket_id": 42,
+        "subject": " VPN down ",
+        "body": "since 9am",
+        "sla": {"unit": "hours", "value": "4"},
+    })
+
+    assert (req.id, req.short_description, req.long_description) == ("42", "VPN down", "since 9am")
+    assert (req.sla_unit, req.sla_value) == ("hours", 4)
+    assert req.request_category is None
+
+def test_items_outside_detected_shape_use_full_mapping() -> None:
+    mapper = _mapper()
+    mapper.observe([{"id": "r1", "short_description": "a"}])
+
+    # "subject" was not in the first page, the fallback still finds it
+    req = mapper.map({"id": "r2", "subject": "b"})
+
+    assert req.short_description == "b"
+
+def test_custom_mapping_onboards_new_source_format() -> None:
+    mapper = _mapper({
+        "id": "key",
+        "short_description": ["fields.summary"],
+        "sla_value": "fields.sla.hours",
+        "sla_unit": "fields.sla.unit",
+    })
+
+    req = mapper.map({"key": "HD-7", "fields": {"summary": "Laptop", "sla": {"hours": 8, "unit": "hours"}}})
+
+    assert (req.id, req.short_description, req.sla_value, req.sla_unit) == ("HD-7", "Laptop", 8, "hours")
+
+def test_unknown_field_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        build_field_mapping({"assignee": "owner"})
@@ -0,0 +1,90 @@
+from unittest.mock import Mock
+import pytest
+import requests
+from requests import HTTPError
+from app.infrastructure.http_transport import RetryingTransport, build_session
+
+
+def _failed_response(status: int, headers: dict[str, str] | None = None) -> Mock:
+    response = Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.raise_for_status.side_effect = HTTPError(f"{status}", response=response)
+    return response
+
+def _ok_response() -> Mock:
+    response = Mock()
+    response.raise_for_status = Mock()
+    return response
+
+def test_retry_after_is_honoured_and_latency_recorded(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.infrastructure.http_transport.time.sleep", sleeps.append)
+
+    ok = _ok_response()
+    send = Mock(side_effect=[_failed_response(429, {"Retry-After": "7"}), _failed_response(503), ok])
+    transport = RetryingTransport("test", max_retries=3, backoff_factor=1.0)
+
+    assert transport.call(send) is ok
+
+    # Retry-After raises the delay; plain backoff is jittered within [b/2, b]
+    assert sleeps[0] == 7.0
+    assert 1.0 <= sleeps[1] <= 2.0
+    assert transport.stats.attempts == 3
+    assert transport.stats.retries == 2
+    assert transport.stats.failures == 0
+
+# the per-fetch stats are logged and reset, so a long-lived client reports each run on its own
+def test_log_stats_returns_and_resets_counters(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    monkeypatch.setattr("app.infrastructure.http_transport.time.sleep", lambda _: None)
+    transport = RetryingTransport("test", max_retries=2)
+    transport.call(Mock(side_effect=[_failed_response(503), _ok_response()]))
+
+    with caplog.at_level("INFO", logger="app.infrastructure.http_transport"):
+        stats = transport.log_stats()
+
+    assert (stats.calls, stats.attempts, stats.retries) == (1, 2, 1)
+    assert "test transport: calls=1 attempts=2 retries=1" in caplog.text
+    assert transport.stats.calls == 0
+
+def test_non_retryable_status_is_raised_at_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.infrastructure.http_transport.time.sleep", lambda _: None)
+
+    send = Mock(return_value=_failed_response(404))
+    transport = RetryingTransport("test", max_retries=3)
+
+    with pytest.raises(HTTPError):
+        transport.call(send)
+
+    assert send.call_count == 1
+    assert transport.stats.failures == 1
+
+# a failed (possibly streamed) response must release its connection before the retry
+def test_failed_response_is_closed_before_retrying(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("app.infrastructure.http_transport.time.sleep", lambda _: None)
+
+    failed = _failed_response(503)
+    ok = _ok_response()
+    transport = RetryingTransport("test", max_retries=2)
+
+    assert transport.call(Mock(side_effect=[failed, ok])) is ok
+
+    failed.close.assert_called_once_with()
+    ok.close.assert_not_called()
+
+def test_retry_after_is_capped_by_max_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("app.infrastructure.http_transport.time.sleep", sleeps.append)
+
+    send = Mock(side_effect=[_failed_response(503, {"Retry-After": "3600"}), _ok_response()])
+    RetryingTransport("test", max_retries=2, max_backoff_seconds=5.0).call(send)
+
+    assert sleeps == [5.0]
+
+def test_build_session_mounts_sized_pools() -> None:
+    session = build_session(pool_connections=2, pool_maxsize=7)
+
+    adapter = session.get_adapter("https://example.com")
+    assert isinstance(adapter, requests.adapters.HTTPAdapter)
+    assert adapter._pool_maxsize == 7                                                                                       # type: ignore[attr-defined]
+    assert session.headers["Accept-Encoding"] == "gzip, deflate"
@@ -16,6 +16,9 @@ class DummyLLMConfig:
     temperature: float = 0.0
     top_p: float = 1.0
     top_k: int = 1
+    request_timeout_seconds: float = 5.0
+    hedge_enabled: bool = False
+    hedge_budget_ratio: float = 0.1
 
 @dataclass
 class DummyHelpdeskRequest:
@@ -227,4 +230,84 @@ def test_classify_batch_all_items_missing_id_raises() -> None:
     requests = [DummyHelpdeskRequest(id="req_1")]
 
     with pytest.raises(LLMClassificationError):
-        classifier.classify_batch(requests, catalog)                                                                        # type: ignore[arg-type]
\ No newline at end of file
+        classifier.classify_batch(requests, catalog)                                                                        # type: ignore[arg-type]
+# a hung API call is bounded by request_timeout_seconds and surfaces as a batch failure
+def test_classify_batch_timeout_raises() -> None:
+    import threading
+
+    release = threading.Event()
+
+    class HangingModels:
+        def generate_content(self, **kwargs: Any) -> DummyResponse:
+            release.wait(1.0)
+            return DummyResponse(text=json.dumps({"items": []}))
+
+    class HangingClient:
+        models = HangingModels()
+
+    cfg = DummyLLMConfig(request_timeout_seconds=0.05)
+    classifier = LLMClassifier(cfg)                                                                                         # type: ignore[arg-type]
+    classifier._client = HangingClient()                                                                                    # type: ignore[attr-defined]
+
+    catalog = DummyCatalog(categories=[])
+    requests = [DummyHelpdeskRequest(id="req_1")]
+
+    with pytest.raises(LLMClassificationError):
+        classifier.classify_batch(requests, catalog)                                                                        # type: ignore[arg-type]
+
+    release.set()
+
+# the remaining run budget caps the call below request_timeout_seconds
+def test_classify_batch_timeout_is_capped_by_caller() -> None:
+    import threading
+    import time
+
+    release = threading.Event()
+
+    class HangingModels:
+        def generate_content(self, **kwargs: Any) -> DummyResponse:
+            release.wait(5.0)
+            return DummyResponse(text=json.dumps({"items": []}))
+
+    class HangingClient:
+        models = HangingModels()
+
+    cfg = DummyLLMConfig(request_timeout_seconds=5.0)
+    classifier = LLMClassifier(cfg)                                                                                         # type: ignore[arg-type]
+    classifier._client = HangingClient()                                                                                    # type: ignore[attr-defined]
+
+    started = time.monotonic()
+    with pytest.raises(LLMClassificationError):
+        classifier.classify_batch([DummyHelpdeskRequest(id="req_1")], DummyCatalog(categories=[]), timeout_seconds=0.05)  # type: ignore[arg-type]
+
+    assert time.monotonic() - started < 2.0
+    release.set()
+
+
+# usage metadata of the response is exposed for the run budget
+def test_classify_batch_records_usage_metadata() -> None:
+    @dataclass
+    class DummyUsage:
+        prompt_token_count: int
+        candidates_token_count: int
+        thoughts_token_count: int | None = None
+
+    @dataclass
+    class DummyResponseWithUsage:
+        text: str
+        usage_metadata: DummyUsage
+
+    payload = {"items": [{"id": "req_1", "request_category": "A", "request_type": "B"}]}
+    response = DummyResponseWithUsage(
+        text=json.dumps(payload),
+        usage_metadata=DummyUsage(prompt_token_count=1200, candidates_token_count=80, thoughts_token_count=20),
+    )
+    cfg = DummyLLMConfig()
+    classifier = LLMClassifier(cfg)                                                                                         # type: ignore[arg-type]
+    classifier._client = DummyClient(response)                                                                              # type: ignore[attr-defined, arg-type]
+
+    classifier.classify_batch([DummyHelpdeskRequest(id="req_1")], DummyCatalog(categories=[]))                              # type: ignore[arg-type]
+
+    assert classifier.last_usage is not None
+    assert classifier.last_usage.input_tokens == 1200
+    assert classifier.last_usage.output_tokens == 100
@@ -0,0 +1,80 @@
+from __future__ import annotations
+import threading
+import pytest
+from app.infrastructure.llm_request_hedger import (
+    HedgedCaller,
+    LatencyTracker,
+    LLMCallTimeoutError,
+)
+
+
+def _warm_tracker(latency: float, samples: int = 5) -> LatencyTracker:
+    tracker = LatencyTracker(min_samples=samples)
+    for _ in range(samples):
+        tracker.record(latency)
+    return tracker
+
+def test_call_returns_result() -> None:
+    caller = HedgedCaller(timeout_seconds=1.0)
+
+    assert caller.call(lambda: 42) == 42
+
+def test_call_raises_timeout_when_deadline_passes() -> None:
+    release = threading.Event()
+    caller = HedgedCaller(timeout_seconds=0.05)
+
+    with pytest.raises(LLMCallTimeoutError):
+        caller.call(lambda: release.wait(1.0))
+
+    release.set()
+
+def test_call_reraises_underlying_error() -> None:
+    caller = HedgedCaller(timeout_seconds=1.0)
+
+    def boom() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        caller.call(boom)
+
+# first attempt hangs past p95, the hedged duplicate answers
+def test_hedged_duplicate_wins_over_slow_primary() -> None:
+    release = threading.Event()
+    attempts: list[int] = []
+    lock = threading.Lock()
+
+    def fn() -> str:
+        with lock:
+            attempts.append(len(attempts))
+            attempt = attempts[-1]
+        if attempt == 0:
+            release.wait(1.0)
+            return "slow"
+        return "fast"
+
+    caller = HedgedCaller(
+        timeout_seconds=1.0,
+        hedge_enabled=True,
+        hedge_budget_ratio=1.0,
+        latency_tracker=_warm_tracker(0.01),
+    )
+
+    assert caller.call(fn) == "fast"
+    assert caller.hedges_used == 1
+    release.set()
+
+def test_hedge_budget_caps_duplicates() -> None:
+    release = threading.Event()
+    caller = HedgedCaller(
+        timeout_seconds=0.05,
+        hedge_enabled=True,
+        # 0.5 hedges allowed for the first call -> none
+        hedge_budget_ratio=0.5,
+        latency_tracker=_warm_tracker(0.01),
+    )
+
+    with pytest.raises(LLMCallTimeoutError):
+        caller.call(lambda: release.wait(1.0))
+
+    assert caller.hedges_used == 0
+    release.set()
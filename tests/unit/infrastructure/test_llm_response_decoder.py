@@ -0,0 +1,41 @@
+from __future__ import annotations
+import json
+import pytest
+from app.application.llm_classifier import LLMClassificationError, LLMClassificationResult
+from app.infrastructure.llm_response_decoder import decode_batch_response
+
+
+def test_decode_batch_response_skips_malformed_items() -> None:
+    text = json.dumps(
+        {
+            "items": [
+                "not a dict",
+                {"id": 7, "request_category": " Access ", "request_type": "Password reset"},
+                {"id": "  ", "request_category": "Hardware"},
+                {"id": "r2", "request_category": None, "request_type": ""},
+            ]
+        }
+    )
+
+    results = decode_batch_response(text)
+
+    assert results == {
+        "7": LLMClassificationResult(request_category="Access", request_type="Password reset"),
+        "r2": LLMClassificationResult(request_category=None, request_type=None),
+    }
+
+@pytest.mark.parametrize("text", ["[1, 2]", '{"items": {"id": "r1"}}', "null"])
+def test_decode_batch_response_rejects_unexpected_shapes(text: str) -> None:
+    with pytest.raises(LLMClassificationError):
+        decode_batch_response(text)
+
+# error logs carry a bounded preview, not the whole payload
+def test_decode_batch_response_truncates_logged_payload(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level("ERROR")
+    text = json.dumps({"items": [{"request_category": "x" * 5000}]})
+
+    with pytest.raises(LLMClassificationError):
+        decode_batch_response(text)
+
+    assert "x" * 1000 not in caplog.text
+    assert "chars)" in caplog.text
@@ -0,0 +1,64 @@
+from unittest.mock import Mock
+import pytest
+from app.application.dto.fetched_helpdesk_request import FetchedHelpdeskRequest
+from app.domain.helpdesk import HelpdeskRequest
+from app.infrastructure.helpdesk_client import HelpdeskAPIError
+from app.infrastructure.helpdesk_client_request_provider import HelpdeskClientRequestProvider
+from app.infrastructure.ingestion_state import SQLiteIngestionState
+from app.infrastructure.multi_source_request_provider import MultiSourceRequestProvider
+
+
+def _client(*ids: str) -> Mock:
+    client = Mock()
+    client.last_etag = None
+    client.iter_requests.return_value = iter([
+        FetchedHelpdeskRequest(request=HelpdeskRequest(id=id, short_description=id), raw_payload={})
+        for id in ids
+    ])
+    return client
+
+def test_multi_source_tags_requests_and_namespaces_ids(tmp_path) -> None:
+    state = SQLiteIngestionState(tmp_path / "state.db")
+    provider = MultiSourceRequestProvider([
+        HelpdeskClientRequestProvider(_client("req_1", "req_2"), state=state, source="emea", tag_source=True),
+        HelpdeskClientRequestProvider(_client("req_1"), state=state, source="apac", tag_source=True),
+    ])
+
+    requests = provider.fetch_requests()
+    provider.commit()
+
+    assert [(r.id, r.source) for r in requests] == [
+        ("emea:req_1", "emea"),
+        ("emea:req_2", "emea"),
+        ("apac:req_1", "apac"),
+    ]
+    # watermarks are stored per source with the tenant's own ids
+    emea = state.load("emea")
+    apac = state.load("apac")
+    assert emea is not None and emea.last_id == "req_2"
+    assert apac is not None and apac.last_id == "req_1"
+
+def test_multi_source_skips_failed_source_and_keeps_its_watermark(tmp_path) -> None:
+    state = SQLiteIngestionState(tmp_path / "state.db")
+    failing = Mock()
+    failing.iter_requests.side_effect = HelpdeskAPIError("boom")
+    provider = MultiSourceRequestProvider([
+        HelpdeskClientRequestProvider(_client("req_1"), state=state, source="emea", tag_source=True),
+        HelpdeskClientRequestProvider(failing, state=state, source="apac", tag_source=True),
+    ])
+
+    requests = provider.fetch_requests()
+    provider.commit()
+
+    assert [r.id for r in requests] == ["emea:req_1"]
+    assert provider.failed_sources == ["apac"]
+    assert state.load("emea") is not None
+    assert state.load("apac") is None
+
+def test_multi_source_raises_when_every_source_fails() -> None:
+    failing = Mock()
+    failing.iter_requests.side_effect = HelpdeskAPIError("boom")
+    provider = MultiSourceRequestProvider([HelpdeskClientRequestProvider(failing, source="emea")])
+
+    with pytest.raises(HelpdeskAPIError):
+        provider.fetch_requests()
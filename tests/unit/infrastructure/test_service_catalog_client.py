@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import Any
 from unittest.mock import Mock
 import pytest
@@ -8,6 +9,8 @@ from app.infrastructure.service_catalog_client import (
     ServiceCatalogClient,
     ServiceCatalogError,
 )
+from app.infrastructure.service_catalog_cache import ServiceCatalogCache
+from app.infrastructure.service_catalog_snapshot import ServiceCatalogSnapshots, content_hash
 from app.shared.errors import ServiceCatalogLoadError
 
 
@@ -100,15 +103,15 @@ def test_parse_yaml_error_is_wrapped_in_service_catalog_error(
     )
     client = ServiceCatalogClient(config)
 
-    def fake_safe_load(_: str) -> Any:
+    def fake_load(_: str, Loader: Any) -> Any:
         raise yaml.YAMLError("bad yaml")                                                                                    # type: ignore[attr-defined]
 
-    monkeypatch.setattr("yaml.safe_load", fake_safe_load)
+    monkeypatch.setattr("yaml.load", fake_load)
 
     with pytest.raises(ServiceCatalogError):
         _ = client._parse_yaml(":::")                                                                                       # type: ignore[attr-defined]
 
-def test_download_text_http_error_raises_service_catalog_error() -> None:
+def test_download_http_error_raises_service_catalog_error() -> None:
     config = ServiceCatalogConfig(
         url="https://example.com/service-catalog",
         timeout_seconds=5.0,
@@ -123,4 +126,83 @@ def test_download_text_http_error_raises_service_catalog_error() -> None:
     client._session = mock_session                                                                                          # type: ignore[attr-defined]
 
     with pytest.raises(ServiceCatalogError):
-        _ = client._download_text()                                                                                         # type: ignore[attr-defined]
+        _ = client._download()                                                                                              # type: ignore[attr-defined]
+
+_CACHED_YAML = """
+service_catalog:
+  catalog:
+    categories:
+      - name: "Access Management"
+        requests:
+          - name: "Reset Okta password"
+            sla:
+              unit: "hours"
+              value: 4
+"""
+
+def _cached_client(tmp_path, max_stale_seconds: float | None = None) -> tuple[ServiceCatalogClient, Mock]:
+    config = ServiceCatalogConfig(url="https://example.com/service-catalog", timeout_seconds=5.0)
+    client = ServiceCatalogClient(
+        config,
+        max_retries=1,
+        cache=ServiceCatalogCache(tmp_path / "catalog_cache.json"),
+        max_stale_seconds=max_stale_seconds,
+    )
+    mock_session = Mock()
+    client._session = mock_session                                                                                          # type: ignore[attr-defined]
+    return client, mock_session
+
+def test_fetch_catalog_revalidates_cache_and_skips_parsing_on_304(tmp_path) -> None:
+    client, session = _cached_client(tmp_path)
+    session.get.return_value = Mock(status_code=200, text=_CACHED_YAML, headers={"ETag": '"v1"'})
+    first = client.fetch_catalog()
+
+    session.get.return_value = Mock(status_code=304, text="", headers={})
+    client._parse_yaml = Mock(side_effect=AssertionError("parsed on 304"))                                                  # type: ignore[method-assign]
+    second = client.fetch_catalog()
+
+    assert second == first
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+def test_fetch_catalog_serves_cached_copy_when_endpoint_fails(tmp_path) -> None:
+    client, session = _cached_client(tmp_path)
+    session.get.return_value = Mock(status_code=200, text=_CACHED_YAML, headers={})
+    cached = client.fetch_catalog()
+
+    failing = Mock()
+    failing.raise_for_status.side_effect = HTTPError("503 server error")
+    session.get.return_value = failing
+
+    assert client.fetch_catalog() == cached
+
+    cache = ServiceCatalogCache(tmp_path / "catalog_cache.json")
+    entry = cache.load("https://example.com/service-catalog")
+    assert entry is not None
+    cache.save(replace(entry, fetched_at=entry.fetched_at - 7200))
+
+    too_old, session = _cached_client(tmp_path, max_stale_seconds=3600)
+    session.get.return_value = failing
+    with pytest.raises(ServiceCatalogLoadError):
+        too_old.fetch_catalog()
+
+def test_fetch_catalog_loads_known_body_from_snapshot(tmp_path) -> None:
+    config = ServiceCatalogConfig(url="https://example.com/service-catalog", timeout_seconds=5.0)
+    snapshots = ServiceCatalogSnapshots(tmp_path / "snapshots")
+
+    cold = ServiceCatalogClient(config, snapshots=snapshots)
+    cold._session = Mock(get=Mock(return_value=Mock(status_code=200, text=_CACHED_YAML)))                                  # type: ignore[attr-defined]
+    expected = cold.fetch_catalog()
+
+    warm = ServiceCatalogClient(config, snapshots=ServiceCatalogSnapshots(tmp_path / "snapshots"))
+    warm._session = Mock(get=Mock(return_value=Mock(status_code=200, text=_CACHED_YAML)))                                  # type: ignore[attr-defined]
+    warm._parse_yaml = Mock(side_effect=AssertionError("parsed a known body"))                                              # type: ignore[method-assign]
+
+    assert warm.fetch_catalog() == expected
+    assert snapshots.load(content_hash(_CACHED_YAML + "\n# changed")) is None
+
+def test_snapshot_from_another_format_version_is_ignored(tmp_path) -> None:
+    snapshots = ServiceCatalogSnapshots(tmp_path)
+    key = content_hash(_CACHED_YAML)
+    (tmp_path / f"{key}.snapshot").write_bytes(b"SCSNAP0:py00\n" + b"\x00" * 8)
+
+    assert snapshots.load(key) is None